@@ -0,0 +1,80 @@
+import multiprocessing
+import os
+from typing import Iterable, Optional
+
+from maze import maze_solver
+
+# x, y, heading and goal of a maze run solved by the batch solver
+BatchJob = tuple[int, int, int, str]
+
+# grid and engine of the running batch, set before the worker processes are
+# forked so that every worker reads the same passability data copy-on-write
+batch_grid: Optional[maze_solver.MazeGrid] = None
+batch_engine = 'distance_field'
+
+
+def solve_job(job: BatchJob) -> list[str]:
+    """
+    Solves one maze run on the grid of the running batch
+    :param BatchJob job: x, y, heading and goal of the maze run
+    :return: List of robot commands
+    """
+    x, y, heading, goal = job
+    waypoints = maze_solver.solve_waypoints(batch_grid, (x, y), heading,
+                                            goal, batch_engine)
+    return list(maze_solver.waypoints_to_robot_commands(waypoints, heading))
+
+
+def prepare_grid(grid: maze_solver.MazeGrid, engine: str,
+                 goals: Iterable[str]) -> None:
+    """
+    Builds the data an engine keeps on the grid before the workers are
+    forked, so they share it instead of each building their own copy
+    :param MazeGrid grid: Passability grid of the maze
+    :param str engine: Name of the search engine
+    :param Iterable[str] goals: Goals of the jobs
+    :return: None
+    """
+    if engine == 'distance_field':
+        for goal in set(goals) & set(maze_solver.goal_checks):
+            maze_solver.get_distance_field(grid, goal)
+    elif engine == 'corridor' and grid.corridor_graph is None:
+        grid.corridor_graph = maze_solver.CorridorGraph(grid)
+    elif engine == 'hierarchical' and grid.cluster_graph is None:
+        grid.cluster_graph = maze_solver.ClusterGraph(grid)
+    elif engine in ('fewest_commands', 'bidirectional'):
+        maze_solver.get_neighbour_cells(grid)
+
+
+def solve_batch(jobs: list[BatchJob], llx: int, lly: int, urx: int, ury: int,
+                engine: str = 'distance_field',
+                processes: Optional[int] = None) -> list[list[str]]:
+    """
+    Solves many maze runs in the same maze across worker processes. The
+    passability grid is built once and inherited by the forked workers, on
+    platforms without fork the jobs are solved in this process
+    :param list[BatchJob] jobs: x, y, heading and goal of every maze run
+    :param int llx: Lower left x coordinate
+    :param int lly: Lower left y coordinate
+    :param int urx: Upper right x coordinate
+    :param int ury: Upper right y coordinate
+    :param str engine: Name of the search engine that solves the maze
+    :param Optional[int] processes: Amount of worker processes, defaults to
+    the amount of cores
+    :return: List of robot commands per job, in the order of the jobs
+    """
+    global batch_grid, batch_engine
+    if engine not in maze_solver.search_engines:
+        raise ValueError(f'There is no engine called {engine}')
+    batch_grid = maze_solver.set_maze_bounds(llx, lly, urx, ury)
+    batch_engine = engine
+    prepare_grid(batch_grid, engine, (goal for _, _, _, goal in jobs))
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = min(processes, len(jobs))
+    if processes <= 1 \
+            or 'fork' not in multiprocessing.get_all_start_methods():
+        return [solve_job(job) for job in jobs]
+    with multiprocessing.get_context('fork').Pool(processes) as pool:
+        return pool.map(solve_job, jobs,
+                        chunksize=max(1, len(jobs) // (processes * 4)))
@@ -0,0 +1,123 @@
+import argparse
+import time
+from typing import Iterator
+
+from maze import maze_generator, maze_loader, maze_solver, obstacles
+
+# bounds of the world the mazes are solved in
+MAZE_BOUNDS = (-100, -200, 100, 200)
+MAZE_NAMES = ['simple_maze', 'easy_maze', 'medium_maze', 'extreme_maze']
+
+BenchmarkResult = tuple[str, str, str, float, float, int, int]
+
+
+def time_engine(engine: str, goal: str, repeat: int,
+                bounds: tuple[int, int, int, int] = MAZE_BOUNDS) \
+        -> tuple[float, float, int, int]:
+    """
+    Solves the loaded maze from the origin and times the first and the
+    fastest solve, which differ for engines that build data once per maze
+    :param str engine: Name of the search engine
+    :param str goal: Maze edge to arrive at
+    :param int repeat: Amount of solves to time
+    :param tuple[int, int, int, int] bounds: Bounds of the maze
+    :return: First and fastest solve in seconds, the length of the path and
+    the amount of nodes the engine expanded
+    """
+    grid = maze_solver.set_maze_bounds(*bounds)
+    search = maze_solver.search_engines[engine]
+    times = []
+    path = None
+    stats: maze_solver.SearchStats = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        path = search(grid, (0, 0), goal, stats)
+        times.append(time.perf_counter() - start)
+    return times[0], min(times), len(path) if path else 0, \
+        stats.get('expanded', 0)
+
+
+def run_benchmark(names: list[str], engines: list[str], repeat: int) \
+        -> Iterator[BenchmarkResult]:
+    """
+    Times every engine on every goal of every maze
+    :param list[str] names: Names of the mazes
+    :param list[str] engines: Names of the search engines
+    :param int repeat: Amount of solves to time per engine and goal
+    :return: Iterator of maze name, goal, engine, first and fastest solve in
+    seconds, path length and expanded nodes
+    """
+    obstacles.use_occupancy_raster(MAZE_BOUNDS)
+    for name in names:
+        maze_loader.load_maze(name)
+        for goal in maze_solver.goal_checks:
+            for engine in engines:
+                yield name, goal, engine, *time_engine(engine, goal, repeat)
+
+
+def run_generated_benchmark(columns: int, rows: int, seed: int,
+                            density: float, engines: list[str],
+                            repeat: int) -> Iterator[BenchmarkResult]:
+    """
+    Times every engine on every goal of a generated maze, which can be far
+    larger than the world of the bundled mazes
+    :param int columns: Amount of rooms on the x axis
+    :param int rows: Amount of rooms on the y axis
+    :param int seed: Seed of the maze generator
+    :param float density: Fraction of the inner walls left standing
+    :param list[str] engines: Names of the search engines
+    :param int repeat: Amount of solves to time per engine and goal
+    :return: Iterator of maze name, goal, engine, first and fastest solve in
+    seconds, path length and expanded nodes
+    """
+    bounds = maze_generator.load_generated_maze(columns, rows, seed, density)
+    name = f'{columns}x{rows}'
+    for goal in maze_solver.goal_checks:
+        for engine in engines:
+            yield name, goal, engine, *time_engine(engine, goal, repeat,
+                                                   bounds)
+
+
+def main() -> None:
+    """
+    Prints the benchmark of the search engines on the mazes
+    :return: None
+    """
+    parser = argparse.ArgumentParser(
+        description='Times the maze solver engines on every maze and goal')
+    engines = ', '.join(sorted(maze_solver.search_engines))
+    parser.add_argument('engines', nargs='*',
+                        default=['astar', 'bucket_astar'],
+                        help=f'engines to time, one of {engines}')
+    parser.add_argument('--maze', action='append', dest='mazes',
+                        help='maze to solve, all bundled mazes by default')
+    parser.add_argument('--generated', nargs=2, type=int,
+                        metavar=('COLUMNS', 'ROWS'),
+                        help='solve a generated maze with this many rooms '
+                             'instead of the bundled mazes')
+    parser.add_argument('--seed', type=int, default=1,
+                        help='seed of the generated maze')
+    parser.add_argument('--density', type=float, default=1.0,
+                        help='fraction of inner walls left standing in the '
+                             'generated maze')
+    parser.add_argument('--repeat', type=int, default=3)
+    arguments = parser.parse_args()
+    for engine in arguments.engines:
+        if engine not in maze_solver.search_engines:
+            parser.error(f'There is no engine called {engine}')
+    if arguments.generated:
+        results = run_generated_benchmark(
+            *arguments.generated, arguments.seed, arguments.density,
+            arguments.engines, arguments.repeat)
+    else:
+        results = run_benchmark(arguments.mazes or MAZE_NAMES,
+                                arguments.engines, arguments.repeat)
+    print(f'{"maze":<14}{"goal":<8}{"engine":<18}{"first ms":>10}'
+          f'{"ms":>10}{"length":>8}{"expanded":>10}')
+    for name, goal, engine, first, fastest, length, expanded in results:
+        print(f'{name:<14}{goal:<8}{engine:<18}{first * 1000:>10.2f}'
+              f'{fastest * 1000:>10.2f}{length:>8}{expanded:>10}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+import mmap
+import os
+import struct
+import sys
+from typing import Optional
+
+from maze.maze_cache import load_maze_positions
+from maze.raster import OccupancyRaster
+
+# header of a compiled maze: magic bytes, format version and the bounds of the
+# raster, followed by the packed rows of the raster
+MAGIC = b'RBMZ'
+VERSION = 1
+HEADER = struct.Struct('<4sH2x4i')
+EXTENSION = '.bin'
+# bounds of the world the robot moves in, a compiled maze covers at least
+# these so the occupancy index can use the memory-mapped raster as it is
+WORLD_BOUNDS = (-100, -200, 100, 200)
+
+
+def get_compiled_path(text_path: str) -> str:
+    """
+    Returns the path of the compiled maze that belongs to a text maze
+    :param str text_path: Path of the text maze
+    :return: Path of the compiled maze
+    """
+    return os.path.splitext(text_path)[0] + EXTENSION
+
+
+def compile_maze(text_path: str, compiled_path: Optional[str] = None,
+                 bounds: tuple[int, int, int, int] = WORLD_BOUNDS) -> str:
+    """
+    Converts a text maze into a compiled maze holding a packed bit grid
+    :param str text_path: Path of the text maze
+    :param Optional[str] compiled_path: Path to write the compiled maze to,
+    defaults to the text maze path with the compiled extension
+    :param tuple[int, int, int, int] bounds: Lower left x, lower left y,
+    upper right x and upper right y coordinates the grid covers, widened to
+    fit any position outside them
+    :return: Path of the compiled maze
+    """
+    if compiled_path is None:
+        compiled_path = get_compiled_path(text_path)
+    positions = load_maze_positions(text_path, use_cache=False)
+    llx, lly, urx, ury = bounds
+    for x, y in positions:
+        llx, urx = min(llx, x), max(urx, x)
+        lly, ury = min(lly, y), max(ury, y)
+    write_compiled_maze(
+        OccupancyRaster.from_positions(positions, llx, lly, urx, ury),
+        compiled_path)
+    return compiled_path
+
+
+def write_compiled_maze(raster: OccupancyRaster, compiled_path: str) -> None:
+    """
+    Writes a raster as a compiled maze
+    :param OccupancyRaster raster: Raster of the maze
+    :param str compiled_path: Path to write the compiled maze to
+    :return: None
+    """
+    with open(compiled_path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, raster.llx, raster.lly,
+                               raster.urx, raster.ury))
+        file.write(raster.bits[:raster.row_bytes * raster.height])
+
+
+def load_compiled_maze(compiled_path: str) -> OccupancyRaster:
+    """
+    Memory-maps a compiled maze and wraps it in a read-only raster without
+    copying the grid
+    :param str compiled_path: Path of the compiled maze
+    :return: OccupancyRaster object
+    """
+    with open(compiled_path, 'rb') as file:
+        mapped_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mapped_file) < HEADER.size:
+        raise ValueError(f'{compiled_path} is not a compiled maze')
+    magic, version, llx, lly, urx, ury = HEADER.unpack_from(mapped_file)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f'{compiled_path} is not a compiled maze')
+    return OccupancyRaster(llx, lly, urx, ury,
+                           memoryview(mapped_file)[HEADER.size:])
+
+
+def load_up_to_date_maze(text_path: str) -> Optional[OccupancyRaster]:
+    """
+    Loads the compiled version of a text maze if it exists and is at least as
+    new as the text maze
+    :param str text_path: Path of the text maze
+    :return: OccupancyRaster object, or None if there is no usable compiled
+    maze
+    """
+    compiled_path = get_compiled_path(text_path)
+    try:
+        if os.path.getmtime(compiled_path) < os.path.getmtime(text_path):
+            return None
+        return load_compiled_maze(compiled_path)
+    except (OSError, ValueError):
+        return None
+
+
+def compile_all_mazes(names: list[str]) -> None:
+    """
+    Compiles the text mazes in the maze directory, or only the named ones
+    :param list[str] names: Maze names such as easy_maze, empty for every
+    maze the maze loader finds with a text maze
+    :return: None
+    """
+    # imported here, since the maze loader imports this module
+    from maze import maze_loader
+    path = maze_loader.MAZE_DIRECTORY
+    if not names:
+        names = maze_loader.discover_text_mazes()
+    for name in names:
+        print(f'Compiled {compile_maze(os.path.join(path, f"{name}.txt"))}')
+
+
+if __name__ == '__main__':
+    compile_all_mazes(sys.argv[1:])
@@ -0,0 +1,104 @@
+import hashlib
+import marshal
+import os
+from typing import Optional
+
+# parsed mazes are cached next to the maze modules, the cache can be turned
+# off by setting ROBOT_MAZE_CACHE=0
+CACHE_DIRECTORY = os.path.join(os.path.dirname(__file__), '__mazecache__')
+CACHE_VERSION = 1
+cache_enabled = os.environ.get('ROBOT_MAZE_CACHE', '1') != '0'
+
+
+def get_cache_path(text_path: str) -> str:
+    """
+    Returns the path of the cache entry that belongs to a text maze
+    :param str text_path: Path of the text maze
+    :return: Path of the cache entry
+    """
+    name = os.path.splitext(os.path.basename(text_path))[0]
+    location = hashlib.sha1(os.path.abspath(text_path).encode()).hexdigest()
+    return os.path.join(CACHE_DIRECTORY, f'{name}-{location[:12]}.marshal')
+
+
+def parse_positions(data: bytes) -> tuple[tuple[int, int], ...]:
+    """
+    Parses the x,y lines of a text maze with the parser of the maze loader
+    :param bytes data: Contents of the text maze
+    :return: Tuple of x and y coordinates
+    """
+    # imported here, since the maze loader imports this module
+    from maze import maze_loader
+    return tuple(maze_loader.parse_positions(data.decode().splitlines()))
+
+
+def read_cache(cache_path: str) -> Optional[tuple]:
+    """
+    Reads a cache entry
+    :param str cache_path: Path of the cache entry
+    :return: Tuple of the file size, modification time, content hash and
+    positions of the cached maze, or None if there is no valid entry
+    """
+    try:
+        with open(cache_path, 'rb') as file:
+            entry = marshal.loads(file.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(entry, tuple) or len(entry) != 5 \
+            or entry[0] != CACHE_VERSION:
+        return None
+    return entry[1:]
+
+
+def write_cache(cache_path: str, size: int, modified: int, digest: str,
+                positions: tuple[tuple[int, int], ...]) -> None:
+    """
+    Writes a cache entry, leaving the cache untouched if it cannot be written
+    :param str cache_path: Path of the cache entry
+    :param int size: Size of the text maze in bytes
+    :param int modified: Modification time of the text maze in nanoseconds
+    :param str digest: Content hash of the text maze
+    :param tuple[tuple[int, int], ...] positions: Parsed positions
+    :return: None
+    """
+    temporary_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+        with open(temporary_path, 'wb') as file:
+            file.write(marshal.dumps(
+                (CACHE_VERSION, size, modified, digest, positions)))
+        os.replace(temporary_path, cache_path)
+    except OSError:
+        pass
+
+
+def load_maze_positions(text_path: str, use_cache: Optional[bool] = None) \
+        -> tuple[tuple[int, int], ...]:
+    """
+    Returns the positions of a text maze, from the cache when the text maze
+    has the same size and modification time or the same content hash as when
+    it was cached
+    :param str text_path: Path of the text maze
+    :param Optional[bool] use_cache: Whether to use the cache, defaults to
+    the ROBOT_MAZE_CACHE setting
+    :return: Tuple of x and y coordinates
+    """
+    if use_cache is None:
+        use_cache = cache_enabled
+    if not use_cache:
+        with open(text_path, 'rb') as file:
+            return parse_positions(file.read())
+    stat = os.stat(text_path)
+    cache_path = get_cache_path(text_path)
+    entry = read_cache(cache_path)
+    if entry is not None and entry[:2] == (stat.st_size, stat.st_mtime_ns):
+        return entry[3]
+    with open(text_path, 'rb') as file:
+        data = file.read()
+    digest = hashlib.sha256(data).hexdigest()
+    if entry is not None and entry[2] == digest:
+        positions = entry[3]
+    else:
+        positions = parse_positions(data)
+    write_cache(cache_path, stat.st_size, stat.st_mtime_ns, digest, positions)
+    return positions
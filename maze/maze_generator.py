@@ -0,0 +1,174 @@
+import argparse
+import os
+import random
+from array import array
+from typing import Optional
+
+from maze import compiled_maze, obstacles, run_length_maze
+from maze.raster import OccupancyRaster
+
+
+def get_maze_bounds(columns: int, rows: int) -> tuple[int, int, int, int]:
+    """
+    Returns the bounds of a maze with the given amount of rooms, placed so
+    that the origin is a room
+    :param int columns: Amount of rooms on the x axis
+    :param int rows: Amount of rooms on the y axis
+    :return: Lower left x, lower left y, upper right x and upper right y
+    coordinates
+    """
+    llx = -(2 * (columns // 2) + 1)
+    lly = -(2 * (rows // 2) + 1)
+    return llx, lly, llx + 2 * columns, lly + 2 * rows
+
+
+def generate_maze_raster(columns: int, rows: int, seed: Optional[int] = None,
+                         density: float = 1.0) -> OccupancyRaster:
+    """
+    Generates a maze with a recursive backtracker. Rooms sit on the odd cells
+    of the grid and the cells around them are walls, so the grid is twice the
+    amount of rooms plus one cell wide and high
+    :param int columns: Amount of rooms on the x axis
+    :param int rows: Amount of rooms on the y axis
+    :param Optional[int] seed: Seed for the random generator
+    :param float density: Fraction of the inner walls left standing once the
+    maze is carved, 1.0 gives a maze with exactly one path between two rooms
+    :return: OccupancyRaster object of the maze walls
+    """
+    if columns < 1 or rows < 1:
+        raise ValueError('A maze needs at least one room')
+    random_generator = random.Random(seed)
+    llx, lly, urx, ury = get_maze_bounds(columns, rows)
+    raster = OccupancyRaster(llx, lly, urx, ury)
+    bits = raster.bits
+    row_bytes = raster.row_bytes
+    bits[:] = b'\xff' * len(bits)
+    padding = raster.width & 7
+    if padding:
+        for row in range(raster.height):
+            bits[row * row_bytes + row_bytes - 1] = (1 << padding) - 1
+
+    def clear(grid_x: int, grid_y: int) -> None:
+        bits[grid_y * row_bytes + (grid_x >> 3)] &= ~(1 << (grid_x & 7)) & 0xFF
+
+    visited = bytearray(columns * rows)
+    start = (-lly // 2) * columns + (-llx // 2)
+    visited[start] = 1
+    clear(2 * (start % columns) + 1, 2 * (start // columns) + 1)
+    stack = array('i', [start])
+    randrange = random_generator.randrange
+    while stack:
+        room = stack[-1]
+        room_x, room_y = room % columns, room // columns
+        neighbours = []
+        if room_x + 1 < columns and not visited[room + 1]:
+            neighbours.append(room + 1)
+        if room_x > 0 and not visited[room - 1]:
+            neighbours.append(room - 1)
+        if room_y + 1 < rows and not visited[room + columns]:
+            neighbours.append(room + columns)
+        if room_y > 0 and not visited[room - columns]:
+            neighbours.append(room - columns)
+        if not neighbours:
+            stack.pop()
+            continue
+        neighbour = neighbours[randrange(len(neighbours))]
+        visited[neighbour] = 1
+        neighbour_x, neighbour_y = neighbour % columns, neighbour // columns
+        clear(room_x + neighbour_x + 1, room_y + neighbour_y + 1)
+        clear(2 * neighbour_x + 1, 2 * neighbour_y + 1)
+        stack.append(neighbour)
+
+    if density < 1.0:
+        remove_walls(raster, 1.0 - density, random_generator)
+    return raster
+
+
+def remove_walls(raster: OccupancyRaster, fraction: float,
+                 random_generator: random.Random) -> None:
+    """
+    Removes a fraction of the standing inner walls between two rooms, which
+    opens up loops in the maze
+    :param OccupancyRaster raster: Raster of the maze
+    :param float fraction: Chance of removing each wall
+    :param random.Random random_generator: Random generator
+    :return: None
+    """
+    bits = raster.bits
+    row_bytes = raster.row_bytes
+    chance = random_generator.random
+    for grid_y in range(1, raster.height - 1):
+        offset = grid_y * row_bytes
+        first = 2 if grid_y % 2 else 1
+        for grid_x in range(first, raster.width - 1, 2):
+            index = offset + (grid_x >> 3)
+            bit = 1 << (grid_x & 7)
+            if bits[index] & bit and chance() < fraction:
+                bits[index] &= ~bit & 0xFF
+
+
+def load_generated_maze(columns: int, rows: int, seed: Optional[int] = None,
+                        density: float = 1.0) -> tuple[int, int, int, int]:
+    """
+    Replaces the obstacles with a generated maze
+    :param int columns: Amount of rooms on the x axis
+    :param int rows: Amount of rooms on the y axis
+    :param Optional[int] seed: Seed for the random generator
+    :param float density: Fraction of the inner walls left standing
+    :return: Lower left x, lower left y, upper right x and upper right y
+    coordinates of the maze
+    """
+    raster = generate_maze_raster(columns, rows, seed, density)
+    obstacles.obstacles = [raster]
+    obstacles.update_obstacle_index()
+    return raster.llx, raster.lly, raster.urx, raster.ury
+
+
+def write_text_maze(raster: OccupancyRaster, text_path: str) -> None:
+    """
+    Writes a raster as a text maze with one x,y position per line
+    :param OccupancyRaster raster: Raster of the maze
+    :param str text_path: Path to write the text maze to
+    :return: None
+    """
+    with open(text_path, 'w') as file:
+        for x, y in raster:
+            file.write(f'{x},{y}\n')
+
+
+# writers for every maze format, by file extension
+maze_writers = {
+    '.txt': write_text_maze,
+    run_length_maze.EXTENSION: run_length_maze.write_raster_runs,
+    compiled_maze.EXTENSION: compiled_maze.write_compiled_maze,
+}
+
+
+def main() -> None:
+    """
+    Writes a generated maze into the maze directory, where the maze loader
+    finds it by its name
+    :return: None
+    """
+    parser = argparse.ArgumentParser(
+        description='Generates a maze with a recursive backtracker')
+    parser.add_argument('name', help='maze name, such as huge_maze')
+    parser.add_argument('columns', type=int, help='rooms on the x axis')
+    parser.add_argument('rows', type=int, help='rooms on the y axis')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--density', type=float, default=1.0,
+                        help='fraction of inner walls left standing')
+    parser.add_argument('--format', choices=sorted(maze_writers),
+                        default=compiled_maze.EXTENSION)
+    arguments = parser.parse_args()
+    raster = generate_maze_raster(arguments.columns, arguments.rows,
+                                  arguments.seed, arguments.density)
+    path = os.path.join(os.path.dirname(__file__),
+                        f'{arguments.name}{arguments.format}')
+    maze_writers[arguments.format](raster, path)
+    print(f'Generated {path} with bounds {raster.llx},{raster.lly} to '
+          f'{raster.urx},{raster.ury}')
+
+
+if __name__ == '__main__':
+    main()
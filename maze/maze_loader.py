@@ -0,0 +1,159 @@
+import os
+from typing import Callable, Iterable, Iterator, Optional
+
+from maze import compiled_maze, maze_cache, obstacles, run_length_maze
+from maze.raster import OccupancyRaster
+from maze.wall_runs import WallRuns, expand_runs
+
+MAZE_DIRECTORY = os.path.dirname(__file__)
+# file extensions that hold mazes, in the order they are preferred
+MAZE_EXTENSIONS = (compiled_maze.EXTENSION, run_length_maze.EXTENSION, '.txt')
+
+# an obstacle store consumes a stream of positions and returns the obstacle
+# that is added to the obstacles list
+ObstacleStore = Callable[[Iterator[tuple[int, int]]], obstacles.Obstacle]
+
+
+def discover_mazes(directory: Optional[str] = None,
+                   extensions: tuple[str, ...] = MAZE_EXTENSIONS) \
+        -> dict[str, str]:
+    """
+    Finds the mazes in the maze directory by their file names
+    :param Optional[str] directory: Directory to search, defaults to the maze
+    directory
+    :param tuple[str, ...] extensions: File extensions to load mazes from, in
+    the order they are preferred
+    :return: Dictionary of maze names, such as easy_maze, and the path of the
+    preferred file to load each maze from
+    """
+    if directory is None:
+        directory = MAZE_DIRECTORY
+    file_names = set(os.listdir(directory))
+    mazes = {}
+    for file_name in sorted(file_names):
+        name = os.path.splitext(file_name)[0]
+        if name in mazes:
+            continue
+        text_path = os.path.join(directory, f'{name}.txt')
+        for extension in extensions:
+            path = os.path.join(directory, f'{name}{extension}')
+            if f'{name}{extension}' in file_names \
+                    and is_up_to_date(path, text_path):
+                mazes[name] = path
+                break
+    return mazes
+
+
+def discover_text_mazes(directory: Optional[str] = None) -> list[str]:
+    """
+    Finds the mazes in the maze directory that have a text maze, which the
+    maze compiler and the run-length exporter convert
+    :param Optional[str] directory: Directory to search, defaults to the maze
+    directory
+    :return: List of maze names, such as easy_maze
+    """
+    if directory is None:
+        directory = MAZE_DIRECTORY
+    return [name for name in discover_mazes(directory)
+            if os.path.exists(os.path.join(directory, f'{name}.txt'))]
+
+
+def is_up_to_date(path: str, text_path: str) -> bool:
+    """
+    Checks if a converted maze is at least as new as the text maze it was
+    converted from, if that text maze exists
+    :param str path: Path of the maze
+    :param str text_path: Path of the text maze
+    :return: Boolean value
+    """
+    if path == text_path or not os.path.exists(text_path):
+        return True
+    return os.path.getmtime(path) >= os.path.getmtime(text_path)
+
+
+def parse_positions(lines: Iterable[str]) -> Iterator[tuple[int, int]]:
+    """
+    Yields the positions of the x,y lines of a text maze, skipping blank
+    lines
+    :param Iterable[str] lines: Lines of the text maze
+    :return: Iterator of x and y coordinates
+    """
+    for line in lines:
+        if line.strip():
+            x, y = map(int, line.split(','))
+            yield x, y
+
+
+def stream_positions(text_path: str) -> Iterator[tuple[int, int]]:
+    """
+    Yields the x,y positions of a text maze one line at a time
+    :param str text_path: Path of the text maze
+    :return: Iterator of x and y coordinates
+    """
+    with open(text_path, 'r') as file:
+        yield from parse_positions(file)
+
+
+def raster_store(llx: int, lly: int, urx: int, ury: int) -> ObstacleStore:
+    """
+    Returns an obstacle store that packs streamed positions straight into an
+    occupancy raster with the given bounds
+    :param int llx: Lower left x coordinate
+    :param int lly: Lower left y coordinate
+    :param int urx: Upper right x coordinate
+    :param int ury: Upper right y coordinate
+    :return: Obstacle store
+    """
+    def store(positions: Iterator[tuple[int, int]]) -> OccupancyRaster:
+        return OccupancyRaster.from_positions(positions, llx, lly, urx, ury)
+    return store
+
+
+def load_maze(name: str, store: Optional[ObstacleStore] = None) -> None:
+    """
+    Replaces the obstacles with the named maze. A compiled maze is
+    memory-mapped and a run-length maze is indexed by its wall runs or
+    streamed into the store, while the positions of a text maze are read
+    through the maze cache and packed into the store when one is given
+    :param str name: Name of the maze, such as easy_maze
+    :param Optional[ObstacleStore] store: Obstacle store for the positions
+    :return: None
+    """
+    mazes = discover_mazes()
+    if name not in mazes:
+        raise ValueError(f'There is no maze called {name}')
+    path = mazes[name]
+    try:
+        obstacle = read_maze(path, store)
+    except ValueError:
+        # an empty or damaged compiled maze is rejected by mmap or by its
+        # header, the maze is then read from the next format
+        if not path.endswith(compiled_maze.EXTENSION):
+            raise
+        fallback = discover_mazes(extensions=MAZE_EXTENSIONS[1:])
+        if name not in fallback:
+            raise
+        obstacle = read_maze(fallback[name], store)
+    obstacles.obstacles = [obstacle]
+    obstacles.update_obstacle_index()
+
+
+def read_maze(path: str, store: Optional[ObstacleStore] = None) \
+        -> obstacles.Obstacle:
+    """
+    Reads a maze file into an obstacle in the way its format is loaded
+    :param str path: Path of the maze
+    :param Optional[ObstacleStore] store: Obstacle store for the positions
+    :return: Obstacle that holds the maze
+    """
+    extension = os.path.splitext(path)[1]
+    if extension == compiled_maze.EXTENSION:
+        return compiled_maze.load_compiled_maze(path)
+    if extension == run_length_maze.EXTENSION and store is not None:
+        return store(expand_runs(run_length_maze.stream_runs(path)))
+    if extension == run_length_maze.EXTENSION:
+        return WallRuns(run_length_maze.stream_runs(path))
+    positions = maze_cache.load_maze_positions(path)
+    if store is not None:
+        return store(iter(positions))
+    return positions
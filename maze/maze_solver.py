@@ -1,26 +1,185 @@
 from __future__ import annotations
-from typing import TypeVar, Callable, Optional
+from array import array
+from collections import OrderedDict
+from typing import TypeVar, Callable, Iterator, Optional
 from maze import obstacles
 from heapq import heappush, heappop
+from bisect import bisect_left
 
 T = TypeVar('T')
+# counters reported by the search engines, such as the amount of expanded
+# nodes
+SearchStats = dict[str, int]
 
 top_edge: int
 bottom_edge: int
 right_edge: int
 left_edge: int
-obstacle_coordinates = []
+# direction index the robot faces at the start of the maze run
+run_direction = 0
 
+# least recently used cache of the waypoints and robot commands of maze runs,
+# keyed by obstacle index version, maze bounds, start, direction, goal and
+# engine, and emptied whenever the obstacles change
+SolutionKey = tuple[int, int, int, int, int, int, int, int, str, str]
+solution_cache: OrderedDict[
+    SolutionKey, tuple[list[tuple[int, int]], list[str]]] = OrderedDict()
+solution_cache_size = 256
+solution_cache_version = 0
+cache_hits = 0
+cache_misses = 0
 
-def get_obstacle_coordinates() -> None:
+
+class MazeGrid:
     """
-    Unpacks every obstacle coordinate into a list
-    :return: None
+    Passability of every cell within the bounds of a maze, stored in a flat
+    bytearray where each cell is addressed by an integer cell id
+    """
+    llx: int
+    lly: int
+    urx: int
+    ury: int
+    width: int
+    height: int
+    passable: bytearray
+    distance_fields: dict[str, array]
+    neighbour_cells: Optional[array]
+    cluster_graph: Optional[ClusterGraph]
+    corridor_graph: Optional[CorridorGraph]
+
+    def __init__(self, llx: int, lly: int, urx: int, ury: int) -> None:
+        """
+        Constructor for MazeGrid, every cell starts out passable
+        :param int llx: Lower left x coordinate
+        :param int lly: Lower left y coordinate
+        :param int urx: Upper right x coordinate
+        :param int ury: Upper right y coordinate
+        """
+        self.llx = llx
+        self.lly = lly
+        self.urx = urx
+        self.ury = ury
+        self.width = urx - llx + 1
+        self.height = ury - lly + 1
+        self.passable = bytearray(b'\x01') * (self.width * self.height)
+        self.distance_fields = {}
+        self.neighbour_cells = None
+        self.cluster_graph = None
+        self.corridor_graph = None
+
+    @classmethod
+    def from_obstacles(cls, llx: int, lly: int, urx: int, ury: int) \
+            -> MazeGrid:
+        """
+        Creates a grid with every obstacle position within the bounds blocked
+        :param int llx: Lower left x coordinate
+        :param int lly: Lower left y coordinate
+        :param int urx: Upper right x coordinate
+        :param int ury: Upper right y coordinate
+        :return: MazeGrid object
+        """
+        grid = cls(llx, lly, urx, ury)
+        obstacles.check_obstacle_index()
+        if obstacles.raster is not None:
+            grid.block_raster(obstacles.raster)
+            return grid
+        for obstacle in obstacles.obstacles:
+            if isinstance(obstacle, obstacles.OccupancyRaster):
+                grid.block_raster(obstacle)
+            elif isinstance(obstacle, obstacles.WallRuns):
+                for y, starts in obstacle.row_starts.items():
+                    for start, end in zip(starts, obstacle.row_ends[y]):
+                        grid.block_row(y, start, end)
+                for x, starts in obstacle.column_starts.items():
+                    for start, end in zip(starts, obstacle.column_ends[x]):
+                        for y in range(start, end + 1):
+                            grid.block_row(y, x, x)
+            else:
+                for x, y in obstacle:
+                    grid.block_row(y, x, x)
+        return grid
+
+    def block_raster(self, raster: obstacles.OccupancyRaster) -> None:
+        """
+        Blocks every blocked cell of a raster
+        :param OccupancyRaster raster: Raster to copy the blocked cells from
+        :return: None
+        """
+        for row in range(max(self.lly, raster.lly) - raster.lly,
+                         min(self.ury, raster.ury) - raster.lly + 1):
+            for start, end in raster.get_row_runs(row):
+                self.block_row(raster.lly + row, raster.llx + start,
+                               raster.llx + end)
+
+    def block_row(self, y: int, x1: int, x2: int) -> None:
+        """
+        Blocks the cells of row y from x1 to x2, clipped to the bounds
+        :param int y: y coordinate of the row
+        :param int x1: Lowest x coordinate
+        :param int x2: Highest x coordinate
+        :return: None
+        """
+        if not self.lly <= y <= self.ury:
+            return
+        x1 = max(x1, self.llx)
+        x2 = min(x2, self.urx)
+        if x1 > x2:
+            return
+        offset = (y - self.lly) * self.width - self.llx
+        self.passable[offset + x1:offset + x2 + 1] = bytes(x2 - x1 + 1)
+
+    def cell_id(self, x: int, y: int) -> int:
+        """
+        Returns the cell id of a position within the bounds
+        :param int x: x coordinate
+        :param int y: y coordinate
+        :return: Cell id
+        """
+        return (y - self.lly) * self.width + (x - self.llx)
+
+    def position(self, cell_id: int) -> tuple[int, int]:
+        """
+        Returns the position of a cell id
+        :param int cell_id: Cell id
+        :return: x and y coordinate
+        """
+        return self.llx + cell_id % self.width, \
+            self.lly + cell_id // self.width
+
+    def is_passable(self, x: int, y: int) -> bool:
+        """
+        Checks if the position lies within the bounds and is not blocked
+        :param int x: x coordinate
+        :param int y: y coordinate
+        :return: Boolean value
+        """
+        return self.llx <= x <= self.urx and self.lly <= y <= self.ury \
+            and self.passable[(y - self.lly) * self.width + (x - self.llx)] \
+            == 1
+
+
+# passability grid of the current maze and the obstacle index version and
+# bounds it was built for
+maze_grid: Optional[MazeGrid] = None
+maze_grid_key: Optional[tuple[int, int, int, int, int]] = None
+
+
+def get_maze_grid(llx: int, lly: int, urx: int, ury: int) -> MazeGrid:
     """
-    global obstacle_coordinates
-    for obstacle in obstacles.obstacles:
-        for position in obstacle:
-            obstacle_coordinates.append(position)
+    Returns the passability grid of the current obstacles, building it only
+    when the obstacles or the bounds changed since it was last built
+    :param int llx: Lower left x coordinate
+    :param int lly: Lower left y coordinate
+    :param int urx: Upper right x coordinate
+    :param int ury: Upper right y coordinate
+    :return: MazeGrid object
+    """
+    global maze_grid, maze_grid_key
+    key = (obstacles.get_index_version(), llx, lly, urx, ury)
+    if maze_grid is None or maze_grid_key != key:
+        maze_grid = MazeGrid.from_obstacles(llx, lly, urx, ury)
+        maze_grid_key = key
+    return maze_grid
 
 
 def get_adjacent_coordinates(coordinate: tuple[int, int]) \
@@ -31,20 +190,17 @@ def get_adjacent_coordinates(coordinate: tuple[int, int]) \
     :param tuple[int, int] coordinate: x and y coordinate
     :return: A list of adjacent non-obstructed coordinates
     """
-    global obstacle_coordinates, top_edge, bottom_edge, right_edge, left_edge
+    is_passable = maze_grid.is_passable
+    x, y = coordinate
     adjacent_coordinates = []
-    if (coordinate[0] + 1, coordinate[1]) not in obstacle_coordinates\
-            and (coordinate[0] + 1) <= right_edge:
-        adjacent_coordinates.append((coordinate[0] + 1, coordinate[1]))
-    if (coordinate[0] - 1, coordinate[1]) not in obstacle_coordinates\
-            and (coordinate[0] - 1) >= left_edge:
-        adjacent_coordinates.append((coordinate[0] - 1, coordinate[1]))
-    if (coordinate[0], coordinate[1] + 1) not in obstacle_coordinates\
-            and (coordinate[1] + 1) <= top_edge:
-        adjacent_coordinates.append((coordinate[0], coordinate[1] + 1))
-    if (coordinate[0], coordinate[1] - 1) not in obstacle_coordinates\
-            and (coordinate[1] - 1) >= bottom_edge:
-        adjacent_coordinates.append((coordinate[0], coordinate[1] - 1))
+    if is_passable(x + 1, y):
+        adjacent_coordinates.append((x + 1, y))
+    if is_passable(x - 1, y):
+        adjacent_coordinates.append((x - 1, y))
+    if is_passable(x, y + 1):
+        adjacent_coordinates.append((x, y + 1))
+    if is_passable(x, y - 1):
+        adjacent_coordinates.append((x, y - 1))
     return adjacent_coordinates
 
 
@@ -200,11 +356,59 @@ class PriorityQueue:
         return repr(self._container)
 
 
+class BucketQueue:
+    """
+    Bucket queue (Dial's algorithm) holding nodes in one bucket per
+    distance_from_start + distance_to_goal. Every step costs 1 and the
+    distance to the goal changes by at most 1 per step, so the buckets stay
+    few and both adding and popping a node take constant time
+    """
+    def __init__(self) -> None:
+        """Constructor for the BucketQueue"""
+        self._buckets: list[list[Node]] = []
+        self._lowest = 0
+        self._size = 0
+
+    @property
+    def empty(self) -> bool:
+        """
+        Checks if the queue is empty
+        :return: Boolean value
+        """
+        return not self._size
+
+    def append(self, node: Node) -> None:
+        """Adds the node to the bucket of its total distance"""
+        priority = node.distance_from_start + node.distance_to_goal
+        while len(self._buckets) <= priority:
+            self._buckets.append([])
+        self._buckets[priority].append(node)
+        self._lowest = min(self._lowest, priority)
+        self._size += 1
+
+    def pop(self) -> Node:
+        """Pops the node that was added last to the lowest bucket"""
+        while not self._buckets[self._lowest]:
+            self._lowest += 1
+        self._size -= 1
+        return self._buckets[self._lowest].pop()
+
+    def __repr__(self) -> str:
+        """
+        Representation of the BucketQueue Class
+        :return: String representation of the Class
+        """
+        return repr(self._buckets)
+
+
 def astar(start: tuple[int, int],
           check_completed: Callable[[tuple[int, int]], bool],
           adjacent_coordinates: Callable[[tuple[int, int]], list[tuple[int,
                                                                        int]]],
-          distance: Callable[[tuple[int, int]], int]
+          distance: Callable[[tuple[int, int]], int],
+          frontier_type: Callable[[], PriorityQueue | BucketQueue]
+          = PriorityQueue,
+          stats: Optional[SearchStats] = None
           ) -> Optional[list[tuple[int, int]]]:
     """
     Astar algorithm that solves a maze by checking adjacent coordinates and
@@ -217,15 +421,23 @@ def astar(start: tuple[int, int],
     the adjacent coordinates
     :param Callable[[T], int] distance: Function that returns the distance of
     the coordinate from the goal
+    :param Callable frontier_type: Class of the frontier, PriorityQueue or
+    BucketQueue
+    :param Optional[SearchStats] stats: Dictionary that receives the amount
+    of expanded nodes under 'expanded'
     :return:
     """
-    frontier = PriorityQueue()
+    if stats is None:
+        stats = {}
+    stats['expanded'] = 0
+    frontier = frontier_type()
     frontier.append(Node(start, None, 0, distance(start)))
     explored = {start: 0}
 
     while not frontier.empty:
         current_node = frontier.pop()
         current_position = current_node.position
+        stats['expanded'] += 1
 
         if check_completed(current_position):
             return node_to_path(current_node)
@@ -241,103 +453,1896 @@ def astar(start: tuple[int, int],
     return None
 
 
-def path_to_robot_commands(path: list[tuple[int, int]],
-                           robot_direction: int) -> list[str]:
+def get_goal_distances(grid: MazeGrid, goal: str) -> tuple[array, bool]:
     """
-    Converts a path of coordinates into commands that the robot can execute
-    :param list[tuple[int, int]] path: Path of coordinates
-    :param int robot_direction: Direction index of the robot
-    :return: List of robot commands
+    Returns the distance of every row or column of the grid from the goal
+    edge, which is both the heuristic of a cell and, once it is at most 1,
+    the check that the cell reached the goal
+    :param MazeGrid grid: Passability grid of the maze
+    :param str goal: Maze edge to arrive at
+    :return: Distance per row or column, and True if it is per row
     """
-    robot_commands: list[str] = []
-    for i in range(len(path) - 1):
-        current_position: tuple[int, int] = path[i]
-        next_position: tuple[int, int] = path[i + 1]
-        if current_position[0] == next_position[0]:
-            if current_position[1] > next_position[1]:
-                if robot_direction == 0:
-                    robot_commands.append('back 1')
-                elif robot_direction == 1:
-                    robot_commands.append('right')
-                    robot_commands.append('forward 1')
-                    robot_direction = 2
-                elif robot_direction == 3:
-                    robot_commands.append('left')
-                    robot_commands.append('forward 1')
-                    robot_direction = 2
-                else:
-                    robot_commands.append('forward 1')
+    if goal == 'top':
+        return array('i', range(grid.height - 1, -1, -1)), True
+    if goal == 'bottom':
+        return array('i', range(grid.height)), True
+    if goal == 'right':
+        return array('i', range(grid.width - 1, -1, -1)), False
+    return array('i', range(grid.width)), False
+
+
+def cell_path(grid: MazeGrid, parents: array, cell: int) \
+        -> list[tuple[int, int]]:
+    """
+    Converts a cell to a path of coordinates by following its parent links
+    :param MazeGrid grid: Passability grid of the maze
+    :param array parents: Parent cell id of every cell, -1 for the start
+    :param int cell: Cell id at the end of the path
+    :return: List of coordinates
+    """
+    path = [grid.position(cell)]
+    while parents[cell] >= 0:
+        cell = parents[cell]
+        path.append(grid.position(cell))
+    path.reverse()
+    return path
+
+
+def array_astar(grid: MazeGrid, start: tuple[int, int], goal: str,
+                stats: Optional[SearchStats] = None) \
+        -> Optional[list[tuple[int, int]]]:
+    """
+    Astar algorithm working on the integer cell ids of the grid. The g-scores
+    and parent links live in flat arrays and the frontier holds plain
+    (f, g, cell id) tuples, so no object is allocated per explored cell
+    :param MazeGrid grid: Passability grid of the maze
+    :param tuple[int, int] start: Starting x and y coordinate
+    :param str goal: Maze edge to arrive at
+    :param Optional[SearchStats] stats: Dictionary that receives the amount
+    of expanded nodes under 'expanded'
+    :return: Path of coordinates, or None if the goal can not be reached
+    """
+    if not (grid.llx <= start[0] <= grid.urx
+            and grid.lly <= start[1] <= grid.ury):
+        return None
+    width = grid.width
+    passable = grid.passable
+    cells = len(passable)
+    distances, by_row = get_goal_distances(grid, goal)
+    if stats is None:
+        stats = {}
+    stats['expanded'] = 0
+    g_scores = array('i', [-1]) * cells
+    parents = array('i', [-1]) * cells
+    start_cell = grid.cell_id(*start)
+    g_scores[start_cell] = 0
+    if by_row:
+        frontier = [(distances[start_cell // width], 0, start_cell)]
+    else:
+        frontier = [(distances[start_cell % width], 0, start_cell)]
+
+    while frontier:
+        f, g, cell = heappop(frontier)
+        if g > g_scores[cell]:
+            continue
+        stats['expanded'] += 1
+        if f - g <= 1:
+            return cell_path(grid, parents, cell)
+        x = cell % width
+        g += 1
+        for child in (cell + 1 if x + 1 < width else -1,
+                      cell - 1 if x > 0 else -1,
+                      cell + width if cell + width < cells else -1,
+                      cell - width):
+            if child < 0 or not passable[child] \
+                    or 0 <= g_scores[child] <= g:
+                continue
+            g_scores[child] = g
+            parents[child] = cell
+            if by_row:
+                heappush(frontier, (g + distances[child // width], g, child))
             else:
-                if robot_direction == 0:
-                    robot_commands.append('forward 1')
-                elif robot_direction == 1:
-                    robot_commands.append('left')
-                    robot_commands.append('forward 1')
-                    robot_direction = 0
-                elif robot_direction == 3:
-                    robot_commands.append('right')
-                    robot_commands.append('forward 1')
-                    robot_direction = 0
-                else:
-                    robot_commands.append('back 1')
+                heappush(frontier, (g + distances[child % width], g, child))
+    return None
+
+
+def get_distance_field(grid: MazeGrid, goal: str) -> array:
+    """
+    Returns the distance of every cell to the goal edge, computed once per
+    grid with a breadth first search that starts from every open cell on the
+    goal edge at the same time
+    :param MazeGrid grid: Passability grid of the maze
+    :param str goal: Maze edge to arrive at
+    :return: Distance per cell id, -1 for cells that can not reach the goal
+    """
+    if goal in grid.distance_fields:
+        return grid.distance_fields[goal]
+    width = grid.width
+    passable = grid.passable
+    cells = len(passable)
+    distances, by_row = get_goal_distances(grid, goal)
+    field = array('i', [-1]) * cells
+    queue = array('i', [0]) * cells
+    tail = 0
+    for line, distance in enumerate(distances):
+        if distance > 1:
+            continue
+        if by_row:
+            goal_cells = range(line * width, line * width + width)
+        else:
+            goal_cells = range(line, cells, width)
+        for cell in goal_cells:
+            if passable[cell]:
+                field[cell] = 0
+                queue[tail] = cell
+                tail += 1
+
+    head = 0
+    while head < tail:
+        cell = queue[head]
+        head += 1
+        x = cell % width
+        distance = field[cell] + 1
+        for child in (cell + 1 if x + 1 < width else -1,
+                      cell - 1 if x > 0 else -1,
+                      cell + width if cell + width < cells else -1,
+                      cell - width):
+            if child >= 0 and passable[child] and field[child] < 0:
+                field[child] = distance
+                queue[tail] = child
+                tail += 1
+    grid.distance_fields[goal] = field
+    return field
+
+
+def walk_distance_field(grid: MazeGrid, start: tuple[int, int], goal: str,
+                        stats: Optional[SearchStats] = None) \
+        -> Optional[list[tuple[int, int]]]:
+    """
+    Solves the maze by walking down the distance field of the goal, always
+    stepping to the first adjacent cell that is closest to the goal
+    :param MazeGrid grid: Passability grid of the maze
+    :param tuple[int, int] start: Starting x and y coordinate
+    :param str goal: Maze edge to arrive at
+    :param Optional[SearchStats] stats: Dictionary that receives the amount
+    of expanded nodes under 'expanded'
+    :return: Path of coordinates, or None if the goal can not be reached
+    """
+    if not (grid.llx <= start[0] <= grid.urx
+            and grid.lly <= start[1] <= grid.ury):
+        return None
+    if stats is None:
+        stats = {}
+    stats['expanded'] = 0
+    width = grid.width
+    cells = len(grid.passable)
+    field = get_distance_field(grid, goal)
+    cell = grid.cell_id(*start)
+    distances, by_row = get_goal_distances(grid, goal)
+    if distances[cell // width if by_row else cell % width] <= 1:
+        return [start]
+    path = [start]
+    while True:
+        stats['expanded'] += 1
+        x = cell % width
+        best = -1
+        for child in (cell + 1 if x + 1 < width else -1,
+                      cell - 1 if x > 0 else -1,
+                      cell + width if cell + width < cells else -1,
+                      cell - width):
+            if child >= 0 and field[child] >= 0 \
+                    and (best < 0 or field[child] < field[best]):
+                best = child
+        if best < 0:
+            return None
+        cell = best
+        path.append(grid.position(cell))
+        if field[cell] == 0:
+            return path
+
+
+class JumpPointSearch:
+    """
+    Jump point search adapted to a 4-connected grid. Straight runs through
+    open areas are skipped in a single jump, and only cells where a path may
+    have to turn are pushed onto the frontier
+    """
+    grid: MazeGrid
+    distances: array
+    by_row: bool
+    goal_rows: bytearray
+    goal_columns: bytearray
+    horizontal_jumps: dict[int, array]
+
+    def __init__(self, grid: MazeGrid, goal: str) -> None:
+        """
+        Constructor for JumpPointSearch
+        :param MazeGrid grid: Passability grid of the maze
+        :param str goal: Maze edge to arrive at
+        """
+        self.grid = grid
+        self.distances, self.by_row = get_goal_distances(grid, goal)
+        self.goal_rows = bytearray(grid.height)
+        self.goal_columns = bytearray(grid.width)
+        goal_lines = self.goal_rows if self.by_row else self.goal_columns
+        for line, distance in enumerate(self.distances):
+            goal_lines[line] = distance <= 1
+        self.horizontal_jumps = {
+            step: array('i', [-2]) * len(grid.passable) for step in (1, -1)
+        }
+
+    def is_open(self, x: int, y: int) -> bool:
+        """
+        Checks if the grid cell lies within the grid and is not blocked
+        :param int x: Column of the cell
+        :param int y: Row of the cell
+        :return: Boolean value
+        """
+        grid = self.grid
+        return 0 <= x < grid.width and 0 <= y < grid.height \
+            and grid.passable[y * grid.width + x] == 1
+
+    def jump_horizontal(self, x: int, y: int, dx: int) -> int:
+        """
+        Moves along the row until reaching the goal or a cell where an open
+        cell above or below appears next to a blocked one. The result is
+        remembered for every cell passed, as vertical jumps start horizontal
+        jumps from every cell they pass
+        :param int x: Column to jump from
+        :param int y: Row to jump along
+        :param int dx: Step of 1 or -1
+        :return: Column of the jump point, or -1 if there is none
+        """
+        grid = self.grid
+        passable = grid.passable
+        width = grid.width
+        jumps = self.horizontal_jumps[dx]
+        offset = y * width
+        above = offset + width if y + 1 < grid.height else -1
+        below = offset - width
+        passed = []
+        while True:
+            if jumps[offset + x] != -2:
+                jump_x = jumps[offset + x]
+                break
+            passed.append(x)
+            x += dx
+            if not (0 <= x < width and passable[offset + x]):
+                jump_x = -1
+                break
+            if self.goal_columns[x] or self.goal_rows[y] \
+                    or above >= 0 and passable[above + x] \
+                    and not passable[above + x - dx] \
+                    or below >= 0 and passable[below + x] \
+                    and not passable[below + x - dx]:
+                jump_x = x
+                break
+        for x in passed:
+            jumps[offset + x] = jump_x
+        return jump_x
+
+    def jump_vertical(self, x: int, y: int, dy: int) -> int:
+        """
+        Moves along the column until reaching the goal, a cell where an open
+        cell to the side appears next to a blocked one, or a cell from which
+        a horizontal jump finds a jump point
+        :param int x: Column to jump along
+        :param int y: Row to jump from
+        :param int dy: Step of 1 or -1
+        :return: Row of the jump point, or -1 if there is none
+        """
+        is_open = self.is_open
+        while True:
+            y += dy
+            if not is_open(x, y):
+                return -1
+            if self.goal_columns[x] or self.goal_rows[y]:
+                return y
+            if is_open(x + 1, y) and not is_open(x + 1, y - dy) \
+                    or is_open(x - 1, y) and not is_open(x - 1, y - dy):
+                return y
+            if self.jump_horizontal(x, y, 1) >= 0 \
+                    or self.jump_horizontal(x, y, -1) >= 0:
+                return y
+
+    def get_jump_points(self, x: int, y: int, dx: int, dy: int) \
+            -> list[tuple[int, int]]:
+        """
+        Returns the jump points reachable from a cell. Arriving horizontally
+        the path may go on or turn up or down, and arriving vertically it may
+        go on or turn left or right, while the start may go any way
+        :param int x: Column of the cell
+        :param int y: Row of the cell
+        :param int dx: Horizontal direction the cell was reached in
+        :param int dy: Vertical direction the cell was reached in
+        :return: List of grid columns and rows of the jump points
+        """
+        if dx != 0:
+            horizontal_steps, vertical_steps = (dx,), (1, -1)
+        elif dy != 0:
+            horizontal_steps, vertical_steps = (1, -1), (dy,)
         else:
-            if current_position[0] < next_position[0]:
-                if robot_direction == 0:
-                    robot_commands.append('right')
-                    robot_commands.append('forward 1')
-                    robot_direction = 1
-                elif robot_direction == 1:
-                    robot_commands.append('forward 1')
-                elif robot_direction == 3:
-                    robot_commands.append('back 1')
+            horizontal_steps, vertical_steps = (1, -1), (1, -1)
+        jump_points = []
+        for step in horizontal_steps:
+            jump_x = self.jump_horizontal(x, y, step)
+            if jump_x >= 0:
+                jump_points.append((jump_x, y))
+        for step in vertical_steps:
+            jump_y = self.jump_vertical(x, y, step)
+            if jump_y >= 0:
+                jump_points.append((x, jump_y))
+        return jump_points
+
+    def search(self, start: tuple[int, int],
+               stats: Optional[SearchStats] = None) \
+            -> Optional[list[tuple[int, int]]]:
+        """
+        Searches from the start to the goal edge, expanding jump points in
+        astar order with the distance to the goal edge as heuristic
+        :param tuple[int, int] start: Starting x and y coordinate
+        :param Optional[SearchStats] stats: Dictionary that receives the
+        amount of expanded jump points under 'expanded'
+        :return: Jump points from the start to the goal, joined by straight
+        lines, or None if the goal can not be reached
+        """
+        grid = self.grid
+        if not (grid.llx <= start[0] <= grid.urx
+                and grid.lly <= start[1] <= grid.ury):
+            return None
+        if stats is None:
+            stats = {}
+        stats['expanded'] = 0
+        width = grid.width
+        distances = self.distances
+        by_row = self.by_row
+        g_scores = array('i', [-1]) * len(grid.passable)
+        parents = array('i', [-1]) * len(grid.passable)
+        start_cell = grid.cell_id(*start)
+        g_scores[start_cell] = 0
+        frontier = [(distances[start_cell // width] if by_row
+                     else distances[start_cell % width], 0, start_cell)]
+
+        while frontier:
+            f, g, cell = heappop(frontier)
+            if g > g_scores[cell]:
+                continue
+            stats['expanded'] += 1
+            x, y = cell % width, cell // width
+            if self.goal_columns[x] or self.goal_rows[y]:
+                return cell_path(grid, parents, cell)
+            dx = dy = 0
+            if parents[cell] >= 0:
+                parent_x = parents[cell] % width
+                parent_y = parents[cell] // width
+                dx = (x > parent_x) - (x < parent_x)
+                dy = (y > parent_y) - (y < parent_y)
+            for jump_x, jump_y in self.get_jump_points(x, y, dx, dy):
+                child = jump_y * width + jump_x
+                cost = g + abs(jump_x - x) + abs(jump_y - y)
+                if 0 <= g_scores[child] <= cost:
+                    continue
+                g_scores[child] = cost
+                parents[child] = cell
+                heappush(frontier, (cost + (distances[jump_y] if by_row
+                                            else distances[jump_x]),
+                                    cost, child))
+        return None
+
+
+def expand_waypoints(waypoints: list[tuple[int, int]]) \
+        -> list[tuple[int, int]]:
+    """
+    Converts waypoints joined by straight lines to a path that visits every
+    coordinate on those lines
+    :param list[tuple[int, int]] waypoints: Waypoints of the path
+    :return: List of coordinates
+    """
+    path = waypoints[:1]
+    for x, y in waypoints[1:]:
+        last_x, last_y = path[-1]
+        dx = (x > last_x) - (x < last_x)
+        dy = (y > last_y) - (y < last_y)
+        while path[-1] != (x, y):
+            last_x, last_y = last_x + dx, last_y + dy
+            path.append((last_x, last_y))
+    return path
+
+
+def jump_point_search(grid: MazeGrid, start: tuple[int, int], goal: str,
+                      stats: Optional[SearchStats] = None) \
+        -> Optional[list[tuple[int, int]]]:
+    """
+    Solves the maze with jump point search
+    :param MazeGrid grid: Passability grid of the maze
+    :param tuple[int, int] start: Starting x and y coordinate
+    :param str goal: Maze edge to arrive at
+    :param Optional[SearchStats] stats: Dictionary that receives the amount
+    of expanded nodes under 'expanded'
+    :return: Path of coordinates, or None if the goal can not be reached
+    """
+    jump_points = JumpPointSearch(grid, goal).search(start, stats)
+    return expand_waypoints(jump_points) if jump_points else jump_points
+
+
+def jump_point_waypoints(grid: MazeGrid, start: tuple[int, int], goal: str,
+                         stats: Optional[SearchStats] = None) \
+        -> Optional[list[tuple[int, int]]]:
+    """
+    Solves the maze with jump point search without expanding the jump points
+    into every coordinate between them
+    :param MazeGrid grid: Passability grid of the maze
+    :param tuple[int, int] start: Starting x and y coordinate
+    :param str goal: Maze edge to arrive at
+    :param Optional[SearchStats] stats: Dictionary that receives the amount
+    of expanded nodes under 'expanded'
+    :return: Waypoints of the path, or None if the goal can not be reached
+    """
+    jump_points = JumpPointSearch(grid, goal).search(start, stats)
+    return path_to_waypoints(jump_points) if jump_points else jump_points
+
+
+def get_neighbour_cells(grid: MazeGrid) -> array:
+    """
+    Returns the open neighbour of every cell in every direction, built once
+    per grid
+    :param MazeGrid grid: Passability grid of the maze
+    :return: Cell id of the neighbour at cell * 4 + direction index, or -1 if
+    it is blocked or outside the grid
+    """
+    if grid.neighbour_cells is not None:
+        return grid.neighbour_cells
+    width = grid.width
+    passable = grid.passable
+    cells = len(passable)
+    neighbours = array('i', [-1]) * (cells * 4)
+    for cell in range(cells):
+        x = cell % width
+        if cell + width < cells and passable[cell + width]:
+            neighbours[cell * 4] = cell + width
+        if x + 1 < width and passable[cell + 1]:
+            neighbours[cell * 4 + 1] = cell + 1
+        if cell >= width and passable[cell - width]:
+            neighbours[cell * 4 + 2] = cell - width
+        if x > 0 and passable[cell - 1]:
+            neighbours[cell * 4 + 3] = cell - 1
+    grid.neighbour_cells = neighbours
+    return neighbours
+
+
+def turn_aware_search(grid: MazeGrid, start: tuple[int, int], goal: str,
+                      stats: Optional[SearchStats] = None,
+                      direction: Optional[int] = None) \
+        -> Optional[list[tuple[int, int]]]:
+    """
+    Finds the path that needs the fewest robot commands, and the fewest steps
+    among those. A search state is a cell, the direction the robot faces and
+    whether it arrived with a forward or a back move. Extending that move
+    costs no command, starting a move costs one and turning first costs two,
+    so states are searched in astar order of commands first and steps second
+    :param MazeGrid grid: Passability grid of the maze
+    :param tuple[int, int] start: Starting x and y coordinate
+    :param str goal: Maze edge to arrive at
+    :param Optional[SearchStats] stats: Dictionary that receives the amount
+    of expanded nodes under 'expanded'
+    :param Optional[int] direction: Starting direction index, defaults to the
+    direction of the current maze run
+    :return: Path of coordinates, or None if the goal can not be reached
+    """
+    if not (grid.llx <= start[0] <= grid.urx
+            and grid.lly <= start[1] <= grid.ury):
+        return None
+    if direction is None:
+        direction = run_direction
+    width = grid.width
+    distances, by_row = get_goal_distances(grid, goal)
+    neighbours = get_neighbour_cells(grid)
+    estimates = [get_command_estimate(heading // 2, heading % 2,
+                                      goal_directions[goal])
+                 for heading in range(8)]
+    step_estimates = array('i', [max(distance - 1, 0)
+                                 for distance in distances])
+    moves = get_turn_aware_moves()
+    if stats is None:
+        stats = {}
+    stats['expanded'] = 0
+    # a state is cell * 8 + facing * 2 + move, where move is 0 for a forward
+    # move and 1 for a back move, and its cost is commands * scale + steps
+    states = len(grid.passable) * 8
+    scale = states
+    costs = array('q', [-1]) * states
+    parents = array('i', [-1]) * states
+    start_state = grid.cell_id(*start) * 8 + direction * 2
+    costs[start_state] = 0
+    frontier = [(0, start_state)]
+
+    while frontier:
+        key, state = heappop(frontier)
+        cell = state >> 3
+        line = cell // width if by_row else cell % width
+        if distances[line] <= 1:
+            return state_path(grid, parents, state)
+        cost = costs[state]
+        if key > cost + estimates[state & 7] * scale + step_estimates[line]:
+            continue
+        stats['expanded'] += 1
+        for heading, direction, commands in \
+                moves[8 if state == start_state else state & 7]:
+            neighbour = neighbours[cell * 4 + direction]
+            if neighbour < 0:
+                continue
+            next_state = neighbour * 8 + heading
+            next_cost = cost + commands * scale + 1
+            if 0 <= costs[next_state] <= next_cost:
+                continue
+            costs[next_state] = next_cost
+            parents[next_state] = state
+            heappush(frontier, (
+                next_cost + estimates[heading] * scale
+                + step_estimates[neighbour // width if by_row
+                                 else neighbour % width], next_state))
+    return None
+
+
+# direction index that leads to every maze edge
+goal_directions = {'top': 0, 'right': 1, 'bottom': 2, 'left': 3}
+
+
+def get_command_estimate(facing: int, move: int, goal_direction: int) -> int:
+    """
+    Returns the least amount of commands still needed to reach the goal edge
+    after a move: none while moving towards it, one when facing towards or
+    away from it and two when a turn is needed first
+    :param int facing: Direction index the robot faces
+    :param int move: 0 after a forward move and 1 after a back move
+    :param int goal_direction: Direction index that leads to the goal edge
+    :return: Amount of commands
+    """
+    if (facing + 2 * move) % 4 == goal_direction:
+        return 0
+    if facing % 2 == goal_direction % 2:
+        return 1
+    return 2
+
+
+def get_turn_aware_moves() -> list[list[tuple[int, int, int]]]:
+    """
+    Returns the moves of the turn-aware search for every facing and move of
+    a state, and for the start where no move can be extended
+    :return: For facing * 2 + move, or 8 for the start, a list of the facing
+    * 2 + move after the move, the direction index moved in and the amount
+    of commands it costs
+    """
+    moves = []
+    for heading in range(9):
+        facing, move = divmod(heading % 8, 2)
+        moving = -1 if heading == 8 else (facing + 2 * move) % 4
+        heading_moves = []
+        for next_facing, next_move, commands in (
+                (facing, 0, 0 if moving == facing else 1),
+                (facing, 1, 0 if moving == (facing + 2) % 4 else 1),
+                ((facing + 1) % 4, 0, 2), ((facing + 1) % 4, 1, 2),
+                ((facing + 3) % 4, 0, 2), ((facing + 3) % 4, 1, 2)):
+            heading_moves.append((next_facing * 2 + next_move,
+                                  (next_facing + 2 * next_move) % 4,
+                                  commands))
+        moves.append(heading_moves)
+    return moves
+
+
+def state_path(grid: MazeGrid, parents: array, state: int) \
+        -> list[tuple[int, int]]:
+    """
+    Converts a search state of the turn-aware search to a path of coordinates
+    by following its parent links
+    :param MazeGrid grid: Passability grid of the maze
+    :param array parents: Parent state of every state, -1 for the start
+    :param int state: Search state at the end of the path
+    :return: List of coordinates
+    """
+    path = [grid.position(state // 8)]
+    while parents[state] >= 0:
+        state = parents[state]
+        path.append(grid.position(state // 8))
+    path.reverse()
+    return path
+
+
+def bidirectional_search(grid: MazeGrid, start: tuple[int, int], goal: str,
+                         stats: Optional[SearchStats] = None) \
+        -> Optional[list[tuple[int, int]]]:
+    """
+    Breadth first search from both ends at once, one side starting at the
+    start and the other at every open cell on the goal edge. The side with
+    the smaller frontier expands one full layer at a time, and the search
+    stops after the layer in which the two sides meet
+    :param MazeGrid grid: Passability grid of the maze
+    :param tuple[int, int] start: Starting x and y coordinate
+    :param str goal: Maze edge to arrive at
+    :param Optional[SearchStats] stats: Dictionary that receives the amount
+    of expanded nodes under 'expanded'
+    :return: Path of coordinates, or None if the goal can not be reached
+    """
+    if not (grid.llx <= start[0] <= grid.urx
+            and grid.lly <= start[1] <= grid.ury):
+        return None
+    if stats is None:
+        stats = {}
+    stats['expanded'] = 0
+    width = grid.width
+    cells = len(grid.passable)
+    distances, by_row = get_goal_distances(grid, goal)
+    start_cell = grid.cell_id(*start)
+    if distances[start_cell // width if by_row else start_cell % width] <= 1:
+        return [start]
+    neighbours = get_neighbour_cells(grid)
+    start_steps = array('i', [-1]) * cells
+    goal_steps = array('i', [-1]) * cells
+    start_parents = array('i', [-1]) * cells
+    goal_parents = array('i', [-1]) * cells
+    start_steps[start_cell] = 0
+    start_frontier = [start_cell]
+    goal_frontier = [cell for cell in range(cells) if grid.passable[cell]
+                     and distances[cell // width if by_row
+                                   else cell % width] <= 1]
+    for cell in goal_frontier:
+        goal_steps[cell] = 0
+
+    while start_frontier and goal_frontier:
+        from_start = len(start_frontier) <= len(goal_frontier)
+        if from_start:
+            frontier, own, other, parents = \
+                start_frontier, start_steps, goal_steps, \
+                start_parents
+        else:
+            frontier, own, other, parents = \
+                goal_frontier, goal_steps, start_steps, goal_parents
+        next_frontier = []
+        shortest = -1
+        meeting = (-1, -1)
+        for cell in frontier:
+            stats['expanded'] += 1
+            for direction in range(4):
+                neighbour = neighbours[cell * 4 + direction]
+                if neighbour < 0:
+                    continue
+                if other[neighbour] >= 0:
+                    length = own[cell] + 1 + other[neighbour]
+                    if shortest < 0 or length < shortest:
+                        shortest = length
+                        meeting = (cell, neighbour) if from_start \
+                            else (neighbour, cell)
+                elif own[neighbour] < 0:
+                    own[neighbour] = own[cell] + 1
+                    parents[neighbour] = cell
+                    next_frontier.append(neighbour)
+        if shortest >= 0:
+            return meeting_path(grid, start_parents, goal_parents, *meeting)
+        if from_start:
+            start_frontier = next_frontier
+        else:
+            goal_frontier = next_frontier
+    return None
+
+
+def meeting_path(grid: MazeGrid, start_parents: array, goal_parents: array,
+                 start_side: int, goal_side: int) -> list[tuple[int, int]]:
+    """
+    Joins the two halves of a bidirectional search where they meet
+    :param MazeGrid grid: Passability grid of the maze
+    :param array start_parents: Parent cell id of the cells reached from the
+    start, -1 for the start
+    :param array goal_parents: Parent cell id of the cells reached from the
+    goal edge, -1 for the cells on the goal edge
+    :param int start_side: Cell id of the meeting cell reached from the start
+    :param int goal_side: Cell id of the neighbouring meeting cell reached
+    from the goal edge
+    :return: List of coordinates
+    """
+    path = cell_path(grid, start_parents, start_side)
+    cell = goal_side
+    path.append(grid.position(cell))
+    while goal_parents[cell] >= 0:
+        cell = goal_parents[cell]
+        path.append(grid.position(cell))
+    return path
+
+
+class DStarLite:
+    """
+    Incremental planner (D* Lite) that searches from the goal edge towards
+    the start and keeps its distances between plans. When the robot moves
+    or cells of the grid change, only the distances affected by the change
+    are repaired
+    """
+    llx: int
+    lly: int
+    width: int
+    height: int
+    passable: bytearray
+    goal_lines: bytearray
+    by_row: bool
+    distances: array
+    lookaheads: array
+    frontier: list[tuple[int, int, int]]
+    start: int
+    key_modifier: int
+    infinity: int
+
+    def __init__(self, grid: MazeGrid, goal: str) -> None:
+        """
+        Constructor for DStarLite
+        :param MazeGrid grid: Passability grid of the maze
+        :param str goal: Maze edge to arrive at
+        """
+        self.llx = grid.llx
+        self.lly = grid.lly
+        self.width = grid.width
+        self.height = grid.height
+        self.passable = bytearray(grid.passable)
+        line_distances, self.by_row = get_goal_distances(grid, goal)
+        self.goal_lines = bytearray(distance <= 1
+                                    for distance in line_distances)
+        cells = len(self.passable)
+        self.infinity = cells + 1
+        self.distances = array('i', [self.infinity]) * cells
+        self.lookaheads = array('i', [self.infinity]) * cells
+        self.frontier = []
+        self.start = -1
+        self.key_modifier = 0
+        for cell in range(cells):
+            if self.is_goal(cell):
+                self.lookaheads[cell] = 0
+                heappush(self.frontier, (0, 0, cell))
+
+    def has_bounds(self, grid: MazeGrid) -> bool:
+        """
+        Checks if the planner covers the same cells as the grid
+        :param MazeGrid grid: Passability grid of the maze
+        :return: Boolean value
+        """
+        return (self.llx, self.lly, self.width, self.height) \
+            == (grid.llx, grid.lly, grid.width, grid.height)
+
+    def is_goal(self, cell: int) -> bool:
+        """
+        Checks if the cell is an open cell on the goal edge
+        :param int cell: Cell id
+        :return: Boolean value
+        """
+        line = cell // self.width if self.by_row else cell % self.width
+        return self.goal_lines[line] == 1 and self.passable[cell] == 1
+
+    def get_neighbours(self, cell: int) -> list[int]:
+        """
+        Returns the cells next to a cell, in the order right, left, up, down
+        :param int cell: Cell id
+        :return: List of cell ids
+        """
+        width = self.width
+        x = cell % width
+        neighbours = []
+        if x + 1 < width:
+            neighbours.append(cell + 1)
+        if x > 0:
+            neighbours.append(cell - 1)
+        if cell + width < len(self.passable):
+            neighbours.append(cell + width)
+        if cell >= width:
+            neighbours.append(cell - width)
+        return neighbours
+
+    def calculate_key(self, cell: int) -> tuple[int, int]:
+        """
+        Returns the priority of a cell: its distance plus the estimated
+        distance to the start, and its distance to break ties
+        :param int cell: Cell id
+        :return: Key of the cell
+        """
+        distance = min(self.distances[cell], self.lookaheads[cell])
+        return (distance + abs(cell % self.width - self.start % self.width)
+                + abs(cell // self.width - self.start // self.width)
+                + self.key_modifier, distance)
+
+    def update_cell(self, cell: int) -> None:
+        """
+        Recalculates the one step lookahead distance of a cell from its
+        neighbours and queues the cell when it became inconsistent. A blocked
+        start still gets its distance from its open neighbours, since the
+        robot steps off it, but no other cell passes through it
+        :param int cell: Cell id
+        :return: None
+        """
+        if self.goal_lines[cell // self.width if self.by_row
+                           else cell % self.width]:
+            lookahead = 0 if self.passable[cell] else self.infinity
+        elif not self.passable[cell] and cell != self.start:
+            lookahead = self.infinity
+        else:
+            lookahead = self.infinity
+            for neighbour in self.get_neighbours(cell):
+                if self.passable[neighbour] \
+                        and self.distances[neighbour] + 1 < lookahead:
+                    lookahead = self.distances[neighbour] + 1
+        self.lookaheads[cell] = lookahead
+        if self.distances[cell] != lookahead:
+            heappush(self.frontier, (*self.calculate_key(cell), cell))
+
+    def compute_shortest_path(self, stats: SearchStats) -> None:
+        """
+        Expands inconsistent cells until the distance of the start is
+        correct
+        :param SearchStats stats: Dictionary that counts the expanded cells
+        under 'expanded'
+        :return: None
+        """
+        distances = self.distances
+        lookaheads = self.lookaheads
+        start = self.start
+        while self.frontier and (
+                self.frontier[0][:2] < self.calculate_key(start)
+                or distances[start] != lookaheads[start]):
+            key_1, key_2, cell = heappop(self.frontier)
+            if distances[cell] == lookaheads[cell]:
+                continue
+            key = self.calculate_key(cell)
+            if (key_1, key_2) < key:
+                heappush(self.frontier, (*key, cell))
+                continue
+            stats['expanded'] += 1
+            if distances[cell] > lookaheads[cell]:
+                distances[cell] = lookaheads[cell]
+            else:
+                distances[cell] = self.infinity
+                self.update_cell(cell)
+            for neighbour in self.get_neighbours(cell):
+                self.update_cell(neighbour)
+
+    def update_grid(self, grid: MazeGrid) -> int:
+        """
+        Applies the cells that changed in the grid since the last plan,
+        comparing the grid one row at a time
+        :param MazeGrid grid: Passability grid of the maze
+        :return: Amount of changed cells
+        """
+        width = self.width
+        changed = 0
+        for offset in range(0, len(self.passable), width):
+            row = grid.passable[offset:offset + width]
+            if row == self.passable[offset:offset + width]:
+                continue
+            for cell in range(offset, offset + width):
+                if self.passable[cell] != grid.passable[cell]:
+                    self.passable[cell] = grid.passable[cell]
+                    self.update_cell(cell)
+                    for neighbour in self.get_neighbours(cell):
+                        self.update_cell(neighbour)
+                    changed += 1
+        return changed
+
+    def plan(self, start: tuple[int, int],
+             stats: Optional[SearchStats] = None) \
+            -> Optional[list[tuple[int, int]]]:
+        """
+        Plans a path from the start, repairing the distances the last plan
+        left behind
+        :param tuple[int, int] start: Starting x and y coordinate
+        :param Optional[SearchStats] stats: Dictionary that receives the
+        amount of expanded cells under 'expanded'
+        :return: Path of coordinates, or None if the goal can not be reached
+        """
+        x, y = start[0] - self.llx, start[1] - self.lly
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        if stats is None:
+            stats = {}
+        stats['expanded'] = 0
+        cell = y * self.width + x
+        if self.goal_lines[y if self.by_row else x]:
+            return [start]
+        previous = self.start
+        if previous >= 0:
+            self.key_modifier += abs(x - previous % self.width) \
+                + abs(y - previous // self.width)
+        self.start = cell
+        if previous >= 0 and not self.passable[previous]:
+            self.update_cell(previous)
+        if not self.passable[cell]:
+            self.update_cell(cell)
+        self.compute_shortest_path(stats)
+        if self.distances[cell] >= self.infinity:
+            return None
+
+        path = [start]
+        while not self.is_goal(cell):
+            cell = min((neighbour for neighbour in self.get_neighbours(cell)
+                        if self.passable[neighbour]),
+                       key=self.distances.__getitem__)
+            path.append((self.llx + cell % self.width,
+                         self.lly + cell // self.width))
+        return path
+
+
+# incremental planners kept between maze runs, by goal
+incremental_planners: dict[str, DStarLite] = {}
+
+
+def incremental_search(grid: MazeGrid, start: tuple[int, int], goal: str,
+                       stats: Optional[SearchStats] = None) \
+        -> Optional[list[tuple[int, int]]]:
+    """
+    Solves the maze with the incremental planner of the goal, which only
+    repairs what changed since its last plan
+    :param MazeGrid grid: Passability grid of the maze
+    :param tuple[int, int] start: Starting x and y coordinate
+    :param str goal: Maze edge to arrive at
+    :param Optional[SearchStats] stats: Dictionary that receives the amount
+    of expanded nodes under 'expanded'
+    :return: Path of coordinates, or None if the goal can not be reached
+    """
+    planner = incremental_planners.get(goal)
+    if planner is None or not planner.has_bounds(grid):
+        planner = DStarLite(grid, goal)
+        incremental_planners[goal] = planner
+    else:
+        planner.update_grid(grid)
+    return planner.plan(start, stats)
+
+
+# width and height in cells of the clusters of the hierarchical planner
+CLUSTER_SIZE = 16
+
+# turns the passable bytes of the cells into the binary digits of an int
+bit_digits = bytes.maketrans(b'\x00\x01', b'01')
+
+
+class ClusterGraph:
+    """
+    Abstract graph of a maze grid for hierarchical pathfinding. The grid is
+    split into square clusters, and every open cell next to an open cell of
+    a neighbouring cluster is an entrance. The costs between the entrances
+    of every cluster and from them to the goal edges are searched once when
+    the graph is built, so a plan only searches the abstract graph and the
+    clusters its path passes through. Since every crossing between two
+    clusters is an entrance, the paths are as short as those of a flat
+    search
+    """
+    grid: MazeGrid
+    size: int
+    columns: int
+    rows: int
+    goal_lines: dict[str, tuple[array, bool]]
+    entrances: list[array]
+    costs: list[array]
+    goal_costs: list[Optional[array]]
+    goal_cells: dict[tuple[int, str], list[int]]
+    infinity: int
+
+    def __init__(self, grid: MazeGrid, size: int = CLUSTER_SIZE) -> None:
+        """
+        Constructor for ClusterGraph, builds the costs of every cluster
+        :param MazeGrid grid: Passability grid of the maze
+        :param int size: Width and height of a cluster in cells
+        """
+        self.grid = grid
+        self.size = size
+        self.columns = (grid.width + size - 1) // size
+        self.rows = (grid.height + size - 1) // size
+        self.goal_lines = {goal: get_goal_distances(grid, goal)
+                           for goal in goal_directions}
+        self.entrances = []
+        self.costs = []
+        self.goal_costs = []
+        self.goal_cells = {}
+        self.infinity = len(grid.passable) + 1
+        self.build()
+
+    def build(self) -> None:
+        """
+        Searches the entrances and their costs of every cluster
+        :return: None
+        """
+        self.entrances = []
+        self.costs = []
+        self.goal_costs = []
+        for cluster in range(self.columns * self.rows):
+            entrances, costs, goal_costs = self.link_cluster(cluster)
+            self.entrances.append(entrances)
+            self.costs.append(costs)
+            self.goal_costs.append(goal_costs)
+
+    def get_cluster(self, cell: int) -> int:
+        """
+        Returns the cluster a cell lies in
+        :param int cell: Cell id
+        :return: Cluster id
+        """
+        width = self.grid.width
+        return cell // width // self.size * self.columns \
+            + cell % width // self.size
+
+    def get_bounds(self, cluster: int) -> tuple[int, int, int, int]:
+        """
+        Returns the cells covered by a cluster, which is smaller than the
+        cluster size along the upper and right edge of the grid
+        :param int cluster: Cluster id
+        :return: Lowest grid x and y index, width and height of the cluster
+        """
+        x = cluster % self.columns * self.size
+        y = cluster // self.columns * self.size
+        return x, y, min(self.size, self.grid.width - x), \
+            min(self.size, self.grid.height - y)
+
+    def get_crossings(self, cell: int) -> list[int]:
+        """
+        Returns the open cells of neighbouring clusters next to a cell
+        :param int cell: Cell id
+        :return: List of cell ids
+        """
+        grid = self.grid
+        width = grid.width
+        passable = grid.passable
+        x, y = cell % width, cell // width
+        crossings = []
+        if x % self.size == self.size - 1 and x + 1 < width \
+                and passable[cell + 1]:
+            crossings.append(cell + 1)
+        if x and x % self.size == 0 and passable[cell - 1]:
+            crossings.append(cell - 1)
+        if y % self.size == self.size - 1 and y + 1 < grid.height \
+                and passable[cell + width]:
+            crossings.append(cell + width)
+        if y and y % self.size == 0 and passable[cell - width]:
+            crossings.append(cell - width)
+        return crossings
+
+    def find_entrances(self, cluster: int) -> array:
+        """
+        Returns the entrance cells on the four borders of a cluster
+        :param int cluster: Cluster id
+        :return: Sorted cell ids
+        """
+        width = self.grid.width
+        passable = self.grid.passable
+        x, y, cluster_width, cluster_height = self.get_bounds(cluster)
+        first = y * width + x
+        last = (y + cluster_height - 1) * width + x
+        border = set(range(first, first + cluster_width))
+        border.update(range(last, last + cluster_width))
+        border.update(range(first, last + 1, width))
+        border.update(range(first + cluster_width - 1, last + cluster_width,
+                            width))
+        return array('i', sorted(cell for cell in border
+                                 if passable[cell]
+                                 and self.get_crossings(cell)))
+
+    def search_cluster(self, cell: int) -> tuple[array, array]:
+        """
+        Breadth first search from a cell that stays within its cluster
+        :param int cell: Cell id
+        :return: Steps and parent of every cell of the cluster by its index
+        within the cluster, -1 for cells that were not reached and for the
+        parent of the start
+        """
+        width = self.grid.width
+        passable = self.grid.passable
+        x, y, cluster_width, cluster_height = \
+            self.get_bounds(self.get_cluster(cell))
+        cluster_cells = cluster_width * cluster_height
+        steps = array('i', [-1]) * cluster_cells
+        parents = array('i', [-1]) * cluster_cells
+        origin = (cell // width - y) * cluster_width + cell % width - x
+        steps[origin] = 0
+        # offset from the index within the cluster to the cell id
+        offsets = array('i', [y * width + x + row * (width - cluster_width)
+                              for row in range(cluster_height)])
+        queue = [origin]
+        for index in queue:
+            column = index % cluster_width
+            cell = index + offsets[index // cluster_width]
+            step = steps[index] + 1
+            children = []
+            if column + 1 < cluster_width and passable[cell + 1]:
+                children.append(index + 1)
+            if column and passable[cell - 1]:
+                children.append(index - 1)
+            if index + cluster_width < cluster_cells \
+                    and passable[cell + width]:
+                children.append(index + cluster_width)
+            if index >= cluster_width and passable[cell - width]:
+                children.append(index - cluster_width)
+            for child in children:
+                if steps[child] < 0:
+                    steps[child] = step
+                    parents[child] = index
+                    queue.append(child)
+        return steps, parents
+
+    def get_index(self, cell: int) -> int:
+        """
+        Returns the index of a cell within its cluster
+        :param int cell: Cell id
+        :return: Index within the cluster
+        """
+        width = self.grid.width
+        x, y, cluster_width, _ = self.get_bounds(self.get_cluster(cell))
+        return (cell // width - y) * cluster_width + cell % width - x
+
+    def get_goal_cells(self, cluster: int, goal: str) -> list[int]:
+        """
+        Returns the open cells of a cluster that lie on the goal edge
+        :param int cluster: Cluster id
+        :param str goal: Maze edge to arrive at
+        :return: List of indices within the cluster
+        """
+        if (cluster, goal) in self.goal_cells:
+            return self.goal_cells[cluster, goal]
+        width = self.grid.width
+        passable = self.grid.passable
+        distances, by_row = self.goal_lines[goal]
+        x, y, cluster_width, cluster_height = self.get_bounds(cluster)
+        goal_cells = []
+        # the distances only grow away from the goal edge, so the first and
+        # last line of the cluster tell whether it touches the goal edge
+        if by_row:
+            nearest = min(distances[y], distances[y + cluster_height - 1])
+        else:
+            nearest = min(distances[x], distances[x + cluster_width - 1])
+        if nearest <= 1:
+            for index in range(cluster_width * cluster_height):
+                row = y + index // cluster_width
+                column = x + index % cluster_width
+                if distances[row if by_row else column] <= 1 \
+                        and passable[row * width + column]:
+                    goal_cells.append(index)
+        self.goal_cells[cluster, goal] = goal_cells
+        return goal_cells
+
+    def get_cluster_goal_costs(self, cluster: int, steps: array) \
+            -> dict[str, int]:
+        """
+        Returns the steps from a searched cell to the nearest goal cell of
+        every goal edge it reaches within the cluster
+        :param int cluster: Cluster id
+        :param array steps: Steps of a search within the cluster
+        :return: Steps by goal
+        """
+        costs = {}
+        for goal in goal_directions:
+            reached = [steps[index] for index
+                       in self.get_goal_cells(cluster, goal)
+                       if steps[index] >= 0]
+            if reached:
+                costs[goal] = min(reached)
+        return costs
+
+    def get_goal_bits(self, cluster: int, stride: int) -> list[int]:
+        """
+        Returns the cells of a cluster on every goal edge as bits of the
+        rows of the cluster, spaced stride bits apart
+        :param int cluster: Cluster id
+        :param int stride: Bits per row
+        :return: Bits per goal in the order of goal_directions
+        """
+        x, y, cluster_width, cluster_height = self.get_bounds(cluster)
+        row_bits = (1 << cluster_width) - 1
+        column_bits = sum(1 << row * stride for row in range(cluster_height))
+        goal_bits = []
+        for goal in goal_directions:
+            distances, by_row = self.goal_lines[goal]
+            bits = 0
+            if by_row:
+                for row in range(cluster_height):
+                    if distances[y + row] <= 1:
+                        bits |= row_bits << row * stride
+            else:
+                for column in range(cluster_width):
+                    if distances[x + column] <= 1:
+                        bits |= column_bits << column
+            goal_bits.append(bits)
+        return goal_bits
+
+    def link_cluster(self, cluster: int) \
+            -> tuple[array, array, Optional[array]]:
+        """
+        Searches the costs between the entrances of a cluster and from every
+        entrance to the goal edges within the cluster. The cells of the
+        cluster are the bits of an int, so a step of the breadth first
+        search moves the whole frontier at once
+        :param int cluster: Cluster id
+        :return: Sorted entrance cells, steps between every pair of
+        entrances and steps from every entrance to every goal edge in the
+        order of goal_directions, -1 where the cluster has no path. The goal
+        steps are None for a cluster that touches no goal edge
+        """
+        width = self.grid.width
+        passable = self.grid.passable
+        x, y, cluster_width, cluster_height = self.get_bounds(cluster)
+        # a blocked bit after every row keeps the frontier from wrapping
+        # into the next row
+        stride = cluster_width + 1
+        rows = b''.join(passable[(y + row) * width + x:
+                                 (y + row) * width + x + cluster_width]
+                        + b'\x00' for row in range(cluster_height))
+        open_bits = int(rows[::-1].translate(bit_digits), 2)
+        entrances = self.find_entrances(cluster)
+        count = len(entrances)
+        bits = [1 << (cell // width - y) * stride + cell % width - x
+                for cell in entrances]
+        indices = {bit: index for index, bit in enumerate(bits)}
+        costs = array('i', [-1]) * (count * count)
+        goal_bits = [line_bits & open_bits
+                     for line_bits in self.get_goal_bits(cluster, stride)]
+        goal_costs = None
+        if any(goal_bits):
+            goal_costs = array('i', [-1]) * (count * 4)
+        for index, bit in enumerate(bits):
+            # the costs are symmetric, so only the later entrances are
+            # searched for
+            pending = sum(bits[index:])
+            pending_goals = goal_bits if goal_costs is not None else []
+            pending_goals = [(goal, goal_bit) for goal, goal_bit
+                             in enumerate(pending_goals) if goal_bit]
+            frontier = reached = bit
+            step = 0
+            while frontier and (pending or pending_goals):
+                found = frontier & pending
+                pending ^= found
+                while found:
+                    other = indices[found & -found]
+                    costs[index * count + other] = step
+                    costs[other * count + index] = step
+                    found &= found - 1
+                for goal, goal_bit in pending_goals:
+                    if frontier & goal_bit:
+                        goal_costs[index * 4 + goal] = step
+                pending_goals = [(goal, goal_bit) for goal, goal_bit
+                                 in pending_goals
+                                 if not frontier & goal_bit]
+                frontier = (frontier << 1 | frontier >> 1
+                            | frontier << stride | frontier >> stride) \
+                    & open_bits & ~reached
+                reached |= frontier
+                step += 1
+        return entrances, costs, goal_costs
+
+    def search(self, start: tuple[int, int], goal: str,
+               stats: Optional[SearchStats] = None) \
+            -> Optional[list[tuple[int, int]]]:
+        """
+        Searches the abstract graph of entrances from the start to the goal
+        edge with astar, then refines the chosen entrances into a path of
+        coordinates through the clusters on the way
+        :param tuple[int, int] start: Starting x and y coordinate
+        :param str goal: Maze edge to arrive at
+        :param Optional[SearchStats] stats: Dictionary that receives the
+        amount of expanded abstract nodes under 'expanded'
+        :return: Path of coordinates, or None if the goal can not be reached
+        """
+        grid = self.grid
+        if not (grid.llx <= start[0] <= grid.urx
+                and grid.lly <= start[1] <= grid.ury):
+            return None
+        if stats is None:
+            stats = {}
+        stats['expanded'] = 0
+        width = grid.width
+        distances, by_row = self.goal_lines[goal]
+        start_cell = grid.cell_id(*start)
+        if distances[start_cell // width if by_row
+                     else start_cell % width] <= 1:
+            return [start]
+        goal_index = goal_directions[goal]
+        # a blocked start only steps onto its open neighbours, which then
+        # start the search in their own clusters
+        if grid.passable[start_cell]:
+            starts = [start_cell]
+        else:
+            x, y = start_cell % width, start_cell // width
+            starts = [cell for cell, inside in
+                      ((start_cell + 1, x + 1 < width), (start_cell - 1, x),
+                       (start_cell + width, y + 1 < grid.height),
+                       (start_cell - width, y))
+                      if inside and grid.passable[cell]]
+        start_edges = {cell: self.get_start_edges(cell, goal)
+                       for cell in starts}
+        # the goal edge is a single node of the abstract graph
+        goal_node = -1
+        g_scores = {}
+        parents = {}
+        frontier = []
+        for cell in starts:
+            g = 0 if cell == start_cell else 1
+            g_scores[cell] = g
+            parents[cell] = -1
+            frontier.append((g, g, cell))
+        while frontier:
+            f, g, node = heappop(frontier)
+            if g > g_scores[node]:
+                continue
+            stats['expanded'] += 1
+            if node == goal_node:
+                return self.refine(start_cell, parents, goal)
+            if node in start_edges:
+                edges, goal_cost = start_edges[node]
+            else:
+                cluster = self.get_cluster(node)
+                entrances = self.entrances[cluster]
+                count = len(entrances)
+                index = bisect_left(entrances, node)
+                costs = self.costs[cluster][index * count:
+                                            index * count + count]
+                edges = [(other, cost)
+                         for other, cost in zip(entrances, costs) if cost > 0]
+                edges.extend((other, 1) for other in self.get_crossings(node))
+                goal_costs = self.goal_costs[cluster]
+                goal_cost = None
+                if goal_costs is not None \
+                        and goal_costs[index * 4 + goal_index] >= 0:
+                    goal_cost = goal_costs[index * 4 + goal_index]
+            if goal_cost is not None \
+                    and g + goal_cost < g_scores.get(goal_node, self.infinity):
+                g_scores[goal_node] = g + goal_cost
+                parents[goal_node] = node
+                heappush(frontier, (g + goal_cost, g + goal_cost, goal_node))
+            for child, cost in edges:
+                child_g = g + cost
+                if child_g >= g_scores.get(child, self.infinity):
+                    continue
+                g_scores[child] = child_g
+                parents[child] = node
+                if by_row:
+                    heuristic = distances[child // width]
                 else:
-                    robot_commands.append('left')
-                    robot_commands.append('forward 1')
-                    robot_direction = 1
+                    heuristic = distances[child % width]
+                heappush(frontier, (child_g + heuristic - 1, child_g, child))
+        return None
+
+    def get_start_edges(self, cell: int, goal: str) \
+            -> tuple[list[tuple[int, int]], Optional[int]]:
+        """
+        Searches the edges of a start that need not be an entrance
+        :param int cell: Cell id of the start
+        :param str goal: Maze edge to arrive at
+        :return: Entrances the start reaches with their steps, and the steps
+        to the goal edge within the cluster of the start, None if it does
+        not reach the goal edge there
+        """
+        cluster = self.get_cluster(cell)
+        steps, _ = self.search_cluster(cell)
+        edges = [(entrance, steps[self.get_index(entrance)])
+                 for entrance in self.entrances[cluster]
+                 if entrance != cell and steps[self.get_index(entrance)] >= 0]
+        edges.extend((other, 1) for other in self.get_crossings(cell))
+        return edges, self.get_cluster_goal_costs(cluster, steps).get(goal)
+
+    def refine(self, start_cell: int, parents: dict[int, int], goal: str) \
+            -> list[tuple[int, int]]:
+        """
+        Turns the entrances chosen by the abstract search into a path of
+        coordinates, searching only the clusters the path passes through
+        :param int start_cell: Cell id of the start
+        :param dict[int, int] parents: Parent of every abstract node, -1 for
+        the start or the neighbours a blocked start steps onto, with the goal
+        edge stored under -1
+        :param str goal: Maze edge to arrive at
+        :return: List of coordinates
+        """
+        nodes = []
+        node = parents[-1]
+        while node >= 0:
+            nodes.append(node)
+            node = parents[node]
+        nodes.reverse()
+        path = [self.grid.position(start_cell)]
+        if nodes[0] != start_cell:
+            path.append(self.grid.position(nodes[0]))
+        for node, target in zip(nodes, nodes[1:] + [-1]):
+            if target in self.get_crossings(node):
+                path.append(self.grid.position(target))
+                continue
+            cluster = self.get_cluster(node)
+            steps, cluster_parents = self.search_cluster(node)
+            if target < 0:
+                end = min((index for index in
+                           self.get_goal_cells(cluster, goal)
+                           if steps[index] >= 0), key=steps.__getitem__)
             else:
-                if robot_direction == 0:
-                    robot_commands.append('left')
-                    robot_commands.append('forward 1')
-                    robot_direction = 3
-                elif robot_direction == 1:
-                    robot_commands.append('back 1')
-                elif robot_direction == 3:
-                    robot_commands.append('forward 1')
+                end = self.get_index(target)
+            path.extend(self.cluster_path(cluster, cluster_parents, end))
+        return path
+
+    def cluster_path(self, cluster: int, parents: array, index: int) \
+            -> list[tuple[int, int]]:
+        """
+        Follows the parent links of a search within a cluster back to its
+        start, leaving the start itself out
+        :param int cluster: Cluster id
+        :param array parents: Parent of every cell by its index within the
+        cluster
+        :param int index: Index within the cluster of the end of the path
+        :return: List of coordinates
+        """
+        x, y, cluster_width, _ = self.get_bounds(cluster)
+        path = []
+        while parents[index] >= 0:
+            path.append((self.grid.llx + x + index % cluster_width,
+                         self.grid.lly + y + index // cluster_width))
+            index = parents[index]
+        path.reverse()
+        return path
+
+
+def hierarchical_search(grid: MazeGrid, start: tuple[int, int], goal: str,
+                        stats: Optional[SearchStats] = None) \
+        -> Optional[list[tuple[int, int]]]:
+    """
+    Solves the maze with the cluster graph of the grid, built once per grid
+    :param MazeGrid grid: Passability grid of the maze
+    :param tuple[int, int] start: Starting x and y coordinate
+    :param str goal: Maze edge to arrive at
+    :param Optional[SearchStats] stats: Dictionary that receives the amount
+    of expanded abstract nodes under 'expanded'
+    :return: Path of coordinates, or None if the goal can not be reached
+    """
+    if grid.cluster_graph is None:
+        grid.cluster_graph = ClusterGraph(grid)
+    return grid.cluster_graph.search(start, goal, stats)
+
+
+# edge of the corridor graph: the node it leads to, its length in steps,
+# the direction it leaves in and the steps to the first goal cell on it for
+# every goal, -1 if it passes none
+CorridorEdge = tuple[int, int, int, tuple[int, int, int, int]]
+
+
+class CorridorGraph:
+    """
+    Contracted graph of a maze grid in which only the junctions and dead
+    ends are nodes. Every corridor of cells with exactly two open neighbours
+    between two nodes becomes a single weighted edge, and the corridor cells
+    are only walked again for the edges on the chosen path
+    """
+    grid: MazeGrid
+    neighbours: array
+    nodes: bytearray
+    goal_lines: list[tuple[array, bool]]
+    goal_masks: bytearray
+    edges: dict[int, list[CorridorEdge]]
+
+    def __init__(self, grid: MazeGrid) -> None:
+        """
+        Constructor for CorridorGraph, contracts every corridor of the grid
+        :param MazeGrid grid: Passability grid of the maze
+        """
+        self.grid = grid
+        self.neighbours = get_neighbour_cells(grid)
+        self.goal_lines = [get_goal_distances(grid, goal)
+                           for goal in goal_directions]
+        self.goal_masks = self.get_goal_masks()
+        neighbours = self.neighbours
+        passable = grid.passable
+        self.nodes = bytearray(len(passable))
+        for cell in range(len(passable)):
+            if passable[cell] \
+                    and neighbours[cell * 4:cell * 4 + 4].count(-1) != 2:
+                self.nodes[cell] = 1
+        self.edges = {}
+        for cell in range(len(passable)):
+            if self.nodes[cell]:
+                self.edges[cell] = self.walk_edges(cell)
+
+    def get_goal_masks(self) -> bytearray:
+        """
+        Marks the goal edges every cell lies on, one bit per goal in the
+        order of goal_directions
+        :return: Goal bits per cell id
+        """
+        width = self.grid.width
+        cells = len(self.grid.passable)
+        masks = bytearray(cells)
+        for goal, (distances, by_row) in enumerate(self.goal_lines):
+            for line, distance in enumerate(distances):
+                if distance > 1:
+                    continue
+                if by_row:
+                    goal_cells = range(line * width, line * width + width)
+                else:
+                    goal_cells = range(line, cells, width)
+                for cell in goal_cells:
+                    masks[cell] |= 1 << goal
+        return masks
+
+    def follow(self, previous: int, cell: int) -> int:
+        """
+        Returns the next cell of a corridor
+        :param int previous: Cell id the corridor was entered from
+        :param int cell: Cell id of the corridor cell
+        :return: Cell id of the first open neighbour that is not the previous
+        cell
+        """
+        for direction in range(4):
+            neighbour = self.neighbours[cell * 4 + direction]
+            if neighbour >= 0 and neighbour != previous:
+                return neighbour
+        return previous
+
+    def walk_edges(self, origin: int) -> list[CorridorEdge]:
+        """
+        Walks every corridor leaving a cell up to the node at its other end
+        :param int origin: Cell id to walk from
+        :return: List of edges
+        """
+        edges = []
+        # a blocked start is not part of the corridors around it, so it
+        # only steps onto its neighbours, which then walk their own edges
+        follow = self.grid.passable[origin]
+        for direction in range(4):
+            cell = self.neighbours[origin * 4 + direction]
+            if cell < 0:
+                continue
+            previous = origin
+            steps = 1
+            goal_steps = [-1, -1, -1, -1]
+            while True:
+                if self.goal_masks[cell]:
+                    for goal in range(4):
+                        if self.goal_masks[cell] >> goal & 1 \
+                                and goal_steps[goal] < 0:
+                            goal_steps[goal] = steps
+                if not follow or self.nodes[cell] or cell == origin:
+                    break
+                previous, cell = cell, self.follow(previous, cell)
+                steps += 1
+            edges.append((cell, steps, direction, tuple(goal_steps)))
+        return edges
+
+    def get_edges(self, cell: int) -> list[CorridorEdge]:
+        """
+        Returns the edges of a node, or walks them for a cell that lies
+        inside a corridor, such as the start
+        :param int cell: Cell id
+        :return: List of edges
+        """
+        if cell in self.edges:
+            return self.edges[cell]
+        return self.walk_edges(cell)
+
+    def search(self, start: tuple[int, int], goal: str,
+               stats: Optional[SearchStats] = None) \
+            -> Optional[list[tuple[int, int]]]:
+        """
+        Astar over the nodes of the contracted graph. A goal cell inside a
+        corridor is reached through the edge that passes it
+        :param tuple[int, int] start: Starting x and y coordinate
+        :param str goal: Maze edge to arrive at
+        :param Optional[SearchStats] stats: Dictionary that receives the
+        amount of expanded nodes under 'expanded'
+        :return: Path of coordinates, or None if the goal can not be reached
+        """
+        grid = self.grid
+        if not (grid.llx <= start[0] <= grid.urx
+                and grid.lly <= start[1] <= grid.ury):
+            return None
+        if stats is None:
+            stats = {}
+        stats['expanded'] = 0
+        width = grid.width
+        goal_index = goal_directions[goal]
+        distances, by_row = self.goal_lines[goal_index]
+        start_cell = grid.cell_id(*start)
+        if distances[start_cell // width if by_row
+                     else start_cell % width] <= 1:
+            return [start]
+        # the goal edge is a single node of the search
+        goal_node = -1
+        g_scores = {start_cell: 0}
+        parents = {start_cell: (-1, -1, 0)}
+        frontier = [(0, 0, start_cell)]
+        while frontier:
+            f, g, node = heappop(frontier)
+            if g > g_scores[node]:
+                continue
+            stats['expanded'] += 1
+            if node == goal_node:
+                return self.expand_path(start_cell, parents)
+            for child, steps, direction, goal_steps in self.get_edges(node):
+                if goal_steps[goal_index] >= 0:
+                    child, steps = goal_node, goal_steps[goal_index]
+                    heuristic = 0
+                elif by_row:
+                    heuristic = distances[child // width] - 1
                 else:
-                    robot_commands.append('right')
-                    robot_commands.append('forward 1')
-                    robot_direction = 3
-    return robot_commands
-
-
-def simplify_robot_commands(robot_commands: list[str]) -> list[str]:
-    """
-    Returns a list of simplified robot commands
-    :param robot_commands: List of robot commands
-    :return: A list of simplified robot commands
-    """
-    robot_commands.append('end')
-    simplified_robot_command_list: list[str] = []
-    for i, _ in enumerate(robot_commands):
-        if robot_commands[i] == 'forward 1':
-            c = i
-            while robot_commands[i] == 'forward 1':
-                robot_commands.pop(i)
-                c += 1
-            simplified_robot_command_list.append(f'forward {c - i}')
-        if robot_commands[i] == 'back 1':
-            c = i
-            while robot_commands[i] == 'back 1':
-                robot_commands.pop(i)
-                c += 1
-            simplified_robot_command_list.append(f'back {c - i}')
-        if robot_commands[i] in ['left', 'right']:
-            simplified_robot_command_list.append(robot_commands[i])
-    return simplified_robot_command_list
+                    heuristic = distances[child % width] - 1
+                child_g = g + steps
+                if child in g_scores and g_scores[child] <= child_g:
+                    continue
+                g_scores[child] = child_g
+                parents[child] = (node, direction, steps)
+                heappush(frontier, (child_g + heuristic, child_g, child))
+        return None
+
+    def expand_path(self, start_cell: int,
+                    parents: dict[int, tuple[int, int, int]]) \
+            -> list[tuple[int, int]]:
+        """
+        Walks the corridors of the chosen edges back into a path of
+        coordinates
+        :param int start_cell: Cell id of the start
+        :param dict[int, tuple[int, int, int]] parents: Parent node,
+        direction and steps of the edge that reached every node, with the
+        goal edge stored under -1
+        :return: List of coordinates
+        """
+        hops = []
+        node = -1
+        while node != start_cell:
+            parent, direction, steps = parents[node]
+            hops.append((parent, direction, steps))
+            node = parent
+        hops.reverse()
+        path = [self.grid.position(start_cell)]
+        for node, direction, steps in hops:
+            previous = node
+            cell = self.neighbours[node * 4 + direction]
+            path.append(self.grid.position(cell))
+            for _ in range(steps - 1):
+                previous, cell = cell, self.follow(previous, cell)
+                path.append(self.grid.position(cell))
+        return path
+
+
+def corridor_search(grid: MazeGrid, start: tuple[int, int], goal: str,
+                    stats: Optional[SearchStats] = None) \
+        -> Optional[list[tuple[int, int]]]:
+    """
+    Solves the maze on the corridor graph of the grid, built once per grid
+    :param MazeGrid grid: Passability grid of the maze
+    :param tuple[int, int] start: Starting x and y coordinate
+    :param str goal: Maze edge to arrive at
+    :param Optional[SearchStats] stats: Dictionary that receives the amount
+    of expanded graph nodes under 'expanded'
+    :return: Path of coordinates, or None if the goal can not be reached
+    """
+    if grid.corridor_graph is None:
+        grid.corridor_graph = CorridorGraph(grid)
+    return grid.corridor_graph.search(start, goal, stats)
+
+
+def path_to_waypoints(path: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Reduces a path to its waypoints: the start, every coordinate where the
+    path turns and the end
+    :param list[tuple[int, int]] path: Path of coordinates joined by straight
+    lines
+    :return: List of waypoints
+    """
+    waypoints = path[:1]
+    for i in range(1, len(path) - 1):
+        (x1, y1), (x2, y2), (x3, y3) = path[i - 1], path[i], path[i + 1]
+        if (x2 - x1) * (y3 - y2) != (y2 - y1) * (x3 - x2) \
+                or (x2 - x1) * (x3 - x2) + (y2 - y1) * (y3 - y2) < 0:
+            waypoints.append(path[i])
+    if len(path) > 1:
+        waypoints.append(path[-1])
+    return waypoints
+
+
+def waypoints_to_robot_commands(waypoints: list[tuple[int, int]],
+                                robot_direction: int) -> Iterator[str]:
+    """
+    Yields the simplified commands that make the robot follow the straight
+    lines between waypoints, one move or turn per line
+    :param list[tuple[int, int]] waypoints: Waypoints of the path
+    :param int robot_direction: Direction index of the robot
+    :return: Iterator of simplified robot commands
+    """
+    move_direction = -1
+    steps = 0
+    for (x1, y1), (x2, y2) in zip(waypoints, waypoints[1:]):
+        if x1 == x2:
+            direction = 0 if y2 > y1 else 2
+        else:
+            direction = 1 if x2 > x1 else 3
+        if direction != move_direction and steps:
+            yield from move_robot(move_direction, steps, robot_direction)
+            robot_direction = turn_robot(move_direction, robot_direction)
+            steps = 0
+        move_direction = direction
+        steps += abs(x2 - x1) + abs(y2 - y1)
+    if steps:
+        yield from move_robot(move_direction, steps, robot_direction)
+
+
+def turn_robot(move_direction: int, robot_direction: int) -> int:
+    """
+    Returns the direction the robot faces after moving in a direction, which
+    only changes when it had to turn to move sideways
+    :param int move_direction: Direction index to move in
+    :param int robot_direction: Direction index of the robot
+    :return: Direction index of the robot after the move
+    """
+    if (move_direction - robot_direction) % 2:
+        return move_direction
+    return robot_direction
+
+
+def move_robot(move_direction: int, steps: int, robot_direction: int) \
+        -> Iterator[str]:
+    """
+    Yields the commands that move the robot a number of steps in a direction
+    :param int move_direction: Direction index to move in
+    :param int steps: Amount of steps
+    :param int robot_direction: Direction index of the robot
+    :return: Iterator of robot commands
+    """
+    turn = (move_direction - robot_direction) % 4
+    if turn == 2:
+        yield f'back {steps}'
+        return
+    if turn == 1:
+        yield 'right'
+    elif turn == 3:
+        yield 'left'
+    yield f'forward {steps}'
+
+
+def solve_astar(grid: MazeGrid, start: tuple[int, int], goal: str,
+                stats: Optional[SearchStats] = None) \
+        -> Optional[list[tuple[int, int]]]:
+    """
+    Solves the maze with the node based astar algorithm
+    :param MazeGrid grid: Passability grid of the maze
+    :param tuple[int, int] start: Starting x and y coordinate
+    :param str goal: Maze edge to arrive at
+    :param Optional[SearchStats] stats: Dictionary that receives the amount
+    of expanded nodes under 'expanded'
+    :return: Path of coordinates, or None if the goal can not be reached
+    """
+    return astar(start, goal_checks[goal], get_adjacent_coordinates,
+                 goal_distances[goal], stats=stats)
+
+
+def solve_bucket_astar(grid: MazeGrid, start: tuple[int, int], goal: str,
+                       stats: Optional[SearchStats] = None) \
+        -> Optional[list[tuple[int, int]]]:
+    """
+    Solves the maze with the node based astar algorithm, keeping the
+    frontier in a bucket queue instead of a binary heap
+    :param MazeGrid grid: Passability grid of the maze
+    :param tuple[int, int] start: Starting x and y coordinate
+    :param str goal: Maze edge to arrive at
+    :param Optional[SearchStats] stats: Dictionary that receives the amount
+    of expanded nodes under 'expanded'
+    :return: Path of coordinates, or None if the goal can not be reached
+    """
+    return astar(start, goal_checks[goal], get_adjacent_coordinates,
+                 goal_distances[goal], BucketQueue, stats)
+
+
+# goal checks and distance functions of every maze edge
+goal_checks = {
+    'top': check_top_edge,
+    'bottom': check_bottom_edge,
+    'right': check_right_edge,
+    'left': check_left_edge,
+}
+goal_distances = {
+    'top': get_distance_top_edge,
+    'bottom': get_distance_bottom_edge,
+    'right': get_distance_right_edge,
+    'left': get_distance_left_edge,
+}
+
+# search engines that solve a maze grid from a start to a goal edge, by name
+search_engines: dict[str, Callable[[MazeGrid, tuple[int, int], str],
+                                   Optional[list[tuple[int, int]]]]] = {
+    'astar': solve_astar,
+    'bucket_astar': solve_bucket_astar,
+    'array_astar': array_astar,
+    'distance_field': walk_distance_field,
+    'jump_point': jump_point_search,
+    'fewest_commands': turn_aware_search,
+    'bidirectional': bidirectional_search,
+    'incremental': incremental_search,
+    'hierarchical': hierarchical_search,
+    'corridor': corridor_search,
+}
+
+# engines that find the waypoints of a path without visiting every
+# coordinate on it, by name
+waypoint_engines: dict[str, Callable[[MazeGrid, tuple[int, int], str],
+                                     Optional[list[tuple[int, int]]]]] = {
+    'jump_point': jump_point_waypoints,
+}
+
+
+def set_maze_bounds(llx: int, lly: int, urx: int, ury: int) -> MazeGrid:
+    """
+    Sets the edges of the maze and returns its passability grid
+    :param int llx: Lower left x coordinate
+    :param int lly: Lower left y coordinate
+    :param int urx: Upper right x coordinate
+    :param int ury: Upper right y coordinate
+    :return: MazeGrid object
+    """
+    global top_edge, bottom_edge, right_edge, left_edge
+    top_edge = ury
+    bottom_edge = lly
+    right_edge = urx
+    left_edge = llx
+    return get_maze_grid(llx, lly, urx, ury)
+
+
+def solve_waypoints(grid: MazeGrid, start: tuple[int, int],
+                    start_direction: int, goal: str, engine: str) \
+        -> list[tuple[int, int]]:
+    """
+    Solves the maze grid with a search engine and returns the waypoints of
+    the path
+    :param MazeGrid grid: Passability grid of the maze
+    :param tuple[int, int] start: Starting x and y coordinate
+    :param int start_direction: Starting direction index
+    :param str goal: Maze edge to arrive at
+    :param str engine: Name of the search engine that solves the maze
+    :return: List of waypoints, empty if the goal is unknown or can not be
+    reached
+    """
+    global run_direction
+    run_direction = start_direction
+    if goal not in goal_checks:
+        return []
+    if engine in waypoint_engines:
+        return waypoint_engines[engine](grid, start, goal) or []
+    path = search_engines[engine](grid, start, goal)
+    return path_to_waypoints(path) if path else []
+
+
+def maze_solution(start_x: int, start_y: int, start_direction: int,
+                  llx, lly, urx, ury, goal: str, engine: str = 'astar') \
+        -> tuple[list[tuple[int, int]], list[str]]:
+    """
+    Solves the maze and returns both the waypoints of the path and the robot
+    commands that follow it, from the solution cache when possible
+    :param int start_x: Starting x position
+    :param int start_y: Starting y position
+    :param int start_direction: Starting direction index
+    :param int llx: Lower left x coordinate
+    :param int lly: Lower left y coordinate
+    :param int urx: Upper right x coordinate
+    :param int ury: Upper right y coordinate
+    :param str goal: Maze edge to arrive at
+    :param str engine: Name of the search engine that solves the maze
+    :return: List of waypoints and list of robot commands
+    """
+    global solution_cache_version, cache_hits, cache_misses
+    version = obstacles.get_index_version()
+    if version != solution_cache_version:
+        solution_cache.clear()
+        solution_cache_version = version
+    key = (version, llx, lly, urx, ury, start_x, start_y, start_direction,
+           goal, engine)
+    if key in solution_cache:
+        cache_hits += 1
+        solution_cache.move_to_end(key)
+        waypoints, robot_commands = solution_cache[key]
+        return list(waypoints), list(robot_commands)
+    cache_misses += 1
+
+    grid = set_maze_bounds(llx, lly, urx, ury)
+    waypoints = solve_waypoints(grid, (start_x, start_y), start_direction,
+                                goal, engine)
+    robot_commands = list(waypoints_to_robot_commands(waypoints,
+                                                      start_direction))
+    solution_cache[key] = (waypoints, robot_commands)
+    if len(solution_cache) > solution_cache_size:
+        solution_cache.popitem(last=False)
+    return list(waypoints), list(robot_commands)
 
 
 def maze_run(start_x: int, start_y: int, start_direction: int,
-             llx, lly, urx, ury, goal: str) -> list[str]:
+             llx, lly, urx, ury, goal: str, engine: str = 'astar') \
+        -> list[str]:
     """
     Handler for the maze solving algorithm
     :param int start_x: Starting x position
@@ -348,34 +2353,19 @@ def maze_run(start_x: int, start_y: int, start_direction: int,
     :param int urx: Lower left y coordinate
     :param int ury: Upper y coordinate
     :param str goal: Maze edge we with to arrive at
+    :param str engine: Name of the search engine that solves the maze
     :return: List of robot commands
     """
-    global top_edge, bottom_edge, right_edge, left_edge
-    top_edge = ury
-    bottom_edge = lly
-    right_edge = urx
-    left_edge = llx
-    path: list[tuple[int, int]] = []
-    get_obstacle_coordinates()
-    if goal == 'top':
-        path = astar(
-            (start_x, start_y), check_top_edge,
-            get_adjacent_coordinates, get_distance_top_edge
-        )
-    elif goal == 'bottom':
-        path = astar(
-            (start_x, start_y), check_bottom_edge,
-            get_adjacent_coordinates, get_distance_bottom_edge
-        )
-    elif goal == 'right':
-        path = astar(
-            (start_x, start_y), check_right_edge,
-            get_adjacent_coordinates, get_distance_right_edge
-        )
-    elif goal == 'left':
-        path = astar(
-            (start_x, start_y), check_left_edge,
-            get_adjacent_coordinates, get_distance_left_edge
-        )
-    robot_commands = path_to_robot_commands(path, start_direction)
-    return simplify_robot_commands(robot_commands)
+    return maze_solution(start_x, start_y, start_direction, llx, lly, urx,
+                         ury, goal, engine)[1]
+
+
+def clear_solution_cache() -> None:
+    """
+    Empties the solution cache and resets its hit and miss counters
+    :return: None
+    """
+    global cache_hits, cache_misses
+    solution_cache.clear()
+    cache_hits = 0
+    cache_misses = 0
@@ -1,6 +1,78 @@
 import random
+from bisect import bisect_left
+from typing import Callable, Optional, Union
 
-obstacles: list[tuple[tuple[int, int]]] = []
+from maze.raster import OccupancyRaster
+from maze.rectangle import Rectangle
+from maze.wall_runs import WallRuns
+
+Obstacle = Union[tuple[tuple[int, int]], Rectangle, OccupancyRaster,
+                 WallRuns]
+
+
+def count_edit(method: Callable) -> Callable:
+    """
+    Wraps a list method so that it increments the version of the list
+    :param Callable method: Method of list that edits the list
+    :return: Wrapped method
+    """
+    def edit(self: 'ObstacleList', *args, **kwargs) -> object:
+        self.version += 1
+        return method(self, *args, **kwargs)
+    return edit
+
+
+class ObstacleList(list):
+    """
+    List of obstacles that counts its edits, so the occupancy index can tell
+    that it changed without looking at every obstacle
+    """
+    version: int = 0
+    __setitem__ = count_edit(list.__setitem__)
+    __delitem__ = count_edit(list.__delitem__)
+    __iadd__ = count_edit(list.__iadd__)
+    __imul__ = count_edit(list.__imul__)
+    append = count_edit(list.append)
+    extend = count_edit(list.extend)
+    insert = count_edit(list.insert)
+    pop = count_edit(list.pop)
+    remove = count_edit(list.remove)
+    clear = count_edit(list.clear)
+    sort = count_edit(list.sort)
+    reverse = count_edit(list.reverse)
+
+
+obstacles: list[Obstacle] = ObstacleList()
+
+# occupancy index of every blocked position, rebuilt whenever the obstacles
+# list is regenerated
+blocked_positions: set[tuple[int, int]] = set()
+# sorted x coordinates of blocked positions per row and sorted y coordinates
+# of blocked positions per column
+blocked_rows: dict[int, list[int]] = {}
+blocked_columns: dict[int, list[int]] = {}
+# rectangle obstacles are checked arithmetically instead of by their points
+blocked_rectangles: list[Rectangle] = []
+# raster and wall run obstacles, such as compiled or run-length mazes, answer
+# their own queries
+blocked_structures: list[Union[OccupancyRaster, WallRuns]] = []
+# optional bit-packed raster that replaces the index above when every
+# obstacle falls within the raster bounds
+raster_bounds: Optional[tuple[int, int, int, int]] = None
+raster: Optional[OccupancyRaster] = None
+# obstacles list the index was built from, with its version and the edit
+# counts of the rectangles and rasters at that time, compared on every query
+# so that replacing, editing or changing an obstacle in place is noticed
+indexed_obstacles: Optional[ObstacleList] = None
+indexed_edits: tuple[int, int, int] = (0, 0, 0)
+# incremented on every rebuild, so derived structures can tell when the
+# obstacles changed
+index_version = 0
+
+# spatial hash of the square obstacles being placed, bucketed by the lower
+# left corner of each square
+placement_grid: dict[tuple[int, int], list[Rectangle]] = {}
+placement_bucket_size = 5
 
 
 def create_square_obstacle(
@@ -9,34 +81,31 @@ def create_square_obstacle(
         urx: int,
         ury: int,
         size: int = 5,
-        amount: int = 10
+        amount: int = 10,
+        attempts: int = 10
 ) -> None:
     """
-    Creates a square obstacle by storing coordinate points for the perimeter
+    Creates square obstacles as rectangles with the given size
     :param int llx: Lower left x coordinate
     :param int lly: Upper x coordinate
     :param int urx: Lower left y coordinate
     :param int ury: Upper y coordinate
     :param int size: Size of the obstacle
     :param int amount: Amount of square obstacles that can be created
+    :param int attempts: Amount of random positions tried for each obstacle
     :return: None
     """
     global obstacles
-    obstacles = []
+    obstacles = ObstacleList()
+    reset_placement_grid(size)
     for _ in range(random.randint(0, amount)):
-        random_x, random_y = get_random_coordinates(llx, lly, urx, ury, size)
+        random_x, random_y = get_random_coordinates(llx, lly, urx, ury, size,
+                                                    attempts)
         if random_x == random_y == 0:
             continue
-        square_obstacle = [(random_x, random_y)]
-        for i in range(1, size):
-            square_obstacle.append((random_x, random_y + i))
-        for i in range(1, size):
-            square_obstacle.append((random_x + i, random_y))
-        for i in range(1, size - 1):
-            square_obstacle.append((random_x + i, random_y + size - 1))
-        for i in range(1, size):
-            square_obstacle.append((random_x + size - 1, random_y + i))
-        obstacles.append(tuple(square_obstacle))
+        obstacles.append(Rectangle(random_x, random_y, size, size))
+        add_to_placement_grid(obstacles[-1])
+    update_obstacle_index()
 
 
 def get_random_coordinates(
@@ -44,7 +113,8 @@ def get_random_coordinates(
         lly: int,
         urx: int,
         ury: int,
-        size: int = 5
+        size: int = 5,
+        attempts: int = 10
 ) -> tuple[int, int]:
     """
     Returns a set of cartesian coordinates
@@ -53,11 +123,12 @@ def get_random_coordinates(
     :param int urx: Lower left y coordinate
     :param int ury: Upper y coordinate
     :param int size: Size of the obstacle
+    :param int attempts: Amount of random positions to try
     :return: x coordinate and y coordinate
     """
     counter = 0
     while True:
-        if counter == 10:
+        if counter == attempts:
             return 0, 0
         random_x = get_random_x_coordinate(llx, urx, size)
         random_y = get_random_y_coordinate(lly, ury, size)
@@ -75,43 +146,80 @@ def is_invalid_coordinates(x_coordinate: int, y_coordinate: int, size: int) \
     :param int size: Size of the obstacle
     :return: Boolean value
     """
-    global obstacles
-    boolean_values = []
     if check_coordinates_overlap_origin(x_coordinate, y_coordinate, size):
         return True
-    if obstacles:
-        for obstacle in obstacles:
-            boolean_values.append(
-                check_x_coordinate_overlap(x_coordinate, obstacle, size) and
-                check_y_coordinate_overlap(y_coordinate, obstacle, size))
-    return any(boolean_values)
+    for obstacle in get_nearby_obstacles(x_coordinate, y_coordinate, size):
+        if check_x_coordinate_overlap(x_coordinate, obstacle, size) and \
+                check_y_coordinate_overlap(y_coordinate, obstacle, size):
+            return True
+    return False
 
 
-def check_x_coordinate_overlap(x_coordinate: int,
-                               obstacle: tuple[tuple[int, int]], size: int) \
-        -> bool:
+def reset_placement_grid(size: int) -> None:
+    """
+    Empties the spatial hash used to place square obstacles
+    :param int size: Size of the obstacles that will be placed
+    :return: None
+    """
+    global placement_grid, placement_bucket_size
+    placement_grid = {}
+    placement_bucket_size = max(size, 1)
+
+
+def add_to_placement_grid(obstacle: Rectangle) -> None:
+    """
+    Adds a square obstacle to the bucket of its lower left corner
+    :param Rectangle obstacle: An obstacle
+    :return: None
+    """
+    bucket = (obstacle.llx // placement_bucket_size,
+              obstacle.lly // placement_bucket_size)
+    placement_grid.setdefault(bucket, []).append(obstacle)
+
+
+def get_nearby_obstacles(x_coordinate: int, y_coordinate: int, size: int) \
+        -> list[Rectangle]:
+    """
+    Returns the placed obstacles whose buckets are close enough to overlap a
+    square of the given size at the coordinates
+    :param int x_coordinate: x coordinate
+    :param int y_coordinate: y coordinate
+    :param int size: Size of the obstacle
+    :return: List of nearby obstacles
+    """
+    reach = -(-size // placement_bucket_size)
+    bucket_x = x_coordinate // placement_bucket_size
+    bucket_y = y_coordinate // placement_bucket_size
+    nearby_obstacles = []
+    for i in range(bucket_x - reach, bucket_x + reach + 1):
+        for j in range(bucket_y - reach, bucket_y + reach + 1):
+            nearby_obstacles.extend(placement_grid.get((i, j), ()))
+    return nearby_obstacles
+
+
+def check_x_coordinate_overlap(x_coordinate: int, obstacle: Rectangle,
+                               size: int) -> bool:
     """
     Checks if the x coordinate overlaps with an existing obstacle
     :param int x_coordinate: x coordinate
-    :param tuple[tuple[int, int]] obstacle: An obstacle
+    :param Rectangle obstacle: An obstacle
     :param int size: Size of the obstacle
     :return: Boolean value
     """
-    return obstacle[0][0] - (size - 1) <= x_coordinate <= obstacle[0][0] + (
+    return obstacle.llx - (size - 1) <= x_coordinate <= obstacle.llx + (
         size - 1)
 
 
-def check_y_coordinate_overlap(y_coordinate: int,
-                               obstacle: tuple[tuple[int, int]], size: int) \
-        -> bool:
+def check_y_coordinate_overlap(y_coordinate: int, obstacle: Rectangle,
+                               size: int) -> bool:
     """
     Checks if the y coordinate overlaps with an existing obstacle
     :param int y_coordinate: y coordinate
-    :param tuple[tuple[int, int]] obstacle: An obstacle
+    :param Rectangle obstacle: An obstacle
     :param int size: Size of the obstacle
     :return: Boolean value
     """
-    return obstacle[0][1] - size <= y_coordinate <= obstacle[0][1] + (
+    return obstacle.lly - size <= y_coordinate <= obstacle.lly + (
         size - 1)
 
 
@@ -175,6 +283,101 @@ def get_random_y_coordinate(lly: int, ury: int, size: int) -> int:
     return random.randint(lly, ury - size - 1)
 
 
+def update_obstacle_index() -> None:
+    """
+    Rebuilds the occupancy index from the current list of obstacles
+    :return: None
+    """
+    global obstacles, blocked_positions, blocked_rows, blocked_columns, \
+        blocked_rectangles, blocked_structures, raster, indexed_obstacles, \
+        indexed_edits, index_version
+    if not isinstance(obstacles, ObstacleList):
+        obstacles = ObstacleList(obstacles)
+    index_version += 1
+    indexed_obstacles = obstacles
+    indexed_edits = get_edit_counts()
+    blocked_positions = set()
+    blocked_rows = {}
+    blocked_columns = {}
+    blocked_rectangles = []
+    blocked_structures = []
+    raster = None
+    if raster_bounds is not None:
+        if len(obstacles) == 1 and isinstance(obstacles[0], OccupancyRaster) \
+                and (obstacles[0].llx, obstacles[0].lly, obstacles[0].urx,
+                     obstacles[0].ury) == raster_bounds:
+            raster = obstacles[0]
+            return
+        try:
+            raster = OccupancyRaster.from_positions(
+                (position for obstacle in obstacles for position in obstacle),
+                *raster_bounds)
+            return
+        except ValueError:
+            raster = None
+    for obstacle in obstacles:
+        if isinstance(obstacle, Rectangle):
+            blocked_rectangles.append(obstacle)
+        elif isinstance(obstacle, (OccupancyRaster, WallRuns)):
+            blocked_structures.append(obstacle)
+        else:
+            blocked_positions.update(obstacle)
+    for x, y in blocked_positions:
+        blocked_rows.setdefault(y, []).append(x)
+        blocked_columns.setdefault(x, []).append(y)
+    for row in blocked_rows.values():
+        row.sort()
+    for column in blocked_columns.values():
+        column.sort()
+
+
+def use_occupancy_raster(
+        bounds: Optional[tuple[int, int, int, int]]) -> None:
+    """
+    Switches the occupancy index to a bit-packed raster covering the given
+    bounds, or back to the hashed index when bounds is None. The hashed index
+    is still used if an obstacle falls outside the bounds
+    :param Optional[tuple[int, int, int, int]] bounds: Lower left x, lower
+    left y, upper right x and upper right y coordinates
+    :return: None
+    """
+    global raster_bounds
+    raster_bounds = bounds
+    update_obstacle_index()
+
+
+def get_edit_counts() -> tuple[int, int, int]:
+    """
+    Returns the version of the obstacles list and the edit counts of all
+    rectangles and rasters
+    :return: Tuple of the three counts
+    """
+    return obstacles.version, Rectangle.edit_count, \
+        OccupancyRaster.edit_count
+
+
+def check_obstacle_index() -> None:
+    """
+    Rebuilds the occupancy index if the obstacles changed since the index
+    was last built, whether the list was replaced, edited or an obstacle
+    was changed in place
+    :return: None
+    """
+    if obstacles is not indexed_obstacles \
+            or indexed_edits != get_edit_counts():
+        update_obstacle_index()
+
+
+def get_index_version() -> int:
+    """
+    Returns the version of the occupancy index, rebuilding the index first
+    if the obstacles changed
+    :return: Version of the occupancy index
+    """
+    check_obstacle_index()
+    return index_version
+
+
 def is_position_blocked(x: int, y: int) -> bool:
     """
     Returns True if position (x,y) falls on an obstacle
@@ -182,8 +385,14 @@ def is_position_blocked(x: int, y: int) -> bool:
     :param int y: y Coordinate
     :return: Boolean value
     """
-    boolean_values = [(x, y) in obstacle for obstacle in obstacles]
-    return any(boolean_values)
+    check_obstacle_index()
+    if raster is not None:
+        return raster.is_blocked(x, y)
+    if (x, y) in blocked_positions:
+        return True
+    if any(structure.is_blocked(x, y) for structure in blocked_structures):
+        return True
+    return any((x, y) in rectangle for rectangle in blocked_rectangles)
 
 
 def is_path_blocked(x1: int, y1: int, x2: int, y2: int) -> bool:
@@ -196,16 +405,68 @@ def is_path_blocked(x1: int, y1: int, x2: int, y2: int) -> bool:
     :param int y2: y Coordinate of position 2
     :return: Boolean value
     """
-    for obstacle in obstacles:
-        for position in obstacle:
-            if x1 == x2:
-                step = 1 if y1 <= y2 else -1
-                if position[0] == x1 and position[1] in range(y1, y2 + step,
-                                                              step):
-                    return True
-            if y1 == y2:
-                step = 1 if x1 <= x2 else -1
-                if position[1] == y1 and position[0] in range(x1, x2 + step,
-                                                              step):
-                    return True
-    return False
+    check_obstacle_index()
+    if raster is not None:
+        return raster.is_path_blocked(x1, y1, x2, y2)
+    if x1 == x2 and is_segment_blocked(blocked_columns.get(x1), y1, y2):
+        return True
+    if y1 == y2 and is_segment_blocked(blocked_rows.get(y1), x1, x2):
+        return True
+    if any(structure.is_path_blocked(x1, y1, x2, y2)
+           for structure in blocked_structures):
+        return True
+    return any(rectangle.is_path_blocked(x1, y1, x2, y2)
+               for rectangle in blocked_rectangles)
+
+
+def is_segment_blocked(coordinates: Optional[list[int]], start: int,
+                       end: int) -> bool:
+    """
+    Returns True if any of the sorted blocked coordinates falls between start
+    and end, inclusive
+    :param Optional[list[int]] coordinates: Sorted blocked coordinates of a
+    row or column
+    :param int start: Coordinate where the segment starts
+    :param int end: Coordinate where the segment ends
+    :return: Boolean value
+    """
+    if not coordinates:
+        return False
+    low, high = min(start, end), max(start, end)
+    i = bisect_left(coordinates, low)
+    return i < len(coordinates) and coordinates[i] <= high
+
+
+def are_paths_blocked(segments: list[tuple[int, int, int, int]]) \
+        -> list[bool]:
+    """
+    Checks a batch of axis-aligned lines at once, returning for every
+    (x1, y1, x2, y2) segment whether an obstacle lies on it. The occupancy
+    index is validated once and every rectangle is visited a single time for
+    the whole batch
+    :param list[tuple[int, int, int, int]] segments: Coordinates of the start
+    and end position of every line
+    :return: List of boolean values in the order of the segments
+    """
+    check_obstacle_index()
+    if raster is not None:
+        return [raster.is_path_blocked(*segment) for segment in segments]
+    blocked = []
+    for x1, y1, x2, y2 in segments:
+        blocked.append(
+            (x1 == x2 and is_segment_blocked(blocked_columns.get(x1), y1, y2))
+            or (y1 == y2 and is_segment_blocked(blocked_rows.get(y1), x1, x2))
+            or any(structure.is_path_blocked(x1, y1, x2, y2)
+                   for structure in blocked_structures))
+    unchecked = [i for i, is_blocked in enumerate(blocked) if not is_blocked]
+    for rectangle in blocked_rectangles:
+        if not unchecked:
+            break
+        still_unchecked = []
+        for i in unchecked:
+            if rectangle.is_path_blocked(*segments[i]):
+                blocked[i] = True
+            else:
+                still_unchecked.append(i)
+        unchecked = still_unchecked
+    return blocked
@@ -0,0 +1,222 @@
+from __future__ import annotations
+from typing import ClassVar, Iterable, Iterator, Optional, Union
+
+
+class OccupancyRaster:
+    """
+    Bit-packed occupancy grid covering a rectangular area, where every cell
+    takes up a single bit that is set when the cell is blocked
+    """
+    llx: int
+    lly: int
+    urx: int
+    ury: int
+    width: int
+    height: int
+    row_bytes: int
+    # counts the block and unblock calls of every raster, so an index built
+    # from a raster can tell that it was edited in place
+    edit_count: ClassVar[int] = 0
+
+    def __init__(self, llx: int, lly: int, urx: int, ury: int,
+                 bits: Optional[Union[bytearray, memoryview]] = None) \
+            -> None:
+        """
+        Constructor for OccupancyRaster
+        :param int llx: Lower left x coordinate
+        :param int lly: Lower left y coordinate
+        :param int urx: Upper right x coordinate
+        :param int ury: Upper right y coordinate
+        :param Optional[Union[bytearray, memoryview]] bits: Existing packed
+        rows to wrap, a new empty raster is created when omitted
+        """
+        self.llx = llx
+        self.lly = lly
+        self.urx = urx
+        self.ury = ury
+        self.width = urx - llx + 1
+        self.height = ury - lly + 1
+        self.row_bytes = (self.width + 7) // 8
+        if bits is None:
+            bits = bytearray(self.row_bytes * self.height)
+        elif len(bits) < self.row_bytes * self.height:
+            raise ValueError('Raster data is too small for its bounds')
+        self.bits = bits
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[tuple[int, int]], llx: int,
+                       lly: int, urx: int, ury: int) -> OccupancyRaster:
+        """
+        Creates a raster with the given positions blocked
+        :param Iterable[tuple[int, int]] positions: Blocked positions
+        :param int llx: Lower left x coordinate
+        :param int lly: Lower left y coordinate
+        :param int urx: Upper right x coordinate
+        :param int ury: Upper right y coordinate
+        :return: OccupancyRaster object
+        """
+        raster = cls(llx, lly, urx, ury)
+        bits = raster.bits
+        row_bytes = raster.row_bytes
+        for x, y in positions:
+            if not (llx <= x <= urx and lly <= y <= ury):
+                raise ValueError(f'Position {x},{y} is outside the raster')
+            column = x - llx
+            bits[(y - lly) * row_bytes + (column >> 3)] |= 1 << (column & 7)
+        return raster
+
+    def contains_cell(self, x: int, y: int) -> bool:
+        """
+        Checks if the position falls within the bounds of the raster
+        :param int x: x coordinate
+        :param int y: y coordinate
+        :return: Boolean value
+        """
+        return self.llx <= x <= self.urx and self.lly <= y <= self.ury
+
+    def block(self, x: int, y: int) -> None:
+        """
+        Marks the position as blocked
+        :param int x: x coordinate
+        :param int y: y coordinate
+        :return: None
+        """
+        if not self.contains_cell(x, y):
+            raise ValueError(f'Position {x},{y} is outside the raster')
+        column = x - self.llx
+        self.bits[(y - self.lly) * self.row_bytes + (column >> 3)] \
+            |= 1 << (column & 7)
+        OccupancyRaster.edit_count += 1
+
+    def is_blocked(self, x: int, y: int) -> bool:
+        """
+        Returns True if the position is blocked, positions outside the raster
+        are never blocked
+        :param int x: x coordinate
+        :param int y: y coordinate
+        :return: Boolean value
+        """
+        if not self.contains_cell(x, y):
+            return False
+        column = x - self.llx
+        return self.bits[(y - self.lly) * self.row_bytes + (column >> 3)] \
+            >> (column & 7) & 1 == 1
+
+    def __contains__(self, position: tuple[int, int]) -> bool:
+        """
+        Membership test, matching the point tuples used for obstacles
+        :param tuple[int, int] position: x and y coordinate
+        :return: Boolean value
+        """
+        return self.is_blocked(*position)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """
+        Yields every blocked position, row by row from the bottom
+        :return: Iterator of x and y coordinates
+        """
+        for row in range(self.height):
+            for start, end in self.get_row_runs(row):
+                for column in range(start, end + 1):
+                    yield self.llx + column, self.lly + row
+
+    def get_row_runs(self, row: int) -> Iterator[tuple[int, int]]:
+        """
+        Yields the first and last column of every run of blocked cells in a
+        row, counted from the lower left corner of the raster
+        :param int row: Row counted from the bottom of the raster
+        :return: Iterator of first and last columns
+        """
+        offset = row * self.row_bytes
+        value = int.from_bytes(self.bits[offset:offset + self.row_bytes],
+                               'little')
+        if not value:
+            return
+        row_bits = format(value, 'b')[::-1]
+        start = row_bits.find('1')
+        while start != -1:
+            end = row_bits.find('0', start)
+            if end == -1:
+                end = len(row_bits)
+            yield start, end - 1
+            start = row_bits.find('1', end)
+
+    def unblock(self, x: int, y: int) -> None:
+        """
+        Marks the position as not blocked
+        :param int x: x coordinate
+        :param int y: y coordinate
+        :return: None
+        """
+        if not self.contains_cell(x, y):
+            raise ValueError(f'Position {x},{y} is outside the raster')
+        column = x - self.llx
+        self.bits[(y - self.lly) * self.row_bytes + (column >> 3)] \
+            &= ~(1 << (column & 7)) & 0xFF
+        OccupancyRaster.edit_count += 1
+
+    def count_blocked(self) -> int:
+        """
+        Returns the number of blocked cells
+        :return: Number of blocked cells
+        """
+        return bin(int.from_bytes(self.bits[:self.row_bytes * self.height],
+                                  'little')).count('1')
+
+    def is_row_segment_blocked(self, y: int, x1: int, x2: int) -> bool:
+        """
+        Returns True if a blocked cell lies on row y between x1 and x2,
+        testing the whole segment with a single mask operation
+        :param int y: y coordinate of the row
+        :param int x1: x coordinate where the segment starts
+        :param int x2: x coordinate where the segment ends
+        :return: Boolean value
+        """
+        if not self.lly <= y <= self.ury:
+            return False
+        first = max(min(x1, x2), self.llx) - self.llx
+        last = min(max(x1, x2), self.urx) - self.llx
+        if first > last:
+            return False
+        offset = (y - self.lly) * self.row_bytes
+        value = int.from_bytes(
+            self.bits[offset + (first >> 3):offset + (last >> 3) + 1],
+            'little') >> (first & 7)
+        return value & ((1 << (last - first + 1)) - 1) != 0
+
+    def is_column_segment_blocked(self, x: int, y1: int, y2: int) -> bool:
+        """
+        Returns True if a blocked cell lies on column x between y1 and y2
+        :param int x: x coordinate of the column
+        :param int y1: y coordinate where the segment starts
+        :param int y2: y coordinate where the segment ends
+        :return: Boolean value
+        """
+        if not self.llx <= x <= self.urx:
+            return False
+        first = max(min(y1, y2), self.lly) - self.lly
+        last = min(max(y1, y2), self.ury) - self.lly
+        column = x - self.llx
+        byte_index = column >> 3
+        bit = 1 << (column & 7)
+        bits = self.bits
+        for row in range(first, last + 1):
+            if bits[row * self.row_bytes + byte_index] & bit:
+                return True
+        return False
+
+    def is_path_blocked(self, x1: int, y1: int, x2: int, y2: int) -> bool:
+        """
+        Returns True if there is a blocked cell on the axis-aligned line
+        between the coordinates (x1, y1) and (x2, y2)
+        :param int x1: x Coordinate of position 1
+        :param int y1: y Coordinate of position 1
+        :param int x2: x Coordinate of position 2
+        :param int y2: y Coordinate of position 2
+        :return: Boolean value
+        """
+        if y1 == y2:
+            return self.is_row_segment_blocked(y1, x1, x2)
+        if x1 == x2:
+            return self.is_column_segment_blocked(x1, y1, y2)
+        return False
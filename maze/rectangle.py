@@ -0,0 +1,147 @@
+from __future__ import annotations
+from typing import ClassVar, Iterator
+
+
+class Rectangle:
+    """
+    Rectangular obstacle whose perimeter blocks the robot, stored by its lower
+    left corner and size instead of by its perimeter points
+    """
+    __slots__ = ('llx', 'lly', 'width', 'height')
+    llx: int
+    lly: int
+    width: int
+    height: int
+    # counts the moves and resizes of every rectangle, so an index built from
+    # a rectangle can tell that it was edited in place
+    edit_count: ClassVar[int] = 0
+
+    def __init__(self, llx: int, lly: int, width: int, height: int) -> None:
+        """
+        Constructor for Rectangle
+        :param int llx: Lower left x coordinate
+        :param int lly: Lower left y coordinate
+        :param int width: Amount of cells the rectangle spans on the x axis
+        :param int height: Amount of cells the rectangle spans on the y axis
+        """
+        if width < 1 or height < 1:
+            raise ValueError('Rectangle must span at least one cell')
+        self.llx = llx
+        self.lly = lly
+        self.width = width
+        self.height = height
+
+    def __setattr__(self, name: str, value: int) -> None:
+        """
+        Sets a corner or size coordinate, counting it as an edit when the
+        rectangle already had one
+        :param str name: Name of the attribute
+        :param int value: New value
+        :return: None
+        """
+        if hasattr(self, name):
+            Rectangle.edit_count += 1
+        object.__setattr__(self, name, value)
+
+    @property
+    def urx(self) -> int:
+        """Upper right x coordinate"""
+        return self.llx + self.width - 1
+
+    @property
+    def ury(self) -> int:
+        """Upper right y coordinate"""
+        return self.lly + self.height - 1
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """
+        Yields the perimeter points, left side first, then the bottom, the top
+        and the right side
+        :return: Iterator of x and y coordinates
+        """
+        for i in range(self.height):
+            yield self.llx, self.lly + i
+        for i in range(1, self.width):
+            yield self.llx + i, self.lly
+        if self.height > 1:
+            for i in range(1, self.width - 1):
+                yield self.llx + i, self.ury
+        if self.width > 1:
+            for i in range(1, self.height):
+                yield self.urx, self.lly + i
+
+    def __len__(self) -> int:
+        """
+        Amount of perimeter points
+        :return: Amount of perimeter points
+        """
+        if self.width == 1 or self.height == 1:
+            return self.width * self.height
+        return 2 * (self.width + self.height) - 4
+
+    def __contains__(self, position: tuple[int, int]) -> bool:
+        """
+        Checks if the position lies on the perimeter
+        :param tuple[int, int] position: x and y coordinate
+        :return: Boolean value
+        """
+        x, y = position
+        if not (self.llx <= x <= self.urx and self.lly <= y <= self.ury):
+            return False
+        return x in (self.llx, self.urx) or y in (self.lly, self.ury)
+
+    def is_path_blocked(self, x1: int, y1: int, x2: int, y2: int) -> bool:
+        """
+        Returns True if the axis-aligned line between the coordinates
+        (x1, y1) and (x2, y2) crosses or touches the perimeter
+        :param int x1: x Coordinate of position 1
+        :param int y1: y Coordinate of position 1
+        :param int x2: x Coordinate of position 2
+        :param int y2: y Coordinate of position 2
+        :return: Boolean value
+        """
+        if y1 == y2:
+            return is_segment_crossing(y1, min(x1, x2), max(x1, x2),
+                                       self.lly, self.ury, self.llx, self.urx)
+        if x1 == x2:
+            return is_segment_crossing(x1, min(y1, y2), max(y1, y2),
+                                       self.llx, self.urx, self.lly, self.ury)
+        return False
+
+    def __eq__(self, other: object) -> bool:
+        """Equal when both rectangles cover the same cells"""
+        if not isinstance(other, Rectangle):
+            return NotImplemented
+        return (self.llx, self.lly, self.width, self.height) \
+            == (other.llx, other.lly, other.width, other.height)
+
+    def __repr__(self) -> str:
+        """
+        Representation of the Rectangle Class
+        :return: String representation of the Class
+        """
+        return f'Rectangle({self.llx}, {self.lly}, {self.width}, ' \
+               f'{self.height})'
+
+
+def is_segment_crossing(line: int, start: int, end: int, low_side: int,
+                        high_side: int, low_end: int, high_end: int) -> bool:
+    """
+    Checks if a segment running along a row or column touches a rectangle
+    perimeter, with the rectangle described along the same axes
+    :param int line: Row or column the segment runs on
+    :param int start: Lowest coordinate of the segment
+    :param int end: Highest coordinate of the segment
+    :param int low_side: Lowest row or column of the rectangle across the
+    segment
+    :param int high_side: Highest row or column of the rectangle across the
+    segment
+    :param int low_end: Lowest coordinate of the rectangle along the segment
+    :param int high_end: Highest coordinate of the rectangle along the segment
+    :return: Boolean value
+    """
+    if line in (low_side, high_side):
+        return start <= high_end and low_end <= end
+    if low_side < line < high_side:
+        return start <= low_end <= end or start <= high_end <= end
+    return False
@@ -0,0 +1,86 @@
+import os
+import sys
+from typing import Iterator, Optional
+
+from maze.maze_cache import load_maze_positions
+from maze.raster import OccupancyRaster
+from maze.wall_runs import WallRun, encode_runs
+
+# a run-length maze holds one x1,y1,x2,y2 wall run per line
+EXTENSION = '.rle'
+
+
+def get_run_length_path(text_path: str) -> str:
+    """
+    Returns the path of the run-length maze that belongs to a text maze
+    :param str text_path: Path of the text maze
+    :return: Path of the run-length maze
+    """
+    return os.path.splitext(text_path)[0] + EXTENSION
+
+
+def export_maze(text_path: str, run_length_path: Optional[str] = None) \
+        -> str:
+    """
+    Converts a text maze with one position per line into a run-length maze
+    :param str text_path: Path of the text maze
+    :param Optional[str] run_length_path: Path to write the run-length maze
+    to, defaults to the text maze path with the run-length extension
+    :return: Path of the run-length maze
+    """
+    if run_length_path is None:
+        run_length_path = get_run_length_path(text_path)
+    runs = encode_runs(load_maze_positions(text_path, use_cache=False))
+    with open(run_length_path, 'w') as file:
+        for run in runs:
+            file.write('{},{},{},{}\n'.format(*run))
+    return run_length_path
+
+
+def write_raster_runs(raster: OccupancyRaster, run_length_path: str) \
+        -> None:
+    """
+    Writes the rows of a raster as horizontal wall runs, one row at a time
+    :param OccupancyRaster raster: Raster of the maze
+    :param str run_length_path: Path to write the run-length maze to
+    :return: None
+    """
+    with open(run_length_path, 'w') as file:
+        for row in range(raster.height):
+            y = raster.lly + row
+            for start, end in raster.get_row_runs(row):
+                file.write(f'{raster.llx + start},{y},'
+                           f'{raster.llx + end},{y}\n')
+
+
+def stream_runs(run_length_path: str) -> Iterator[WallRun]:
+    """
+    Yields the wall runs of a run-length maze one line at a time
+    :param str run_length_path: Path of the run-length maze
+    :return: Iterator of (x1, y1, x2, y2) wall runs
+    """
+    with open(run_length_path, 'r') as file:
+        for line in file:
+            if line.strip():
+                x1, y1, x2, y2 = map(int, line.split(','))
+                yield x1, y1, x2, y2
+
+
+def export_all_mazes(names: list[str]) -> None:
+    """
+    Exports the text mazes in the maze directory, or only the named ones
+    :param list[str] names: Maze names such as easy_maze, empty for every
+    maze the maze loader finds with a text maze
+    :return: None
+    """
+    # imported here, since the maze loader imports this module
+    from maze import maze_loader
+    path = maze_loader.MAZE_DIRECTORY
+    if not names:
+        names = maze_loader.discover_text_mazes()
+    for name in names:
+        print(f'Exported {export_maze(os.path.join(path, f"{name}.txt"))}')
+
+
+if __name__ == '__main__':
+    export_all_mazes(sys.argv[1:])
@@ -0,0 +1,243 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from itertools import repeat
+from typing import Iterable, Iterator
+
+WallRun = tuple[int, int, int, int]
+
+
+class WallRuns:
+    """
+    Obstacle made of straight horizontal and vertical wall runs. Horizontal
+    runs are indexed by the merged intervals of their row and vertical runs
+    by the merged intervals of their column, and queries across the other
+    axis bisect the sorted rows or columns that hold runs
+    """
+    run_count: int
+    row_starts: dict[int, list[int]]
+    row_ends: dict[int, list[int]]
+    column_starts: dict[int, list[int]]
+    column_ends: dict[int, list[int]]
+    rows: list[int]
+    columns: list[int]
+
+    def __init__(self, runs: Iterable[WallRun]) -> None:
+        """
+        Constructor for WallRuns
+        :param Iterable[WallRun] runs: (x1, y1, x2, y2) coordinates of the
+        first and last cell of every run
+        """
+        rows: dict[int, list[tuple[int, int]]] = {}
+        columns: dict[int, list[tuple[int, int]]] = {}
+        self.run_count = 0
+        for x1, y1, x2, y2 in runs:
+            if y1 == y2:
+                rows.setdefault(y1, []).append((min(x1, x2), max(x1, x2)))
+            elif x1 == x2:
+                columns.setdefault(x1, []).append((min(y1, y2),
+                                                   max(y1, y2)))
+            else:
+                raise ValueError(f'Wall run {x1},{y1},{x2},{y2} is not '
+                                 f'horizontal or vertical')
+            self.run_count += 1
+        self.row_starts, self.row_ends = merge_intervals(rows)
+        self.column_starts, self.column_ends = merge_intervals(columns)
+        self.rows = sorted(self.row_starts)
+        self.columns = sorted(self.column_starts)
+
+    def is_row_blocked(self, y: int, low: int, high: int) -> bool:
+        """
+        Checks if a horizontal run on row y overlaps low to high, inclusive
+        :param int y: y coordinate of the row
+        :param int low: Lowest x coordinate to check
+        :param int high: Highest x coordinate to check
+        :return: Boolean value
+        """
+        return is_interval_blocked(self.row_starts.get(y),
+                                   self.row_ends.get(y), low, high)
+
+    def is_column_blocked(self, x: int, low: int, high: int) -> bool:
+        """
+        Checks if a vertical run on column x overlaps low to high, inclusive
+        :param int x: x coordinate of the column
+        :param int low: Lowest y coordinate to check
+        :param int high: Highest y coordinate to check
+        :return: Boolean value
+        """
+        return is_interval_blocked(self.column_starts.get(x),
+                                   self.column_ends.get(x), low, high)
+
+    def is_blocked(self, x: int, y: int) -> bool:
+        """
+        Returns True if the position lies on a wall run
+        :param int x: x coordinate
+        :param int y: y coordinate
+        :return: Boolean value
+        """
+        return self.is_row_blocked(y, x, x) or self.is_column_blocked(x, y, y)
+
+    def __contains__(self, position: tuple[int, int]) -> bool:
+        """
+        Membership test, matching the point tuples used for obstacles
+        :param tuple[int, int] position: x and y coordinate
+        :return: Boolean value
+        """
+        return self.is_blocked(*position)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """
+        Yields every blocked position once, first the horizontal runs row by
+        row from the bottom, then the cells of the vertical runs that no
+        horizontal run covers, column by column from the left
+        :return: Iterator of x and y coordinates
+        """
+        for y in self.rows:
+            for start, end in zip(self.row_starts[y], self.row_ends[y]):
+                for x in range(start, end + 1):
+                    yield x, y
+        for x in self.columns:
+            for start, end in zip(self.column_starts[x],
+                                  self.column_ends[x]):
+                for y in range(start, end + 1):
+                    if not self.is_row_blocked(y, x, x):
+                        yield x, y
+
+    def __len__(self) -> int:
+        """
+        Amount of blocked positions
+        :return: Amount of blocked positions
+        """
+        return sum(1 for _ in self)
+
+    def is_path_blocked(self, x1: int, y1: int, x2: int, y2: int) -> bool:
+        """
+        Returns True if a wall run lies on the axis-aligned line between the
+        coordinates (x1, y1) and (x2, y2)
+        :param int x1: x Coordinate of position 1
+        :param int y1: y Coordinate of position 1
+        :param int x2: x Coordinate of position 2
+        :param int y2: y Coordinate of position 2
+        :return: Boolean value
+        """
+        if y1 == y2:
+            low, high = min(x1, x2), max(x1, x2)
+            return self.is_row_blocked(y1, low, high) or any(
+                self.is_column_blocked(x, y1, y1)
+                for x in self.columns[bisect_left(self.columns, low):
+                                      bisect_right(self.columns, high)])
+        if x1 == x2:
+            low, high = min(y1, y2), max(y1, y2)
+            return self.is_column_blocked(x1, low, high) or any(
+                self.is_row_blocked(y, x1, x1)
+                for y in self.rows[bisect_left(self.rows, low):
+                                   bisect_right(self.rows, high)])
+        return False
+
+
+def merge_intervals(lines: dict[int, list[tuple[int, int]]]) \
+        -> tuple[dict[int, list[int]], dict[int, list[int]]]:
+    """
+    Sorts and merges the overlapping or touching intervals of every row or
+    column
+    :param dict[int, list[tuple[int, int]]] lines: Intervals per row or column
+    :return: Sorted interval starts and matching ends per row or column
+    """
+    starts: dict[int, list[int]] = {}
+    ends: dict[int, list[int]] = {}
+    for line, intervals in lines.items():
+        intervals.sort()
+        line_starts = [intervals[0][0]]
+        line_ends = [intervals[0][1]]
+        for start, end in intervals[1:]:
+            if start <= line_ends[-1] + 1:
+                line_ends[-1] = max(line_ends[-1], end)
+            else:
+                line_starts.append(start)
+                line_ends.append(end)
+        starts[line] = line_starts
+        ends[line] = line_ends
+    return starts, ends
+
+
+def is_interval_blocked(starts: list[int], ends: list[int], low: int,
+                        high: int) -> bool:
+    """
+    Checks if any of the merged intervals overlaps low to high, inclusive
+    :param list[int] starts: Sorted interval starts of a row or column
+    :param list[int] ends: Interval ends matching the starts
+    :param int low: Lowest coordinate to check
+    :param int high: Highest coordinate to check
+    :return: Boolean value
+    """
+    if not starts:
+        return False
+    i = bisect_right(starts, high) - 1
+    return i >= 0 and ends[i] >= low
+
+
+def expand_runs(runs: Iterable[WallRun]) -> Iterator[tuple[int, int]]:
+    """
+    Yields every position covered by the wall runs
+    :param Iterable[WallRun] runs: (x1, y1, x2, y2) wall runs
+    :return: Iterator of x and y coordinates
+    """
+    for x1, y1, x2, y2 in runs:
+        if x1 == x2:
+            yield from zip(repeat(x1), range(min(y1, y2), max(y1, y2) + 1))
+        elif y1 == y2:
+            yield from zip(range(min(x1, x2), max(x1, x2) + 1), repeat(y1))
+        else:
+            for x in range(min(x1, x2), max(x1, x2) + 1):
+                for y in range(min(y1, y2), max(y1, y2) + 1):
+                    yield x, y
+
+
+def encode_runs(positions: Iterable[tuple[int, int]]) -> list[WallRun]:
+    """
+    Groups blocked positions into wall runs along one axis, with the
+    positions left over grouped along the other axis, keeping whichever axis
+    order gives the fewest runs
+    :param Iterable[tuple[int, int]] positions: Blocked positions
+    :return: List of (x1, y1, x2, y2) wall runs
+    """
+    cells = set(positions)
+    vertical_first = encode_vertical_runs(cells)
+    horizontal_first = [(x1, y1, x2, y2) for y1, x1, y2, x2 in
+                        encode_vertical_runs({(y, x) for x, y in cells})]
+    if len(horizontal_first) < len(vertical_first):
+        return horizontal_first
+    return vertical_first
+
+
+def encode_vertical_runs(positions: set[tuple[int, int]]) -> list[WallRun]:
+    """
+    Groups blocked positions into vertical runs, and the positions left over
+    into horizontal runs
+    :param set[tuple[int, int]] positions: Blocked positions
+    :return: List of (x1, y1, x2, y2) wall runs
+    """
+    cells = sorted(positions)
+    runs: list[WallRun] = []
+    leftover: list[tuple[int, int]] = []
+    i = 0
+    while i < len(cells):
+        x, y = cells[i]
+        j = i
+        while j + 1 < len(cells) and cells[j + 1] == (x, cells[j][1] + 1):
+            j += 1
+        if j > i:
+            runs.append((x, y, x, cells[j][1]))
+        else:
+            leftover.append((x, y))
+        i = j + 1
+    leftover.sort(key=lambda cell: (cell[1], cell[0]))
+    i = 0
+    while i < len(leftover):
+        x, y = leftover[i]
+        j = i
+        while j + 1 < len(leftover) \
+                and leftover[j + 1] == (leftover[j][0] + 1, y):
+            j += 1
+        runs.append((x, y, leftover[j][0], y))
+        i = j + 1
+    return runs
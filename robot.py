@@ -1,7 +1,7 @@
 import sys
 import time
 
-from maze import maze_solver
+from maze import maze_solver, obstacles
 
 # list of valid command names
 valid_commands = ['off', 'help', 'replay', 'mazerun', 'forward', 'back',
@@ -13,6 +13,17 @@ history = []
 
 world = None
 
+# set while a movement sequence that was checked for obstacles in advance is
+# being executed, so the individual moves skip their own obstacle checks
+obstacles_prevalidated = False
+
+# x and y step for every direction index of the world
+direction_steps = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+
+# search engine of the maze solver used by mazerun, the distance fields it
+# walks are kept for the loaded maze so repeated runs skip the search
+maze_engine = 'distance_field'
+
 
 def get_commandline_argument() -> list[str]:
     """
@@ -145,7 +156,7 @@ def do_forward(robot_name, steps):
     :param steps:
     :return: (True, forward output text)
     """
-    if world.check_object(steps):
+    if not obstacles_prevalidated and world.check_object(steps):
         return True, ''+robot_name+': Sorry, there is an obstacle in the way.'
     if world.update_position(steps):
         return True, ' > '+robot_name+' moved forward by '+str(steps)+' steps.'
@@ -160,7 +171,7 @@ def do_back(robot_name, steps):
     :param steps:
     :return: (True, forward output text)
     """
-    if world.check_object(-steps):
+    if not obstacles_prevalidated and world.check_object(-steps):
         return True, ''+robot_name+': Sorry, there is an obstacle in the way.'
     if world.update_position(-steps):
         return True, ' > '+robot_name+' moved back by '+str(steps)+' steps.'
@@ -200,6 +211,25 @@ def do_left_turn(robot_name):
 def do_sprint(robot_name, steps):
     """
     Sprints the robot, i.e. let it go forward steps + (steps-1) + (steps-2) + .. + 1 number of steps, in iterations
+    The whole sprint is checked for obstacles in one batch before it starts
+    :param robot_name:
+    :param steps:
+    :return: (True, forward output)
+    """
+
+    global obstacles_prevalidated
+    if obstacles_prevalidated or not prevalidate_movement([('sprint', str(steps))]):
+        return sprint_forward(robot_name, steps)
+    obstacles_prevalidated = True
+    try:
+        return sprint_forward(robot_name, steps)
+    finally:
+        obstacles_prevalidated = False
+
+
+def sprint_forward(robot_name, steps):
+    """
+    Moves the robot forward steps, then steps-1, and so on until 1
     :param robot_name:
     :param steps:
     :return: (True, forward output)
@@ -210,7 +240,52 @@ def do_sprint(robot_name, steps):
     else:
         (do_next, command_output) = do_forward(robot_name, steps)
         print(command_output)
-        return do_sprint(robot_name, steps - 1)
+        return sprint_forward(robot_name, steps - 1)
+
+
+def get_movement_segments(commands):
+    """
+    Simulates movement commands from the current position and direction of the robot, assuming nothing is in the way
+    :param commands: list of (command_name, arguments) tuples
+    :return: list of (x1, y1, x2, y2) lines travelled by every forward or back step
+    """
+
+    position_x, position_y = world.position_x, world.position_y
+    direction_index = world.current_direction_index
+    segments = []
+    for (command_name, command_arg) in commands:
+        if command_name == 'right':
+            direction_index = (direction_index + 1) % 4
+            continue
+        if command_name == 'left':
+            direction_index = (direction_index - 1) % 4
+            continue
+        if command_name == 'forward':
+            moves = [int(command_arg)]
+        elif command_name == 'back':
+            moves = [-int(command_arg)]
+        elif command_name == 'sprint':
+            moves = list(range(int(command_arg), 0, -1))
+        else:
+            continue
+        step_x, step_y = direction_steps[direction_index]
+        for steps in moves:
+            new_x = position_x + step_x * steps
+            new_y = position_y + step_y * steps
+            segments.append((position_x, position_y, new_x, new_y))
+            if world.is_position_allowed(new_x, new_y):
+                position_x, position_y = new_x, new_y
+    return segments
+
+
+def prevalidate_movement(commands):
+    """
+    Checks every move of a sequence of movement commands for obstacles in a single batch
+    :param commands: list of (command_name, arguments) tuples
+    :return: True if none of the moves is obstructed, else False
+    """
+
+    return not any(obstacles.are_paths_blocked(get_movement_segments(commands)))
 
 
 def get_commands_history(reverse, relativeStart, relativeEnd):
@@ -239,6 +314,8 @@ def do_replay(robot_name, arguments):
     :return: True, output string
     """
 
+    global obstacles_prevalidated
+
     silent = arguments.lower().find('silent') > -1
     reverse = arguments.lower().find('reversed') > -1
     range_args = arguments.lower().replace('silent', '').replace('reversed', '')
@@ -256,11 +333,18 @@ def do_replay(robot_name, arguments):
 
     commands_to_replay = get_commands_history(reverse, range_start, range_end)
 
-    for (command_name, command_arg) in commands_to_replay:
-        (do_next, command_output) = call_command(command_name, command_arg, robot_name)
-        if not silent:
-            print(command_output)
-            world.show_position(robot_name)
+    prevalidated = not obstacles_prevalidated and prevalidate_movement(commands_to_replay)
+    if prevalidated:
+        obstacles_prevalidated = True
+    try:
+        for (command_name, command_arg) in commands_to_replay:
+            (do_next, command_output) = call_command(command_name, command_arg, robot_name)
+            if not silent:
+                print(command_output)
+                world.show_position(robot_name)
+    finally:
+        if prevalidated:
+            obstacles_prevalidated = False
 
     return True, ' > '+robot_name+' replayed ' + str(len(commands_to_replay)) + ' commands' + (' in reverse' if reverse else '') + (' silently.' if silent else '.')
 
@@ -269,7 +353,7 @@ def do_maze_run(robot_name: str, goal: str):
     if goal == '':
         goal = 'top'
     print(f' > {robot_name} starting maze run..')
-    robot_commands = maze_solver.maze_run(
+    waypoints, robot_commands = maze_solver.maze_solution(
         world.position_x,
         world.position_y,
         world.current_direction_index,
@@ -277,8 +361,12 @@ def do_maze_run(robot_name: str, goal: str):
         world.min_y,
         world.max_x,
         world.max_y,
-        goal
+        goal,
+        maze_engine
     )
+    if not waypoints:
+        return True, f'{robot_name}: Sorry, I cannot reach the {goal} edge.'
+    world.show_path(waypoints)
     for command in robot_commands:
         handle_command(robot_name, command)
     return True, f'{robot_name}: I am at the {goal} edge.'
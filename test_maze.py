@@ -0,0 +1,206 @@
+"""
+UnitTest for the maze formats and loaders.
+"""
+import os
+import tempfile
+import unittest
+
+from maze import compiled_maze, maze_cache, maze_generator, maze_loader, \
+    obstacles, run_length_maze
+from maze.wall_runs import WallRuns, encode_runs
+from test_base import captured_output
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.text_path = os.path.join(self.directory.name, 'test_maze.txt')
+        with open(self.text_path, 'w') as file:
+            file.write('-3,-2\n-3,-1\n-3,0\n4,7\n10,-2\n')
+        self.cache_directory = maze_cache.CACHE_DIRECTORY
+        maze_cache.CACHE_DIRECTORY = os.path.join(self.directory.name,
+                                                  'cache')
+
+    def tearDown(self):
+        maze_cache.CACHE_DIRECTORY = self.cache_directory
+        self.directory.cleanup()
+
+    def test_maze_cache(self):
+        expected = ((-3, -2), (-3, -1), (-3, 0), (4, 7), (10, -2))
+        self.assertEqual(expected,
+                         maze_cache.load_maze_positions(self.text_path, True))
+        cache_path = maze_cache.get_cache_path(self.text_path)
+        self.assertTrue(os.path.exists(cache_path))
+        self.assertEqual(expected,
+                         maze_cache.load_maze_positions(self.text_path, True))
+
+        with open(self.text_path, 'w') as file:
+            file.write('1,1\n')
+        self.assertEqual(((1, 1),),
+                         maze_cache.load_maze_positions(self.text_path, True))
+        self.assertEqual(((1, 1),), maze_cache.read_cache(cache_path)[3])
+
+    def test_maze_cache_bypass(self):
+        maze_cache.load_maze_positions(self.text_path, False)
+        self.assertFalse(os.path.exists(
+            maze_cache.get_cache_path(self.text_path)))
+
+    def test_compiled_maze(self):
+        self.assertIsNone(compiled_maze.load_up_to_date_maze(self.text_path))
+        compiled_path = compiled_maze.compile_maze(self.text_path)
+        self.assertEqual(compiled_maze.get_compiled_path(self.text_path),
+                         compiled_path)
+        raster = compiled_maze.load_up_to_date_maze(self.text_path)
+        self.assertEqual(compiled_maze.WORLD_BOUNDS,
+                         (raster.llx, raster.lly, raster.urx, raster.ury))
+        self.assertEqual([(-3, -2), (10, -2), (-3, -1), (-3, 0), (4, 7)],
+                         list(raster))
+        obstacles.obstacles = [raster]
+        obstacles.use_occupancy_raster(compiled_maze.WORLD_BOUNDS)
+        self.assertIs(raster, obstacles.raster)
+        obstacles.use_occupancy_raster(None)
+        self.assertTrue(obstacles.is_position_blocked(4, 7))
+        self.assertFalse(obstacles.is_position_blocked(4, 6))
+        self.assertTrue(obstacles.is_path_blocked(-3, 5, -3, -10))
+        self.assertFalse(obstacles.is_path_blocked(-2, 5, -2, -10))
+        self.assertEqual([True, False], obstacles.are_paths_blocked(
+            [(0, -2, 20, -2), (0, -1, 20, -1)]))
+        obstacles.obstacles = []
+        del raster
+
+    def test_compiled_maze_rejects_other_files(self):
+        with self.assertRaises(ValueError):
+            compiled_maze.load_compiled_maze(self.text_path)
+
+    def test_wall_runs(self):
+        walls = WallRuns([(0, 0, 0, 4), (1, 4, 6, 4), (9, 2, 7, 2)])
+        self.assertEqual(14, len(walls))
+        self.assertTrue(walls.is_blocked(0, 2))
+        self.assertTrue(walls.is_blocked(6, 4))
+        self.assertTrue(walls.is_blocked(8, 2))
+        self.assertFalse(walls.is_blocked(1, 3))
+        self.assertTrue(walls.is_path_blocked(3, 0, 3, 10))
+        self.assertTrue(walls.is_path_blocked(-5, 1, 5, 1))
+        self.assertTrue(walls.is_path_blocked(8, 10, 8, 2))
+        self.assertFalse(walls.is_path_blocked(8, 10, 8, 3))
+        self.assertFalse(walls.is_path_blocked(1, 3, 6, 3))
+        self.assertTrue(walls.is_path_blocked(5, 3, -5, 3))
+        self.assertTrue(walls.is_path_blocked(5, -1, 5, 9))
+        self.assertFalse(walls.is_path_blocked(1, 5, 10, 5))
+        self.assertEqual([0], walls.columns)
+        self.assertEqual([2, 4], walls.rows)
+        with self.assertRaises(ValueError):
+            WallRuns([(0, 0, 1, 1)])
+
+    def test_run_length_maze(self):
+        with open(self.text_path, 'w') as file:
+            file.write('\n'.join(f'{x},5' for x in range(-20, 21)) + '\n')
+            file.write('\n'.join(f'0,{y}' for y in range(-8, 5)) + '\n')
+            file.write('30,30\n')
+        positions = set(maze_cache.load_maze_positions(self.text_path, False))
+        self.assertEqual(3, len(encode_runs(positions)))
+        run_length_path = run_length_maze.export_maze(self.text_path)
+        walls = WallRuns(run_length_maze.stream_runs(run_length_path))
+        self.assertEqual(3, walls.run_count)
+        self.assertEqual(positions, set(walls))
+        self.assertEqual({'test_maze': run_length_path},
+                         maze_loader.discover_mazes(self.directory.name))
+
+    def test_generate_maze(self):
+        raster = maze_generator.generate_maze_raster(12, 7, seed=5)
+        self.assertEqual((-13, -7, 11, 7),
+                         (raster.llx, raster.lly, raster.urx, raster.ury))
+        self.assertFalse(raster.is_blocked(0, 0))
+        open_cells = raster.width * raster.height - raster.count_blocked()
+        self.assertEqual(12 * 7 * 2 - 1, open_cells)
+        self.assertEqual(
+            raster.bits,
+            maze_generator.generate_maze_raster(12, 7, seed=5).bits)
+
+        looped = maze_generator.generate_maze_raster(12, 7, 5, density=0.5)
+        self.assertGreater(raster.count_blocked(), looped.count_blocked())
+
+        bounds = maze_generator.load_generated_maze(12, 7, seed=5)
+        self.assertEqual((-13, -7, 11, 7), bounds)
+        self.assertTrue(obstacles.is_position_blocked(-13, 0))
+        obstacles.obstacles = []
+
+    def test_write_generated_maze(self):
+        raster = maze_generator.generate_maze_raster(9, 4, seed=1)
+        positions = set(raster)
+        for extension, writer in maze_generator.maze_writers.items():
+            path = os.path.join(self.directory.name, f'generated{extension}')
+            writer(raster, path)
+        self.assertEqual(positions, set(maze_loader.stream_positions(
+            os.path.join(self.directory.name, 'generated.txt'))))
+        self.assertEqual(positions, set(WallRuns(run_length_maze.stream_runs(
+            os.path.join(self.directory.name, 'generated.rle')))))
+        compiled = compiled_maze.load_compiled_maze(
+            os.path.join(self.directory.name, 'generated.bin'))
+        self.assertEqual(positions, set(compiled))
+        del compiled
+
+    def test_discover_mazes(self):
+        mazes = maze_loader.discover_mazes()
+        for name in ['simple_maze', 'easy_maze', 'medium_maze',
+                     'extreme_maze']:
+            self.assertIn(name, mazes)
+            self.assertTrue(os.path.exists(mazes[name]))
+        self.assertEqual({'test_maze': self.text_path},
+                         maze_loader.discover_mazes(self.directory.name))
+
+    def test_stream_positions(self):
+        self.assertEqual([(-3, -2), (-3, -1), (-3, 0), (4, 7), (10, -2)],
+                         list(maze_loader.stream_positions(self.text_path)))
+
+    def test_load_maze(self):
+        maze_loader.load_maze('simple_maze')
+        self.assertEqual(1, len(obstacles.obstacles))
+        self.assertIsInstance(obstacles.obstacles[0], tuple)
+        self.assertTrue(obstacles.is_position_blocked(30, -40))
+        positions = set(obstacles.obstacles[0])
+
+        maze_loader.load_maze('simple_maze',
+                              maze_loader.raster_store(-100, -200, 100, 200))
+        self.assertEqual(1, len(obstacles.obstacles))
+        self.assertEqual(positions, set(obstacles.obstacles[0]))
+        self.assertTrue(obstacles.is_position_blocked(30, -40))
+        with self.assertRaises(ValueError):
+            maze_loader.load_maze('missing_maze')
+        obstacles.obstacles = []
+
+    def test_load_maze_skips_empty_compiled_maze(self):
+        maze_directory = maze_loader.MAZE_DIRECTORY
+        maze_loader.MAZE_DIRECTORY = self.directory.name
+        try:
+            open(compiled_maze.get_compiled_path(self.text_path), 'w').close()
+            maze_loader.load_maze('test_maze')
+            self.assertTrue(obstacles.is_position_blocked(4, 7))
+            self.assertFalse(obstacles.is_position_blocked(4, 6))
+        finally:
+            maze_loader.MAZE_DIRECTORY = maze_directory
+            obstacles.obstacles = []
+
+    def test_convert_all_mazes(self):
+        other_path = os.path.join(self.directory.name, 'other.txt')
+        with open(other_path, 'w') as file:
+            file.write('1,1\n')
+        maze_directory = maze_loader.MAZE_DIRECTORY
+        maze_loader.MAZE_DIRECTORY = self.directory.name
+        try:
+            self.assertEqual(['other', 'test_maze'],
+                             maze_loader.discover_text_mazes())
+            with captured_output():
+                compiled_maze.compile_all_mazes([])
+                run_length_maze.export_all_mazes([])
+        finally:
+            maze_loader.MAZE_DIRECTORY = maze_directory
+        for name in ['other', 'test_maze']:
+            for extension in [compiled_maze.EXTENSION,
+                              run_length_maze.EXTENSION]:
+                self.assertTrue(os.path.exists(os.path.join(
+                    self.directory.name, f'{name}{extension}')))
+
+
+if __name__ == '__main__':
+    unittest.main()
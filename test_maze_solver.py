@@ -0,0 +1,383 @@
+"""
+UnitTest for the maze solver.
+"""
+import unittest
+
+from maze import batch_solver, maze_generator, maze_solver, obstacles
+from maze.raster import OccupancyRaster
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        obstacles.obstacles = []
+        obstacles.update_obstacle_index()
+
+    def tearDown(self):
+        obstacles.obstacles = []
+        obstacles.update_obstacle_index()
+
+    def assertValidPath(self, grid, path, start, goal):
+        self.assertEqual(start, path[0])
+        self.assertTrue(maze_solver.goal_checks[goal](path[-1]))
+        for (x1, y1), (x2, y2) in zip(path, path[1:]):
+            self.assertEqual(1, abs(x1 - x2) + abs(y1 - y2))
+            self.assertTrue(grid.is_passable(x2, y2))
+
+    def set_boxed_in_maze(self):
+        obstacles.obstacles = [((1, 0),), ((-1, 0),), ((0, 1),), ((0, -1),)]
+        return maze_solver.set_maze_bounds(-3, -3, 3, 3)
+
+    def test_maze_grid(self):
+        obstacles.obstacles = [((2, 0),), obstacles.Rectangle(-3, -3, 2, 2)]
+        grid = maze_solver.get_maze_grid(-5, -5, 5, 5)
+        self.assertFalse(grid.is_passable(2, 0))
+        self.assertFalse(grid.is_passable(-3, -2))
+        self.assertTrue(grid.is_passable(0, 0))
+        self.assertFalse(grid.is_passable(6, 0))
+        self.assertEqual((4, -1), grid.position(grid.cell_id(4, -1)))
+        self.assertIs(grid, maze_solver.get_maze_grid(-5, -5, 5, 5))
+
+        obstacles.obstacles = [((0, 1),)]
+        grid = maze_solver.get_maze_grid(-5, -5, 5, 5)
+        self.assertTrue(grid.is_passable(2, 0))
+        self.assertFalse(grid.is_passable(0, 1))
+        self.assertEqual([(1, 0), (-1, 0), (0, -1)],
+                         maze_solver.get_adjacent_coordinates((0, 0)))
+
+    def test_maze_grid_raster(self):
+        llx, lly, urx, ury = maze_generator.load_generated_maze(5, 5, seed=3)
+        grid = maze_solver.get_maze_grid(llx, lly, urx, ury)
+        for x in range(llx, urx + 1):
+            for y in range(lly, ury + 1):
+                self.assertEqual(not obstacles.is_position_blocked(x, y),
+                                 grid.is_passable(x, y))
+
+    def test_maze_run(self):
+        obstacles.obstacles = [obstacles.Rectangle(-2, 2, 5, 1)]
+        self.assertEqual(['forward 1', 'left', 'forward 3', 'right',
+                          'forward 8'],
+                         maze_solver.maze_run(0, 0, 0, -10, -10, 10, 10,
+                                              'top'))
+
+    def test_array_astar(self):
+        llx, lly, urx, ury = maze_generator.load_generated_maze(
+            20, 20, seed=5, density=0.6)
+        grid = maze_solver.get_maze_grid(llx, lly, urx, ury)
+        maze_solver.maze_run(0, 0, 0, llx, lly, urx, ury, 'top')
+        for goal in maze_solver.goal_checks:
+            path = maze_solver.array_astar(grid, (0, 0), goal)
+            expected = maze_solver.solve_astar(grid, (0, 0), goal)
+            self.assertEqual(len(expected), len(path))
+            self.assertValidPath(grid, path, (0, 0), goal)
+
+    def test_distance_field(self):
+        llx, lly, urx, ury = maze_generator.load_generated_maze(
+            15, 10, seed=8, density=0.8)
+        grid = maze_solver.get_maze_grid(llx, lly, urx, ury)
+        maze_solver.maze_run(0, 0, 0, llx, lly, urx, ury, 'top')
+        field = maze_solver.get_distance_field(grid, 'bottom')
+        self.assertIs(field, maze_solver.get_distance_field(grid, 'bottom'))
+        self.assertEqual(0, field[grid.cell_id(0, lly + 1)])
+        self.assertEqual(-1, field[grid.cell_id(llx, lly + 2)])
+        for goal in maze_solver.goal_checks:
+            for start in [(0, 0), (llx + 1, ury - 1), (urx - 3, lly + 5)]:
+                path = maze_solver.walk_distance_field(grid, start, goal)
+                expected = maze_solver.solve_astar(grid, start, goal)
+                self.assertEqual(len(expected), len(path))
+                self.assertValidPath(grid, path, start, goal)
+
+    def test_jump_point_search(self):
+        obstacles.obstacles = [obstacles.Rectangle(-6, 3, 10, 4),
+                               obstacles.Rectangle(2, -8, 3, 9)]
+        grid = maze_solver.get_maze_grid(-10, -10, 10, 10)
+        maze_solver.maze_run(0, 0, 0, -10, -10, 10, 10, 'top')
+        for goal in maze_solver.goal_checks:
+            path = maze_solver.jump_point_search(grid, (0, 0), goal)
+            expected = maze_solver.array_astar(grid, (0, 0), goal)
+            self.assertEqual(len(expected), len(path))
+            self.assertValidPath(grid, path, (0, 0), goal)
+
+        llx, lly, urx, ury = maze_generator.load_generated_maze(
+            12, 12, seed=2, density=0.7)
+        grid = maze_solver.get_maze_grid(llx, lly, urx, ury)
+        for goal in maze_solver.goal_checks:
+            self.assertEqual(
+                len(maze_solver.array_astar(grid, (0, 0), goal)),
+                len(maze_solver.jump_point_search(grid, (0, 0), goal)))
+        self.assertIsNone(maze_solver.jump_point_search(grid, (urx + 1, 0),
+                                                        'top'))
+
+    def test_turn_aware_search(self):
+        self.assertEqual(['back 9'],
+                         maze_solver.maze_run(0, 0, 2, -10, -10, 10, 10,
+                                              'top', 'fewest_commands'))
+        llx, lly, urx, ury = maze_generator.load_generated_maze(
+            10, 10, seed=4, density=0.5)
+        for goal in maze_solver.goal_checks:
+            for direction in range(4):
+                commands = maze_solver.maze_run(0, 0, direction, llx, lly,
+                                                urx, ury, goal,
+                                                'fewest_commands')
+                expected = maze_solver.maze_run(0, 0, direction, llx, lly,
+                                                urx, ury, goal)
+                self.assertLessEqual(len(commands), len(expected))
+        grid = maze_solver.get_maze_grid(llx, lly, urx, ury)
+        path = maze_solver.turn_aware_search(grid, (0, 0), 'right',
+                                             direction=1)
+        self.assertValidPath(grid, path, (0, 0), 'right')
+
+    def test_bucket_queue(self):
+        queue = maze_solver.BucketQueue()
+        self.assertTrue(queue.empty)
+        for distance_from_start, distance_to_goal in [(2, 3), (0, 4), (1, 1),
+                                                      (3, 0)]:
+            queue.append(maze_solver.Node((distance_from_start, 0), None,
+                                          distance_from_start,
+                                          distance_to_goal))
+        self.assertEqual([2, 3, 4, 5],
+                         [sum((node.distance_from_start,
+                               node.distance_to_goal))
+                          for node in (queue.pop(), queue.pop(), queue.pop(),
+                                       queue.pop())])
+        self.assertTrue(queue.empty)
+
+        llx, lly, urx, ury = maze_generator.load_generated_maze(
+            12, 12, seed=6, density=0.8)
+        grid = maze_solver.set_maze_bounds(llx, lly, urx, ury)
+        for goal in maze_solver.goal_checks:
+            path = maze_solver.solve_bucket_astar(grid, (0, 0), goal)
+            self.assertEqual(
+                len(maze_solver.solve_astar(grid, (0, 0), goal)), len(path))
+            self.assertTrue(maze_solver.goal_checks[goal](path[-1]))
+
+    def test_solution_cache(self):
+        maze_solver.clear_solution_cache()
+        obstacles.obstacles = [obstacles.Rectangle(-2, 2, 5, 1)]
+        commands = maze_solver.maze_run(0, 0, 0, -10, -10, 10, 10, 'top')
+        commands.append('off')
+        self.assertEqual((0, 1),
+                         (maze_solver.cache_hits, maze_solver.cache_misses))
+        self.assertEqual(commands[:-1],
+                         maze_solver.maze_run(0, 0, 0, -10, -10, 10, 10,
+                                              'top'))
+        self.assertEqual((1, 1),
+                         (maze_solver.cache_hits, maze_solver.cache_misses))
+        maze_solver.maze_run(0, 0, 1, -10, -10, 10, 10, 'top')
+        self.assertEqual(2, maze_solver.cache_misses)
+
+        obstacles.obstacles = []
+        self.assertEqual(['forward 9'],
+                         maze_solver.maze_run(0, 0, 0, -10, -10, 10, 10,
+                                              'top'))
+        self.assertEqual(3, maze_solver.cache_misses)
+        self.assertEqual(1, len(maze_solver.solution_cache))
+
+        size = maze_solver.solution_cache_size
+        maze_solver.solution_cache_size = 2
+        try:
+            for x in range(4):
+                maze_solver.maze_run(x, 0, 0, -10, -10, 10, 10, 'top')
+            self.assertEqual(2, len(maze_solver.solution_cache))
+            maze_solver.maze_run(3, 0, 0, -10, -10, 10, 10, 'top')
+            self.assertEqual((3, 6), (maze_solver.cache_hits,
+                                      maze_solver.cache_misses))
+            maze_solver.maze_run(1, 0, 0, -10, -10, 10, 10, 'top')
+            self.assertEqual(7, maze_solver.cache_misses)
+        finally:
+            maze_solver.solution_cache_size = size
+
+    def test_solution_cache_follows_wall_edits(self):
+        maze_solver.clear_solution_cache()
+        walls = OccupancyRaster(-10, -10, 10, 10)
+        for x in range(-10, 11):
+            walls.block(x, 2)
+        walls.unblock(5, 2)
+        obstacles.obstacles = [walls]
+        self.assertEqual(['forward 1', 'right', 'forward 5', 'left',
+                          'forward 8'],
+                         maze_solver.maze_run(0, 0, 0, -10, -10, 10, 10,
+                                              'top'))
+        walls.unblock(0, 2)
+        self.assertFalse(obstacles.is_position_blocked(0, 2))
+        self.assertEqual(['forward 9'],
+                         maze_solver.maze_run(0, 0, 0, -10, -10, 10, 10,
+                                              'top'))
+
+        obstacles.obstacles[0] = obstacles.Rectangle(-10, 2, 21, 1)
+        self.assertTrue(obstacles.is_position_blocked(0, 2))
+        self.assertEqual([], maze_solver.maze_run(0, 0, 0, -10, -10, 10, 10,
+                                                  'top'))
+        obstacles.obstacles.remove(obstacles.obstacles[0])
+        obstacles.obstacles.append(obstacles.Rectangle(-10, 2, 5, 1))
+        self.assertEqual(['forward 9'],
+                         maze_solver.maze_run(0, 0, 0, -10, -10, 10, 10,
+                                              'top'))
+        obstacles.obstacles[0].llx = -2
+        self.assertTrue(obstacles.is_position_blocked(0, 2))
+        self.assertNotEqual(['forward 9'],
+                            maze_solver.maze_run(0, 0, 0, -10, -10, 10, 10,
+                                                 'top'))
+
+    def test_waypoints(self):
+        path = [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1), (2, 0),
+                (1, 0)]
+        waypoints = maze_solver.path_to_waypoints(path)
+        self.assertEqual([(0, 0), (0, 2), (2, 2), (2, 0), (1, 0)], waypoints)
+        self.assertEqual(path, maze_solver.expand_waypoints(waypoints))
+        expected = ['forward 2', 'right', 'forward 2', 'right', 'forward 2',
+                    'right', 'forward 1']
+        self.assertEqual(expected, list(
+            maze_solver.waypoints_to_robot_commands(waypoints, 0)))
+        self.assertEqual(['left'] + expected, list(
+            maze_solver.waypoints_to_robot_commands(waypoints, 1)))
+        self.assertEqual(['back 2', 'left'] + expected[2:], list(
+            maze_solver.waypoints_to_robot_commands(waypoints, 2)))
+        self.assertEqual(['right'] + expected, list(
+            maze_solver.waypoints_to_robot_commands(waypoints, 3)))
+        self.assertEqual(['back 2', 'forward 3'], list(
+            maze_solver.waypoints_to_robot_commands([(0, 0), (0, -1), (0, -2),
+                                                     (0, 1)], 0)))
+        self.assertEqual([(0, 0)], maze_solver.path_to_waypoints([(0, 0)]))
+
+        llx, lly, urx, ury = maze_generator.load_generated_maze(
+            12, 12, seed=9, density=0.7)
+        for goal in maze_solver.goal_checks:
+            waypoints, commands = maze_solver.maze_solution(
+                0, 0, 0, llx, lly, urx, ury, goal, 'jump_point')
+            self.assertEqual(waypoints, maze_solver.path_to_waypoints(
+                maze_solver.jump_point_search(
+                    maze_solver.get_maze_grid(llx, lly, urx, ury), (0, 0),
+                    goal)))
+            self.assertEqual(commands, maze_solver.maze_run(
+                0, 0, 0, llx, lly, urx, ury, goal, 'jump_point'))
+
+    def test_bidirectional_search(self):
+        llx, lly, urx, ury = maze_generator.load_generated_maze(
+            15, 15, seed=11, density=0.75)
+        grid = maze_solver.set_maze_bounds(llx, lly, urx, ury)
+        for goal in maze_solver.goal_checks:
+            stats = {}
+            path = maze_solver.bidirectional_search(grid, (0, 0), goal, stats)
+            astar_stats = {}
+            expected = maze_solver.solve_astar(grid, (0, 0), goal,
+                                               astar_stats)
+            self.assertEqual(len(expected), len(path))
+            self.assertValidPath(grid, path, (0, 0), goal)
+            self.assertGreater(stats['expanded'], 0)
+            self.assertGreater(astar_stats['expanded'], 0)
+        grid = self.set_boxed_in_maze()
+        self.assertIsNone(maze_solver.bidirectional_search(grid, (0, 0),
+                                                           'top'))
+
+    def test_incremental_search(self):
+        llx, lly, urx, ury = maze_generator.load_generated_maze(
+            15, 15, seed=12, density=0.75)
+        grid = maze_solver.set_maze_bounds(llx, lly, urx, ury)
+        planner = maze_solver.DStarLite(grid, 'bottom')
+        stats = {}
+        path = planner.plan((0, 0), stats)
+        self.assertEqual(
+            len(maze_solver.array_astar(grid, (0, 0), 'bottom')), len(path))
+        self.assertGreater(stats['expanded'], 0)
+
+        planner.plan(path[5], stats)
+        self.assertEqual(0, stats['expanded'])
+
+        changed = maze_solver.MazeGrid(llx, lly, urx, ury)
+        changed.passable[:] = grid.passable
+        x, y = path[8]
+        changed.block_row(y, x, x)
+        self.assertEqual(1, planner.update_grid(changed))
+        replanned = planner.plan(path[5], stats)
+        expected = maze_solver.array_astar(changed, path[5], 'bottom')
+        self.assertEqual(len(expected), len(replanned))
+        self.assertNotIn((x, y), replanned)
+        self.assertValidPath(changed, replanned, path[5], 'bottom')
+
+        maze_solver.incremental_planners.clear()
+        waypoints, _ = maze_solver.maze_solution(0, 0, 0, llx, lly, urx, ury,
+                                                 'left', 'incremental')
+        self.assertTrue(maze_solver.goal_checks['left'](waypoints[-1]))
+        self.assertIn('left', maze_solver.incremental_planners)
+
+    def test_incremental_search_blocked_start(self):
+        obstacles.obstacles = [obstacles.Rectangle(-1, 0, 3, 1), ((0, 1),)]
+        grid = maze_solver.set_maze_bounds(-3, -3, 3, 3)
+        planner = maze_solver.DStarLite(grid, 'top')
+        for start in [(0, 0), (-2, 2), (0, 1), (0, 0)]:
+            path = planner.plan(start)
+            expected = maze_solver.array_astar(grid, start, 'top')
+            self.assertEqual(len(expected), len(path))
+            self.assertValidPath(grid, path, start, 'top')
+        self.assertEqual([(0, 3)], planner.plan((0, 3)))
+
+    def test_hierarchical_search(self):
+        llx, lly, urx, ury = maze_generator.load_generated_maze(
+            30, 30, seed=13, density=0.75)
+        grid = maze_solver.set_maze_bounds(llx, lly, urx, ury)
+        for start in [(0, 0), (-25, 17), (12, 12), (25, -13)]:
+            for goal in maze_solver.goal_checks:
+                stats = {}
+                path = maze_solver.hierarchical_search(grid, start, goal,
+                                                       stats)
+                expected = maze_solver.array_astar(grid, start, goal)
+                self.assertEqual(len(expected), len(path))
+                self.assertValidPath(grid, path, start, goal)
+                self.assertGreater(stats['expanded'], 0)
+        graph = grid.cluster_graph
+        self.assertEqual(graph.columns * graph.rows, len(graph.costs))
+        for entrances, costs in zip(graph.entrances, graph.costs):
+            self.assertEqual(len(entrances) ** 2, len(costs))
+
+        grid = self.set_boxed_in_maze()
+        self.assertIsNone(maze_solver.hierarchical_search(grid, (0, 0),
+                                                          'top'))
+
+    def test_corridor_search(self):
+        llx, lly, urx, ury = maze_generator.load_generated_maze(
+            20, 20, seed=14, density=0.9)
+        grid = maze_solver.set_maze_bounds(llx, lly, urx, ury)
+        for goal in maze_solver.goal_checks:
+            stats = {}
+            path = maze_solver.corridor_search(grid, (0, 0), goal, stats)
+            astar_stats = {}
+            expected = maze_solver.array_astar(grid, (0, 0), goal,
+                                               astar_stats)
+            self.assertEqual(len(expected), len(path))
+            self.assertValidPath(grid, path, (0, 0), goal)
+            self.assertLess(stats['expanded'], astar_stats['expanded'])
+        graph = grid.corridor_graph
+        self.assertLess(len(graph.edges), sum(grid.passable))
+
+        grid = self.set_boxed_in_maze()
+        self.assertIsNone(maze_solver.corridor_search(grid, (0, 0), 'top'))
+
+    def test_solve_batch(self):
+        llx, lly, urx, ury = maze_generator.load_generated_maze(
+            10, 10, seed=15, density=0.8)
+        jobs = [(x, y, heading, goal)
+                for x, y in [(0, 0), (2, 0), (0, -4)]
+                for heading in range(4)
+                for goal in maze_solver.goal_checks]
+        expected = [maze_solver.maze_run(x, y, heading, llx, lly, urx, ury,
+                                         goal, 'distance_field')
+                    for x, y, heading, goal in jobs]
+        self.assertEqual(expected, batch_solver.solve_batch(
+            jobs, llx, lly, urx, ury, processes=2))
+        self.assertEqual(expected, batch_solver.solve_batch(
+            jobs, llx, lly, urx, ury, processes=1))
+        self.assertEqual([[]], batch_solver.solve_batch(
+            [(0, 0, 0, 'nowhere')], llx, lly, urx, ury))
+        with self.assertRaises(ValueError):
+            batch_solver.solve_batch(jobs, llx, lly, urx, ury, 'teleport')
+
+        grid = maze_solver.set_maze_bounds(llx, lly, urx, ury)
+        batch_solver.prepare_grid(grid, 'bidirectional', ['top'])
+        self.assertIsNotNone(grid.neighbour_cells)
+        batch_solver.prepare_grid(grid, 'hierarchical', ['top'])
+        graph = grid.cluster_graph
+        self.assertEqual(graph.columns * graph.rows, len(graph.costs))
+
+
+if __name__ == '__main__':
+    unittest.main()
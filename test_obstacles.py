@@ -10,15 +10,30 @@ class MyTestCase(unittest.TestCase):
     def test_create_obstacles(self):
         obstacles.random.randint = lambda a, b: 1
         obstacles.create_square_obstacle(-100, -200, 100, 200)
-        self.assertEqual([((1, 1), (1, 2), (1, 3), (1, 4), (1, 5),
-                           (2, 1), (3, 1), (4, 1), (5, 1),
-                           (2, 5), (3, 5), (4, 5),
-                           (5, 2), (5, 3), (5, 4), (5, 5))],
+        self.assertEqual([obstacles.Rectangle(1, 1, 5, 5)],
                          obstacles.obstacles)
+        self.assertEqual([(1, 1), (1, 2), (1, 3), (1, 4), (1, 5),
+                          (2, 1), (3, 1), (4, 1), (5, 1),
+                          (2, 5), (3, 5), (4, 5),
+                          (5, 2), (5, 3), (5, 4), (5, 5)],
+                         list(obstacles.obstacles[0]))
         obstacles.random.randint = lambda a, b: 0
         obstacles.create_square_obstacle(-100, -200, 100, 200)
         self.assertEqual([], obstacles.obstacles)
 
+    def test_create_many_obstacles_without_overlap(self):
+        obstacles.random.randint = obstacles.random.Random(4).randint
+        obstacles.create_square_obstacle(-500, -500, 500, 500, amount=2000,
+                                         attempts=50)
+        corners = [(obstacle.llx, obstacle.lly)
+                   for obstacle in obstacles.obstacles]
+        self.assertGreater(len(corners), 100)
+        for i, (x1, y1) in enumerate(corners):
+            self.assertFalse(
+                obstacles.check_coordinates_overlap_origin(x1, y1, 5))
+            for x2, y2 in corners[i + 1:]:
+                self.assertFalse(abs(x1 - x2) <= 4 and y2 - 5 <= y1 <= y2 + 4)
+
     def test_is_position_blocked(self):
         obstacles.random.randint = lambda a, b: 1
         obstacles.create_square_obstacle(-100, -200, 100, 200)
@@ -26,6 +41,41 @@ class MyTestCase(unittest.TestCase):
         self.assertFalse(obstacles.is_position_blocked(2, 4))
         self.assertFalse(obstacles.is_position_blocked(10, 20))
 
+    def test_obstacle_index_follows_obstacles(self):
+        obstacles.random.randint = lambda a, b: 1
+        obstacles.create_square_obstacle(-100, -200, 100, 200)
+        self.assertTrue(obstacles.is_position_blocked(1, 1))
+        obstacles.obstacles.append(((30, 30),))
+        self.assertTrue(obstacles.is_position_blocked(30, 30))
+        obstacles.random.randint = lambda a, b: 0
+        obstacles.create_square_obstacle(-100, -200, 100, 200)
+        self.assertFalse(obstacles.is_position_blocked(1, 1))
+        self.assertFalse(obstacles.is_position_blocked(30, 30))
+
+        obstacles.obstacles = [((30, 30),), ((40, 40),)]
+        self.assertTrue(obstacles.is_position_blocked(30, 30))
+        obstacles.obstacles[0] = ((31, 30),)
+        self.assertFalse(obstacles.is_position_blocked(30, 30))
+        self.assertTrue(obstacles.is_position_blocked(31, 30))
+        version = obstacles.get_index_version()
+        obstacles.obstacles.remove(((40, 40),))
+        obstacles.obstacles.append(((50, 50),))
+        self.assertFalse(obstacles.is_position_blocked(40, 40))
+        self.assertGreater(obstacles.get_index_version(), version)
+
+        rectangle = obstacles.Rectangle(10, 10, 5, 5)
+        obstacles.obstacles = [rectangle]
+        self.assertTrue(obstacles.is_position_blocked(10, 12))
+        version = obstacles.get_index_version()
+        self.assertEqual(version, obstacles.get_index_version())
+        rectangle.llx = 20
+        self.assertFalse(obstacles.is_position_blocked(10, 12))
+        self.assertTrue(obstacles.is_position_blocked(20, 12))
+        self.assertGreater(obstacles.get_index_version(), version)
+        with self.assertRaises(TypeError):
+            hash(rectangle)
+        obstacles.obstacles = []
+
     def test_is_path_blocked(self):
         obstacles.random.randint = lambda a, b: 1
         obstacles.create_square_obstacle(-100, -200, 100, 200)
@@ -37,6 +87,59 @@ class MyTestCase(unittest.TestCase):
         self.assertFalse(obstacles.is_path_blocked(0, -100, 0, 100))
         self.assertFalse(obstacles.is_path_blocked(185, 7, -14, 7))
 
+    def test_rectangle_queries(self):
+        obstacles.obstacles = [obstacles.Rectangle(-10, 20, 30, 4)]
+        self.assertTrue(obstacles.is_position_blocked(-10, 21))
+        self.assertTrue(obstacles.is_position_blocked(5, 23))
+        self.assertFalse(obstacles.is_position_blocked(5, 22))
+        self.assertFalse(obstacles.is_position_blocked(20, 21))
+        self.assertTrue(obstacles.is_path_blocked(0, 0, 0, 50))
+        self.assertTrue(obstacles.is_path_blocked(-50, 22, -10, 22))
+        self.assertFalse(obstacles.is_path_blocked(-9, 22, 18, 22))
+        self.assertTrue(obstacles.is_path_blocked(19, 23, 40, 23))
+        self.assertFalse(obstacles.is_path_blocked(0, 24, 0, 50))
+        self.assertEqual(64, len(list(obstacles.obstacles[0])))
+
+    def test_is_path_blocked_row_and_column_index(self):
+        obstacles.obstacles = [((-3, 10), (4, 10), (4, -6), (9, 10))]
+        self.assertTrue(obstacles.is_path_blocked(-10, 10, -3, 10))
+        self.assertTrue(obstacles.is_path_blocked(8, 10, 0, 10))
+        self.assertFalse(obstacles.is_path_blocked(-2, 10, 3, 10))
+        self.assertFalse(obstacles.is_path_blocked(10, 10, 50, 10))
+        self.assertTrue(obstacles.is_path_blocked(4, 10, 4, 10))
+        self.assertTrue(obstacles.is_path_blocked(4, -50, 4, -6))
+        self.assertFalse(obstacles.is_path_blocked(4, -5, 4, 9))
+        self.assertFalse(obstacles.is_path_blocked(5, -50, 5, 50))
+
+    def test_are_paths_blocked(self):
+        obstacles.obstacles = [obstacles.Rectangle(1, 1, 5, 5),
+                               ((-3, 10), (4, -6))]
+        segments = [(0, 3, 9, 3), (-10, 10, -3, 10), (0, 0, 0, 50),
+                    (4, -50, 4, -6), (2, 2, 4, 2), (6, -20, 6, 20)]
+        self.assertEqual([True, True, False, True, False, False],
+                         obstacles.are_paths_blocked(segments))
+        self.assertEqual([obstacles.is_path_blocked(*segment)
+                          for segment in segments],
+                         obstacles.are_paths_blocked(segments))
+
+    def test_occupancy_raster(self):
+        obstacles.obstacles = [((-3, 10), (4, 10), (4, -6), (9, 10))]
+        obstacles.use_occupancy_raster((-100, -200, 100, 200))
+        try:
+            self.assertIsNotNone(obstacles.raster)
+            self.assertEqual(4, obstacles.raster.count_blocked())
+            self.assertTrue(obstacles.is_position_blocked(4, -6))
+            self.assertFalse(obstacles.is_position_blocked(4, -5))
+            self.assertTrue(obstacles.is_path_blocked(-10, 10, -3, 10))
+            self.assertFalse(obstacles.is_path_blocked(-2, 10, 3, 10))
+            self.assertTrue(obstacles.is_path_blocked(4, -50, 4, -6))
+            self.assertFalse(obstacles.is_path_blocked(4, -5, 4, 9))
+            obstacles.obstacles.append(((500, 500),))
+            self.assertTrue(obstacles.is_position_blocked(500, 500))
+            self.assertIsNone(obstacles.raster)
+        finally:
+            obstacles.use_occupancy_raster(None)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
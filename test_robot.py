@@ -7,9 +7,14 @@ from unittest.mock import patch
 from io import StringIO
 from test_base import captured_output
 from maze import obstacles
+from world.text import world as text_world
 
 
 class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        obstacles.obstacles = []
+        obstacles.use_occupancy_raster(None)
+
     @patch('sys.stdin', StringIO('help\nofF\nfOrWarD 10'))
     def test_get_command(self):
         with captured_output():
@@ -188,6 +193,32 @@ TestBot: What must I do next?  > TestBot moved back by 10 steps.
  > TestBot now at position (-10,0).
 TestBot: What must I do next? TestBot: Shutting down..""", output)
 
+    @patch('sys.stdin', StringIO('TestBot\nforward 3\nright\nsprint 2\n'
+                                 'left\nsprint 2\noff\n'))
+    def test_sprint_obstacles(self):
+        with captured_output() as (out, err), \
+                patch.object(obstacles.random, 'randint', lambda a, b: 1):
+            robot.robot_start()
+        output = out.getvalue().strip()
+        self.assertEqual("""What do you want to name your robot? \
+TestBot: Hello kiddo!
+TestBot: Loaded obstacles.
+There are some obstacles:
+- At position 1,1 (to 5,5)
+TestBot: What must I do next?  > TestBot moved forward by 3 steps.
+ > TestBot now at position (0,3).
+TestBot: What must I do next?  > TestBot turned right.
+ > TestBot now at position (0,3).
+TestBot: What must I do next? TestBot: Sorry, there is an obstacle in the way.
+TestBot: Sorry, there is an obstacle in the way.
+ > TestBot now at position (0,3).
+TestBot: What must I do next?  > TestBot turned left.
+ > TestBot now at position (0,3).
+TestBot: What must I do next?  > TestBot moved forward by 2 steps.
+ > TestBot moved forward by 1 steps.
+ > TestBot now at position (0,6).
+TestBot: What must I do next? TestBot: Shutting down..""", output)
+
     @patch('sys.stdin', StringIO('TestBot\nmazerun\noff\n'))
     def test_maze_run(self):
         with captured_output() as (out, err):
@@ -220,6 +251,19 @@ TestBot: I am at the right edge.
  > TestBot now at position (99,0).
 TestBot: What must I do next? TestBot: Shutting down..""", output)
 
+    def test_maze_run_unreachable(self):
+        obstacles.obstacles = [((1, 0), (-1, 0), (0, 1), (0, -1))]
+        robot.world = text_world
+        robot.world.position_x = 0
+        robot.world.position_y = 0
+        with captured_output() as (out, err):
+            result = robot.do_maze_run('TestBot', 'top')
+        self.assertEqual(
+            (True, 'TestBot: Sorry, I cannot reach the top edge.'), result)
+        self.assertEqual((0, 0),
+                         (robot.world.position_x, robot.world.position_y))
+        obstacles.obstacles = []
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,6 +3,9 @@ UnitTest for Text World.
 """
 import unittest
 
+from maze import obstacles
+from maze.raster import OccupancyRaster
+from maze.rectangle import Rectangle
 from test_base import captured_output
 from world.text import world
 
@@ -45,6 +48,30 @@ class MyTestCase(unittest.TestCase):
         self.assertFalse(return_value)
         self.assertEqual((20, -26), (world.position_x, world.position_y))
 
+    def test_print_simple_maze_obstacles(self):
+        perimeters = [position for x, y in [(30, -40), (3, 8), (-20, 8)]
+                      for position in Rectangle(x, y, 5, 5)]
+        expected = 'There are some obstacles:\n' \
+                   '- At position 30,-40 (to 34,-36)\n' \
+                   '- At position -20,8 (to -16,12)\n' \
+                   '- At position 3,8 (to 7,12)'
+        for obstacle in [tuple(perimeters), OccupancyRaster.from_positions(
+                perimeters, -100, -200, 100, 200)]:
+            obstacles.obstacles = [obstacle]
+            with captured_output() as (out, err):
+                world.print_simple_maze_obstacles()
+            self.assertEqual(expected, out.getvalue().strip())
+        obstacles.obstacles = []
+
+    def test_generate_maze(self):
+        world.generate_maze('simple_maze')
+        self.assertEqual(1, len(obstacles.obstacles))
+        self.assertIsInstance(obstacles.obstacles[0], OccupancyRaster)
+        self.assertIs(obstacles.obstacles[0], obstacles.raster)
+        self.assertTrue(obstacles.is_position_blocked(30, -40))
+        obstacles.obstacles = []
+        obstacles.use_occupancy_raster(None)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,6 @@
-from maze import obstacles
+from typing import Optional
+
+from maze import maze_loader, obstacles
 
 # variables tracking position and direction
 position_x = 0
@@ -15,6 +17,15 @@ def show_position(robot_name):
     print(' > '+robot_name+' now at position ('+str(position_x)+','+str(position_y)+').')
 
 
+def show_path(waypoints: list[tuple[int, int]]) -> None:
+    """
+    The text world does not draw the path of a maze run, the robot reports
+    every move instead
+    :param list[tuple[int, int]] waypoints: Waypoints of the path
+    :return: None
+    """
+
+
 def is_position_allowed(new_x, new_y):
     """
     Checks if the new position will still fall within the max area limit
@@ -75,8 +86,8 @@ def check_object(steps):
     elif directions[current_direction_index] == 'left':
         new_x = new_x - steps
 
-    return any([obstacles.is_path_blocked(position_x, position_y, new_x, new_y),
-                obstacles.is_position_blocked(new_x, new_y)])
+    return obstacles.is_path_blocked(position_x, position_y, new_x, new_y) \
+        or obstacles.is_position_blocked(new_x, new_y)
 
 
 def generate_obstacles() -> None:
@@ -99,6 +110,18 @@ def get_obstacle_coordinates() -> list[tuple[int, int]]:
     return obstacle_coordinates
 
 
+def generate_maze(maze_name: str) -> None:
+    """
+    Streams the obstacles of the named maze straight into an occupancy
+    raster covering the world, which also serves as the occupancy index
+    :param str maze_name: Name of the maze
+    :return: None
+    """
+    obstacles.use_occupancy_raster((min_x, min_y, max_x, max_y))
+    maze_loader.load_maze(maze_name, maze_loader.raster_store(
+        min_x, min_y, max_x, max_y))
+
+
 def print_square_obstacles() -> None:
     """
     Prints out the position of the square obstacles
@@ -106,10 +129,28 @@ def print_square_obstacles() -> None:
     """
     print('There are some obstacles:')
     for obstacle in obstacles.obstacles:
-        min_position = obstacle[0]
-        max_position = obstacle[-1]
-        print(f'- At position {min_position[0]},{min_position[1]}'
-              f' (to {max_position[0]},{max_position[1]})')
+        print(f'- At position {obstacle.llx},{obstacle.lly}'
+              f' (to {obstacle.urx},{obstacle.ury})')
+
+
+def get_square_obstacles(size: int = 5) -> list[tuple[int, int]]:
+    """
+    Finds the square obstacles of a maze by their fully blocked perimeters,
+    so the squares do not depend on the order the maze stores its positions
+    in
+    :param int size: Size of the square obstacles
+    :return: Lower left x and y coordinate of every square, row by row from
+    the bottom
+    """
+    blocked = set(get_obstacle_coordinates())
+    squares = []
+    for x, y in sorted(blocked, key=lambda position: (position[1],
+                                                      position[0])):
+        if all((x + i, y) in blocked and (x + i, y + size - 1) in blocked
+               and (x, y + i) in blocked and (x + size - 1, y + i) in blocked
+               for i in range(size)):
+            squares.append((x, y))
+    return squares
 
 
 def print_simple_maze_obstacles() -> None:
@@ -118,21 +159,20 @@ def print_simple_maze_obstacles() -> None:
     :return: None
     """
     print('There are some obstacles:')
-    obstacle_coordinates: list[tuple[int, int]] = get_obstacle_coordinates()
-    for i in range(0, len(obstacle_coordinates), 16):
-        min_position = obstacle_coordinates[i]
-        max_position = obstacle_coordinates[i + 15]
-        print(f'- At position {min_position[0]},{min_position[1]}'
-              f' (to {max_position[0]},{max_position[1]})')
+    for x, y in get_square_obstacles():
+        print(f'- At position {x},{y} (to {x + 4},{y + 4})')
 
 
 def print_maze_obstacles() -> None:
     """
-    Prints out the position of the obstacles in the maze
+    Prints out the position of the obstacles in the maze, row by row from the
+    bottom
     :return: None
     """
     print('There are some obstacles:')
-    obstacle_coordinates: list[tuple[int, int]] = get_obstacle_coordinates()
+    obstacle_coordinates: list[tuple[int, int]] = sorted(
+        get_obstacle_coordinates(),
+        key=lambda position: (position[1], position[0]))
     for obstacle_position in obstacle_coordinates:
         print(f'- At position ({obstacle_position[0]},{obstacle_position[1]})')
 
@@ -149,52 +189,29 @@ def setup_text_world(robot_name: str) -> None:
         print_square_obstacles()
 
 
-def setup_text_simple_maze(robot_name: str) -> None:
+def setup_text_maze(robot_name: str, maze_name: str) -> None:
     """
-    Creates the simple maze text world for the robot
+    Creates the text world of the named maze for the robot
     :param str robot_name: Name of the robot
+    :param str maze_name: Name of the maze
     :return: None
     """
-    import maze.simple_maze as imported_maze
-    print(f'{robot_name}: Loaded simple_maze.')
-    imported_maze.generate_maze()
-    print_simple_maze_obstacles()
-
-
-def setup_text_easy_maze(robot_name: str) -> None:
-    """
-    Creates the easy maze text world for the robot
-    :param str robot_name: Name of the robot
-    :return: None
-    """
-    import maze.easy_maze as imported_maze
-    print(f'{robot_name}: Loaded easy_maze.')
-    imported_maze.generate_maze()
-    print_maze_obstacles()
-
-
-def setup_text_medium_maze(robot_name: str) -> None:
-    """
-    Creates the medium maze text world for the robot
-    :param str robot_name: Name of the robot
-    :return: None
-    """
-    import maze.medium_maze as imported_maze
-    print(f'{robot_name}: Loaded medium_maze.')
-    imported_maze.generate_maze()
-    print_maze_obstacles()
+    print(f'{robot_name}: Loaded {maze_name}.')
+    generate_maze(maze_name)
+    if maze_name == 'simple_maze':
+        print_simple_maze_obstacles()
+    else:
+        print_maze_obstacles()
 
 
-def setup_text_extreme_maze(robot_name: str) -> None:
+def get_maze_name(argument: str) -> Optional[str]:
     """
-    Creates the extreme maze text world for the robot
-    :param str robot_name: Name of the robot
-    :return: None
+    Returns the name of the maze the commandline argument refers to
+    :param str argument: Commandline argument, such as EASY_MAZE
+    :return: Name of the maze, or None if there is no such maze
     """
-    import maze.extreme_maze as imported_maze
-    print(f'{robot_name}: Loaded extreme_maze.')
-    imported_maze.generate_maze()
-    print_maze_obstacles()
+    maze_name = argument.lower()
+    return maze_name if maze_name in maze_loader.discover_mazes() else None
 
 
 def setup_world(commandline_argument: list[str], robot_name: str) -> None:
@@ -205,26 +222,13 @@ def setup_world(commandline_argument: list[str], robot_name: str) -> None:
     :return: None
     """
     if len(commandline_argument) == 2:
-        if commandline_argument[0] == 'TEXT':
-            if commandline_argument[1] == 'SIMPLE_MAZE':
-                setup_text_simple_maze(robot_name)
-            elif commandline_argument[1] == 'EASY_MAZE':
-                setup_text_easy_maze(robot_name)
-            elif commandline_argument[1] == 'MEDIUM_MAZE':
-                setup_text_medium_maze(robot_name)
-            elif commandline_argument[1] == 'EXTREME_MAZE':
-                setup_text_extreme_maze(robot_name)
+        maze_name = get_maze_name(commandline_argument[1])
+        if commandline_argument[0] == 'TEXT' and maze_name is not None:
+            setup_text_maze(robot_name, maze_name)
     elif len(commandline_argument) == 1:
-        if commandline_argument[0] == 'SIMPLE_MAZE':
-            setup_text_simple_maze(robot_name)
-        elif commandline_argument[0] == 'EASY_MAZE':
-            setup_text_easy_maze(robot_name)
-        elif commandline_argument[0] == 'MEDIUM_MAZE':
-            setup_text_medium_maze(robot_name)
-        elif commandline_argument[0] == 'EXTREME_MAZE':
-            setup_text_extreme_maze(robot_name)
-        elif commandline_argument[0] == 'TEXT':
-            setup_text_world(robot_name)
+        maze_name = get_maze_name(commandline_argument[0])
+        if maze_name is not None:
+            setup_text_maze(robot_name, maze_name)
         else:
             setup_text_world(robot_name)
     else:
@@ -1,4 +1,6 @@
-from maze import obstacles
+from typing import Optional
+
+from maze import maze_loader, obstacles
 import turtle
 
 # variables tracking position and direction
@@ -32,6 +34,25 @@ def show_position(robot_name) -> None:
     robot.goto(position_x, position_y)
 
 
+def show_path(waypoints: list[tuple[int, int]]) -> None:
+    """
+    Draws the path of a maze run as straight lines between its waypoints
+    :param list[tuple[int, int]] waypoints: Waypoints of the path
+    :return: None
+    """
+    if not waypoints:
+        return
+    pen = turtle.Turtle()
+    pen.hideturtle()
+    pen.speed('fastest')
+    pen.color('LightGreen')
+    pen.penup()
+    pen.goto(*waypoints[0])
+    pen.pendown()
+    for waypoint in waypoints[1:]:
+        pen.goto(*waypoint)
+
+
 def is_position_allowed(new_x, new_y):
     """
     Checks if the new position will still fall within the max area limit
@@ -91,8 +112,8 @@ def check_object(steps):
     elif directions[current_direction_index] == 'left':
         new_x = new_x - steps
 
-    return any([obstacles.is_path_blocked(position_x, position_y, new_x, new_y),
-                obstacles.is_position_blocked(new_x, new_y)])
+    return obstacles.is_path_blocked(position_x, position_y, new_x, new_y) \
+        or obstacles.is_position_blocked(new_x, new_y)
 
 
 def create_turtle_screen() -> None:
@@ -149,13 +170,15 @@ def create_random_obstacles() -> None:
     draw_obstacles()
 
 
-def create_maze(imported_maze) -> None:
+def create_maze(maze_name: str) -> None:
     """
-    Creates a maze based on the imported maze
-    :param imported_maze: Maze module
+    Creates a maze based on the maze name
+    :param str maze_name: Name of the maze
     :return: None
     """
-    imported_maze.generate_maze()
+    obstacles.use_occupancy_raster((min_x, min_y, max_x, max_y))
+    maze_loader.load_maze(maze_name, maze_loader.raster_store(
+        min_x, min_y, max_x, max_y))
     draw_obstacles()
 
 
@@ -187,64 +210,29 @@ def setup_turtle_world(robot_name: str) -> None:
     turtle.Screen().tracer(1)
 
 
-def setup_turtle_simple_maze(robot_name: str) -> None:
+def setup_turtle_maze(robot_name: str, maze_name: str) -> None:
     """
-    Creates the simple_maze turtle world for the robot
+    Creates the turtle world of the named maze for the robot
     :param str robot_name: Name of the robot
+    :param str maze_name: Name of the maze
     :return: None
     """
-    import maze.simple_maze as imported_maze
-    print(f'{robot_name}: Loaded simple_maze.')
+    print(f'{robot_name}: Loaded {maze_name}.')
     turtle.Screen().tracer(0)
     create_robot_world()
-    create_maze(imported_maze)
+    create_maze(maze_name)
     create_robot()
     turtle.Screen().tracer(1)
 
 
-def setup_turtle_easy_maze(robot_name: str) -> None:
+def get_maze_name(argument: str) -> Optional[str]:
     """
-    Creates the easy_maze turtle world for the robot
-    :param str robot_name: Name of the robot
-    :return: None
+    Returns the name of the maze the commandline argument refers to
+    :param str argument: Commandline argument, such as EASY_MAZE
+    :return: Name of the maze, or None if there is no such maze
     """
-    import maze.easy_maze as imported_maze
-    print(f'{robot_name}: Loaded easy_maze.')
-    turtle.Screen().tracer(0)
-    create_robot_world()
-    create_maze(imported_maze)
-    create_robot()
-    turtle.Screen().tracer(1)
-
-
-def setup_turtle_medium_maze(robot_name: str) -> None:
-    """
-    Creates the medium_maze turtle world for the robot
-    :param str robot_name: Name of the robot
-    :return: None
-    """
-    import maze.medium_maze as imported_maze
-    print(f'{robot_name}: Loaded medium_maze.')
-    turtle.Screen().tracer(0)
-    create_robot_world()
-    create_maze(imported_maze)
-    create_robot()
-    turtle.Screen().tracer(1)
-
-
-def setup_turtle_extreme_maze(robot_name: str) -> None:
-    """
-    Creates the extreme_maze turtle world for the robot
-    :param str robot_name: Name of the robot
-    :return: None
-    """
-    import maze.extreme_maze as imported_maze
-    print(f'{robot_name}: Loaded extreme_maze.')
-    turtle.Screen().tracer(0)
-    create_robot_world()
-    create_maze(imported_maze)
-    create_robot()
-    turtle.Screen().tracer(1)
+    maze_name = argument.lower()
+    return maze_name if maze_name in maze_loader.discover_mazes() else None
 
 
 def setup_world(commandline_argument: list[str], robot_name: str) -> None:
@@ -254,20 +242,10 @@ def setup_world(commandline_argument: list[str], robot_name: str) -> None:
     :param str robot_name: Name of the robot
     :return: None
     """
-    if len(commandline_argument) == 2 and commandline_argument[1] == \
-            'SIMPLE_MAZE':
-        setup_turtle_simple_maze(robot_name)
-    elif len(commandline_argument) == 2 and commandline_argument[1] == \
-            'EASY_MAZE':
-        setup_turtle_easy_maze(robot_name)
-    elif len(commandline_argument) == 2 and commandline_argument[1] == \
-            'MEDIUM_MAZE':
-        setup_turtle_medium_maze(robot_name)
-    elif len(commandline_argument) == 2 and commandline_argument[1] == \
-            'EXTREME_MAZE':
-        setup_turtle_extreme_maze(robot_name)
+    maze_name = None
+    if len(commandline_argument) == 2:
+        maze_name = get_maze_name(commandline_argument[1])
+    if maze_name is not None:
+        setup_turtle_maze(robot_name, maze_name)
     else:
         setup_turtle_world(robot_name)
-
-
-